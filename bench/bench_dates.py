@@ -0,0 +1,78 @@
+"""Micro-benchmark: conversão de datas do Jira linha a linha vs vetorizada.
+
+Uso (na raiz do projeto):
+    python -m bench.bench_dates --rows 100000
+"""
+import argparse
+import random
+import time
+
+import pandas as pd
+
+from twobetter.dates import parse_jira_dates
+
+# Implementação anterior do load_data, mantida aqui apenas como referência
+meses_pt_en = {
+    'jan': 'Jan', 'fev': 'Feb', 'mar': 'Mar', 'abr': 'Apr',
+    'mai': 'May', 'jun': 'Jun', 'jul': 'Jul', 'ago': 'Aug',
+    'set': 'Sep', 'out': 'Oct', 'nov': 'Nov', 'dez': 'Dec'
+}
+
+
+def convert_date_pt(date_str):
+    if pd.isna(date_str) or date_str == '':
+        return pd.NaT
+    try:
+        date_str = str(date_str)
+        for pt, en in meses_pt_en.items():
+            date_str = date_str.replace(f'/{pt}/', f'/{en}/')
+        return pd.to_datetime(date_str, format='%d/%b/%y %I:%M %p')
+    except:
+        return pd.NaT
+
+
+def gerar_datas(rows, seed=42):
+    rng = random.Random(seed)
+    meses = list(meses_pt_en)
+    valores = []
+    for _ in range(rows):
+        if rng.random() < 0.02:
+            valores.append(None)
+            continue
+        hora = rng.randint(1, 12)
+        valores.append(
+            f"{rng.randint(1, 28):02d}/{rng.choice(meses)}/{rng.choice(['24', '25', '26'])} "
+            f"{hora}:{rng.randint(0, 59):02d} {rng.choice(['AM', 'PM'])}"
+        )
+    return pd.Series(valores, dtype=object)
+
+
+def cronometrar(func, repeticoes):
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = func()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor, resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    valores = gerar_datas(args.rows)
+
+    t_antigo, antigo = cronometrar(lambda: valores.apply(convert_date_pt), 1)
+    t_novo, (novo, invalidas) = cronometrar(lambda: parse_jira_dates(valores), args.repeat)
+
+    iguais = pd.to_datetime(antigo).astype('datetime64[ns]').equals(novo)
+    print(f"linhas:          {args.rows:,}")
+    print(f"convert_date_pt: {t_antigo:.3f}s")
+    print(f"parse_jira_dates: {t_novo:.3f}s  ({t_antigo / t_novo:.0f}x)")
+    print(f"resultados iguais: {iguais} | inválidas: {len(invalidas)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""Benchmark: memória do frame do Jira antes e depois do esquema compacto.
+
+Compara o frame no formato anterior (todas as colunas, texto como objetos
+Python) com o de ``read_jira_csv`` (``twobetter.schema``): memória por
+coluna, bytes da cópia serializada que o ``st.cache_data`` guarda por
+sessão e o tempo para copiá-la.
+
+Uso (na raiz do projeto):
+    python -m bench.bench_memory --rows 1000000
+"""
+import argparse
+import pickle
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from bench import synthetic
+from twobetter import schema
+from twobetter.areas import classify_areas, extract_tags
+from twobetter.dates import parse_jira_dates
+from twobetter.jira import DATE_COLUMNS, JIRA_COLUMNS, read_jira_csv
+
+
+# Formato anterior do load_data, mantido aqui apenas como referência
+def frame_legado(csv_path):
+    df = pd.read_csv(csv_path, encoding='utf-8-sig')
+    df.columns = JIRA_COLUMNS
+    df = df.astype({coluna: object for coluna in JIRA_COLUMNS if coluna not in ('ID', *DATE_COLUMNS)})
+    for coluna in DATE_COLUMNS:
+        df[coluna], _ = parse_jira_dates(df[coluna])
+    df['Area'] = classify_areas(df['Resumo']).astype(object)
+    df = df.join(extract_tags(df['Resumo']))
+    df['Responsavel'] = df['Responsavel'].fillna('Não atribuído')
+    return df
+
+
+def copia_por_sessao(df):
+    """Bytes e tempo de serializar + desserializar (o que o cache faz por sessão)."""
+    inicio = time.perf_counter()
+    dados = pickle.dumps(df, protocol=pickle.HIGHEST_PROTOCOL)
+    pickle.loads(dados)
+    return len(dados), time.perf_counter() - inicio
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = synthetic.write_jira_csv(Path(tmp) / "jira.csv", args.rows)
+        antes = frame_legado(csv_path)
+        depois = read_jira_csv(csv_path)
+
+    with pd.option_context('display.width', 120, 'display.max_columns', None):
+        print(f"linhas: {args.rows:,}\n")
+        print(schema.memory_report(antes, depois).to_string())
+
+    bytes_antes, t_antes = copia_por_sessao(antes)
+    bytes_depois, t_depois = copia_por_sessao(depois)
+    print(f"\ncópia por sessão (pickle): {bytes_antes / 2**20:.1f} MB em {t_antes:.2f}s -> "
+          f"{bytes_depois / 2**20:.1f} MB em {t_depois:.2f}s ({bytes_antes / bytes_depois:.1f}x menor)")
+
+
+if __name__ == '__main__':
+    main()
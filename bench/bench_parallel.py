@@ -0,0 +1,66 @@
+"""Benchmark: leitura do CSV do Jira em um processo vs pool de processos.
+
+Mede ``read_jira_csv`` (sequencial) e ``read_jira_csv_parallel`` com vários
+números de processos sobre o mesmo CSV sintético, e confere que o resultado
+é idêntico. Também mede a leitura de vários arquivos de uma vez (modo
+incremental), um por processo.
+
+Uso (na raiz do projeto):
+    python -m bench.bench_parallel                     # 1M linhas, 1/2/4/8 processos
+    python -m bench.bench_parallel --rows 200000 --workers 2 4
+"""
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from bench import synthetic
+from twobetter import parallel
+from twobetter.jira import read_jira_csv
+
+
+def cronometrar(func):
+    inicio = time.perf_counter()
+    resultado = func()
+    return time.perf_counter() - inicio, resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--workers', type=int, nargs='+', default=[2, 4, 8])
+    parser.add_argument('--files', type=int, default=4, help="arquivos no teste de vários CSVs")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        csv_path = synthetic.write_jira_csv(tmp / "jira.csv", args.rows)
+        print(f"linhas: {args.rows:,} ({csv_path.stat().st_size / 2**20:.1f} MB) | "
+              f"núcleos disponíveis: {parallel.worker_count()} de {os.cpu_count()}")
+
+        t_seq, esperado = cronometrar(lambda: read_jira_csv(csv_path))
+        print(f"\num CSV\n  sequencial    {t_seq:8.3f}s")
+        for workers in args.workers:
+            t_par, obtido = cronometrar(
+                lambda: parallel.read_jira_csv_parallel(csv_path, workers, min_bytes=0)
+            )
+            pd.testing.assert_frame_equal(esperado, obtido)
+            print(f"  {workers:>2} processos  {t_par:8.3f}s  ({t_seq / t_par:.2f}x)")
+        del esperado, obtido
+
+        # Vários CSVs (ex: um ano de exportações de vários projetos)
+        por_arquivo = args.rows // args.files
+        arquivos = [synthetic.write_jira_csv(tmp / f"jira_{i}.csv", por_arquivo, seed=i)
+                    for i in range(args.files)]
+        t_seq, _ = cronometrar(lambda: [read_jira_csv(f) for f in arquivos])
+        print(f"\n{args.files} CSVs de {por_arquivo:,} linhas\n  sequencial    {t_seq:8.3f}s")
+        for workers in args.workers:
+            t_par, _ = cronometrar(lambda: parallel.read_jira_csvs(arquivos, workers))
+            print(f"  {workers:>2} processos  {t_par:8.3f}s  ({t_seq / t_par:.2f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+"""Benchmark: filtros e agregações do Dashboard em pandas vs banco SQL embutido.
+
+Constrói o banco de ``twobetter.sqlstore`` (DuckDB, se instalado; senão
+SQLite) a partir de um CSV sintético e mede, para várias combinações de
+filtros, os KPIs/desempenho por dev (``stats``) e a timeline semanal nos dois
+backends, conferindo que os resultados batem. Também mostra o tamanho do
+frame em memória e o do arquivo do banco.
+
+Uso (na raiz do projeto):
+    python -m bench.bench_sql                  # 1M linhas
+    python -m bench.bench_sql --rows 100000 --repeat 10
+"""
+import argparse
+import tempfile
+import time
+from datetime import timedelta
+from pathlib import Path
+from unittest import mock
+
+import pandas as pd
+
+from bench import synthetic
+from twobetter import data
+from twobetter import sqlstore
+from twobetter.jira import read_jira_csv
+
+
+def cronometrar(func, repeticoes=1):
+    """Menor tempo entre as repetições (e o último resultado)."""
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = func()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor, resultado
+
+
+def combinacoes(index):
+    inicio, fim = index.date_bounds()
+    meio = inicio + (fim - inicio) / 2
+    responsavel = index.options('Responsavel')[0]
+    return {
+        'sem filtro': data.jira_filters(),
+        'status': data.jira_filters(status='Concluído'),
+        'responsável': data.jira_filters(responsavel=responsavel),
+        'período (metade)': data.jira_filters((meio.date(), fim.date())),
+        'período + 3 filtros': data.jira_filters((meio.date(), fim.date()), responsavel,
+                                                 'Em andamento', index.options('Tipo')[0]),
+    }
+
+
+def conferir(esperado, obtido):
+    for campo in ('total', 'concluidas', 'em_andamento', 'pendentes', 'devs_ativos'):
+        assert getattr(esperado, campo) == getattr(obtido, campo), campo
+    pd.testing.assert_frame_equal(esperado.dev_stats, obtido.dev_stats, check_dtype=False, check_index_type=False)
+    pd.testing.assert_frame_equal(esperado.recent_summary, obtido.recent_summary, check_dtype=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=5, help="repetições de cada consulta (vale a menor)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        csv_path = synthetic.write_jira_csv(tmp / "jira.csv", args.rows)
+        df = read_jira_csv(csv_path)
+        key = ('bench_sql', args.rows)
+
+        # Banco na pasta temporária, para não misturar com o cache do app
+        with mock.patch.object(sqlstore, 'SQL_DIR', tmp / "sql"):
+            pandas_ds = data.Dataset(df, key, backend='pandas')
+            sql_ds = data.Dataset(df, key, backend='sql')
+
+            t_pandas, _ = cronometrar(lambda: (pandas_ds.index, pandas_ds.aggregator, pandas_ds.cube))
+            t_sql, store = cronometrar(lambda: sql_ds.sql)
+            if store is None:
+                raise SystemExit("Não foi possível criar o banco SQL")
+
+            print(f"linhas: {args.rows:,} | motor SQL: {store.engine}")
+            print(f"frame em memória: {df.memory_usage(deep=True).sum() / 2**20:.1f} MB | "
+                  f"arquivo do banco: {store.path.stat().st_size / 2**20:.1f} MB")
+            print(f"\npreparação        pandas {t_pandas:8.3f}s   sql {t_sql:8.3f}s")
+
+            recent_date = pandas_ds.index.date_bounds()[1] - timedelta(days=7)
+            print(f"\n{'filtros':<22}{'pandas':>10}{'sql':>10}   (stats + timeline semanal)")
+            for nome, filtros in combinacoes(pandas_ds.index).items():
+                def consultar(dataset):
+                    return dataset.stats(filtros, recent_date), dataset.timeline(filtros, 'Semana')
+
+                t_p, (esperado, _) = cronometrar(lambda: consultar(pandas_ds), args.repeat)
+                t_s, (obtido, _) = cronometrar(lambda: consultar(sql_ds), args.repeat)
+                conferir(esperado, obtido)
+                print(f"  {nome:<20}{t_p * 1000:>8.1f}ms{t_s * 1000:>8.1f}ms")
+
+            store.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+"""Benchmark: tempo de partida do app e custo de importação de cada página.
+
+Mede, em processos novos (nada importado nem em cache):
+
+- o tempo de importação dos módulos do app (``python -X importtime``), com
+  os pacotes que mais pesam em cada um;
+- o primeiro rerun de cada página pelo ``AppTest`` do Streamlit, o que
+  inclui importar a página, ler os dados de ``data/`` e ``okr/`` e desenhar;
+- quais páginas ficaram importadas: abrir uma não pode carregar a outra, e a
+  de OKRs não pode carregar a camada do Jira (``JIRA_MODULOS``).
+
+O observador só aquece os dados depois da medição (``SETTLE_SECONDS`` alto):
+o que conta é o que a própria página importa e carrega.
+
+Uso (na raiz do projeto):
+    python -m bench.bench_startup
+    python -m bench.bench_startup --repeat 3 --top 15
+"""
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+
+MODULOS = ['streamlit', 'pandas', 'plotly.express', 'views.common', 'views.dashboard', 'views.okrs']
+
+# Módulos só do Dashboard: a página de OKRs não pode importá-los
+JIRA_MODULOS = ('twobetter.kpis', 'twobetter.cube', 'twobetter.table', 'twobetter.flow', 'twobetter.sqlstore')
+
+# Roda dentro do subprocesso: primeiro rerun da página e módulos carregados
+PRIMEIRO_RERUN = '''
+import json, sys, time
+from streamlit.testing.v1 import AppTest
+from twobetter import watcher
+watcher.SETTLE_SECONDS = 3600
+at = AppTest.from_file("app.py", default_timeout=600)
+at.session_state["pagina"] = sys.argv[1]
+inicio = time.perf_counter()
+at.run()
+print(json.dumps({
+    "segundos": time.perf_counter() - inicio,
+    "erros": [str(e.value) for e in at.exception],
+    "modulos": sorted(m for m in ("views.dashboard", "views.okrs", "views.diagnostics", "plotly")
+                      if m in sys.modules),
+    "jira": sorted(m for m in sys.argv[2:] if m in sys.modules),
+}))
+'''
+
+
+def importtime(modulo):
+    """(cumulativo do módulo, [(self, pacote)]) em microssegundos, num processo novo."""
+    resultado = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {modulo}'],
+                               cwd=RAIZ, capture_output=True, text=True, check=True)
+    total, entradas = 0, []
+    for linha in resultado.stderr.splitlines():
+        if not linha.startswith('import time:') or 'self [us]' in linha:
+            continue
+        proprio, cumulativo, nome = linha[len('import time:'):].split('|')
+        nome = nome.strip()
+        entradas.append((int(proprio), nome))
+        if nome == modulo:
+            total = int(cumulativo)
+    return total, entradas
+
+
+def pacotes(entradas, top):
+    """Soma do tempo próprio por pacote de topo (ex: todos os ``pandas.*``)."""
+    por_pacote = {}
+    for proprio, nome in entradas:
+        raiz = nome.split('.')[0]
+        por_pacote[raiz] = por_pacote.get(raiz, 0) + proprio
+    return sorted(por_pacote.items(), key=lambda item: item[1], reverse=True)[:top]
+
+
+def primeiro_rerun(pagina):
+    resultado = subprocess.run([sys.executable, '-c', PRIMEIRO_RERUN, pagina, *JIRA_MODULOS],
+                               cwd=RAIZ, capture_output=True, text=True, check=True)
+    return json.loads(resultado.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=1, help="processos por medição (vale o menor tempo)")
+    parser.add_argument('--top', type=int, default=10, help="pacotes listados por módulo")
+    args = parser.parse_args()
+
+    print("importação (processo novo)")
+    for modulo in MODULOS:
+        medicoes = [importtime(modulo) for _ in range(args.repeat)]
+        total, entradas = min(medicoes, key=lambda m: m[0])
+        print(f"  {modulo:<18}{total / 1000:>9.1f}ms")
+        if modulo.startswith('views.'):
+            for pacote, proprio in pacotes(entradas, args.top):
+                print(f"      {pacote:<24}{proprio / 1000:>8.1f}ms")
+
+    print("\nprimeiro rerun (processo novo, caches do Streamlit vazios)")
+    falhou = False
+    for pagina, outra in (('Dashboard', 'views.okrs'), ('OKRs', 'views.dashboard')):
+        medicoes = [primeiro_rerun(pagina) for _ in range(args.repeat)]
+        melhor = min(medicoes, key=lambda m: m['segundos'])
+        print(f"  {pagina:<12}{melhor['segundos']:>8.2f}s   módulos: {', '.join(melhor['modulos']) or '-'}")
+        for erro in melhor['erros']:
+            print(f"      erro: {erro}")
+        if outra in melhor['modulos']:
+            print(f"      {outra} foi importado ao abrir {pagina}")
+            falhou = True
+        if pagina == 'OKRs' and melhor['jira']:
+            print(f"      camada do Jira importada ao abrir {pagina}: {', '.join(melhor['jira'])}")
+            falhou = True
+
+    if falhou:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
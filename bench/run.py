@@ -0,0 +1,227 @@
+"""Benchmark dos caminhos de dados do dashboard com dados sintéticos.
+
+Gera exportações do Jira (com o changelog de status e uma planilha de OKR)
+com ``bench.synthetic``,
+cronometra cada etapa do pipeline e mede o pico de memória (tracemalloc,
+em uma segunda passada para não distorcer os tempos; buffers alocados pelo
+Arrow não aparecem nessa medida). O resultado vai para
+um JSON em ``bench/results/`` identificado pelo commit, para comparar
+regressões entre versões.
+
+Uso (na raiz do projeto):
+    python -m bench.run                          # 10k, 100k e 1M linhas
+    python -m bench.run --rows 10000 --no-memory
+    python -m bench.run --compare bench/results/<baseline>.json
+"""
+import argparse
+import json
+import platform
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from bench import synthetic
+from twobetter import cache as disk_cache
+from twobetter import cube as rollup_cube
+from twobetter import export
+from twobetter import flow
+from twobetter import partitions
+from twobetter.areas import classify_areas
+from twobetter.dates import parse_jira_dates
+from twobetter.filters import FilterIndex
+from twobetter.jira import DATE_COLUMNS, JIRA_COLUMNS, read_jira_csv
+from twobetter.kpis import DashboardAggregator
+from twobetter.linkage import IssueLinker
+from twobetter.okr import read_okr_workbook
+from twobetter.table import DetailsTable
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+OKR_ROWS = 200
+
+
+def _filter_combos(ctx):
+    index = ctx['index']
+    inicio, fim = index.date_bounds()
+    meio = inicio + (fim - inicio) / 2
+    return [
+        {},
+        {'periodo': (meio.date(), fim.date())},
+        {'Responsavel': index.options('Responsavel')[0], 'Status': 'Concluído'},
+        {'periodo': (inicio.date(), meio.date()), 'Tipo': 'Subtask', 'Status': 'Em andamento'},
+    ]
+
+
+def _select_all(ctx):
+    return [ctx['index'].select(**filtros) for filtros in _filter_combos(ctx)]
+
+
+def _aggregate_all(ctx):
+    recent = ctx['index'].date_bounds()[1] - timedelta(days=7)
+    return [ctx['aggregator'].compute(mask, recent) for mask in ctx['masks']]
+
+
+def _timeline_all(ctx):
+    return [rollup_cube.timeline(ctx['cube'], 'Semana', **filtros) for filtros in _filter_combos(ctx)]
+
+
+# (nome, função(ctx) -> resultado, chave onde guardar o resultado no ctx)
+def _flow_split(ctx):
+    # 90% mais antigo vira o log inicial; o resto chega como um arquivo novo
+    eventos = ctx['changelog']
+    corte = eventos['Data'].quantile(0.9)
+    return eventos[eventos['Data'] < corte], eventos[eventos['Data'] >= corte]
+
+
+def _partition_slice(ctx):
+    # Um projeto nos últimos 3 meses: o recorte típico de um squad
+    manifesto = ctx['partition_store'].manifest
+    inicio, fim = manifesto.date_bounds()
+    periodo = ((fim - timedelta(days=90)).date(), fim.date())
+    return ctx['partition_store'].read(manifesto.select(manifesto.projects()[:1], periodo))
+
+
+STAGES = [
+    ('read_csv', lambda ctx: pd.read_csv(ctx['csv'], encoding='utf-8-sig'), 'raw'),
+    ('parse_dates', lambda ctx: [parse_jira_dates(ctx['raw'].iloc[:, JIRA_COLUMNS.index(c)])
+                                 for c in DATE_COLUMNS], None),
+    ('classify_areas', lambda ctx: classify_areas(ctx['raw']['Resumo']), None),
+    ('load_data', lambda ctx: read_jira_csv(ctx['csv']), 'df'),
+    ('cache_write', lambda ctx: disk_cache.write_frame(ctx['df'], ctx['feather']), None),
+    ('cache_read', lambda ctx: disk_cache.read_frame(ctx['feather']), None),
+    ('partition_write', lambda ctx: partitions.write_partitions(ctx['df'], ctx['partitions']), None),
+    ('partition_open', lambda ctx: partitions.PartitionStore.from_path(ctx['partitions']), 'partition_store'),
+    ('partition_read_slice', _partition_slice, 'partition_slice'),
+    ('partition_index_build', lambda ctx: FilterIndex(ctx['partition_slice']), None),
+    ('filter_index_build', lambda ctx: FilterIndex(ctx['df']), 'index'),
+    ('filter_select', _select_all, 'masks'),
+    ('aggregator_build', lambda ctx: DashboardAggregator(ctx['df'], ctx['index']), 'aggregator'),
+    ('aggregate', _aggregate_all, None),
+    ('cube_build', lambda ctx: rollup_cube.build_cube(ctx['df']), 'cube'),
+    ('timeline', _timeline_all, None),
+    ('details_table_build', lambda ctx: DetailsTable(ctx['df']), 'table'),
+    ('details_search', lambda ctx: ctx['table'].search('homologação endpoint'), None),
+    ('details_sort', lambda ctx: ctx['table'].sorted_positions(ctx['masks'][1], 'Atualizado', False), None),
+    ('export_csv', lambda ctx: export.export_bytes(ctx['df'], 'CSV'), None),
+    ('load_okr_data', lambda ctx: read_okr_workbook(ctx['okr']), 'okr_df'),
+    ('okr_link_build', lambda ctx: IssueLinker(ctx['df'], ctx['index'], ctx['table']), 'linker'),
+    ('okr_progress', lambda ctx: ctx['linker'].progress(ctx['okr_df'], ctx['link_rules']), None),
+    ('read_changelog', lambda ctx: flow.read_changelog(ctx['changelog_csv']), 'changelog'),
+    ('flow_split', _flow_split, 'flow_parts'),
+    ('flow_build', lambda ctx: flow.FlowLog(ctx['flow_parts'][0]), 'flow_log'),
+    # Refazer tudo (merge + resumo de todas as issues) vs. encaixar só o arquivo novo
+    ('flow_rebuild', lambda ctx: flow.FlowLog(flow.merge_events(*ctx['flow_parts'])), None),
+    ('flow_update', lambda ctx: ctx['flow_log'].update(ctx['flow_parts'][1]), 'flow_log'),
+    ('flow_stats', lambda ctx: flow.compute_flow_stats(ctx['flow_log'], agora=pd.Timestamp('2026-04-01')), None),
+]
+
+
+def run_stages(ctx, memory):
+    resultados = []
+    for nome, func, chave in STAGES:
+        inicio = time.perf_counter()
+        saida = func(ctx)
+        segundos = time.perf_counter() - inicio
+        if chave:
+            ctx[chave] = saida
+        resultados.append({'stage': nome, 'seconds': round(segundos, 6)})
+
+    if memory:
+        # Segunda passada só para o pico de memória de cada etapa
+        tracemalloc.start()
+        for resultado, (nome, func, chave) in zip(resultados, STAGES):
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            saida = func(ctx)
+            resultado['peak_mb'] = round((tracemalloc.get_traced_memory()[1] - base) / 2**20, 2)
+            del saida
+        tracemalloc.stop()
+
+    return resultados
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def compare(atual, baseline_path):
+    baseline = json.loads(Path(baseline_path).read_text(encoding='utf-8'))
+    print(f"\nComparação com {baseline['commit']} ({baseline_path})")
+    for rows, dados in atual['sizes'].items():
+        anteriores = {s['stage']: s for s in baseline['sizes'].get(rows, {}).get('stages', [])}
+        if not anteriores:
+            continue
+        print(f"\n{int(rows):>9,} linhas   {'antes':>9} {'agora':>9} {'razão':>7}")
+        for etapa in dados['stages']:
+            antes = anteriores.get(etapa['stage'])
+            if antes:
+                razao = etapa['seconds'] / antes['seconds'] if antes['seconds'] else float('inf')
+                alerta = '  ⚠️' if razao > 1.2 else ''
+                print(f"{etapa['stage']:<20} {antes['seconds']:>8.3f}s {etapa['seconds']:>8.3f}s "
+                      f"{razao:>6.2f}x{alerta}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--no-memory', action='store_true', help="não mede pico de memória")
+    parser.add_argument('--output', type=Path, help="arquivo JSON de saída")
+    parser.add_argument('--compare', type=Path, help="JSON de uma execução anterior para comparar")
+    args = parser.parse_args()
+
+    resultado = {
+        'commit': git_commit(),
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'sizes': {},
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        okr_path = synthetic.write_okr_xlsx(tmp / "okr.xlsx", OKR_ROWS)
+        link_rules = synthetic.generate_link_rules(synthetic.generate_okr(OKR_ROWS))
+
+        for rows in args.rows:
+            csv_path = synthetic.write_jira_csv(tmp / f"jira_{rows}.csv", rows)
+            changelog_path = synthetic.write_changelog_csv(
+                tmp / f"changelog_{rows}.csv", pd.read_csv(csv_path, encoding='utf-8-sig', dtype=str))
+            ctx = {'csv': csv_path, 'okr': okr_path, 'feather': tmp / f"jira_{rows}.feather",
+                   'partitions': tmp / "partitions" / str(rows),
+                   'link_rules': link_rules, 'changelog_csv': changelog_path}
+
+            print(f"\n{rows:,} linhas ({csv_path.stat().st_size / 2**20:.1f} MB)")
+            etapas = run_stages(ctx, memory=not args.no_memory)
+            for etapa in etapas:
+                memoria = f"  pico {etapa['peak_mb']:>8.1f} MB" if 'peak_mb' in etapa else ''
+                print(f"  {etapa['stage']:<20} {etapa['seconds']:>8.3f}s{memoria}")
+
+            resultado['sizes'][str(rows)] = {
+                'csv_mb': round(csv_path.stat().st_size / 2**20, 2),
+                'frame_mb': round(ctx['df'].memory_usage(deep=True).sum() / 2**20, 2),
+                'stages': etapas,
+            }
+
+    output = args.output or RESULTS_DIR / f"{resultado['commit']}-{datetime.now():%Y%m%d-%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(resultado, indent=2), encoding='utf-8')
+    print(f"\nResultados salvos em {output}")
+
+    if args.compare:
+        compare(resultado, args.compare)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,216 @@
+"""Geradores de dados sintéticos no formato das exportações reais.
+
+O CSV do Jira segue as 14 colunas (cabeçalho em PT-BR) de
+``data/dados_jira.csv``: datas como ``05/jan/26 6:54 PM``, tags misturadas
+(``[Backend]``, ``[Back End]``, ``[BE]``...) e Responsável vazio em parte das
+tarefas. A planilha de OKR segue a aba ``Proposta de Metas Q1``.
+"""
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from twobetter.linkage import LinkRule, LinkRules
+from twobetter.okr import OKR_COLUMNS, OKR_SHEET
+
+JIRA_HEADER = ['Tipo de item', 'Chave da item', 'ID da item', 'Resumo', 'Responsável',
+               'ID do responsável', 'Relator', 'ID do relator', 'Prioridade', 'Status',
+               'Resolução', 'Criado', 'Atualizado(a)', 'Data limite']
+
+MESES_PT = np.array(['jan', 'fev', 'mar', 'abr', 'mai', 'jun',
+                     'jul', 'ago', 'set', 'out', 'nov', 'dez'], dtype=object)
+
+PESSOAS = ['Caio Alves', 'Vinicius Mocci', 'Flavio Sousa', 'Samuel Juren',
+           'Pedro Fernandes de Oliveira', 'Fellipe Souto', 'Ana Ribeiro', 'Julia Martins',
+           'Rafael Costa', 'Beatriz Lima', 'Lucas Pereira', 'Marina Rocha']
+
+TAGS = ['[Backend]', '[Back End]', '[BE]', '[BACKEND]', '[Frontend]', '[Front End]',
+        '[FE]', '[QA]', '[OPS]', '']
+TAGS_PESOS = [0.16, 0.1, 0.1, 0.03, 0.1, 0.1, 0.1, 0.08, 0.02, 0.21]
+
+EXTRAS = ['[Homologação-API]', '[Endpoint]', '[Melhoria]', '[API]', '[Interface]', '']
+EXTRAS_PESOS = [0.15, 0.1, 0.05, 0.1, 0.05, 0.55]
+
+ASSUNTOS = ['Cadastro de usuário', 'Swipe Interaction Endpoint', 'Tela de perfil',
+            'Upload de fotos', 'Validação de telefone', 'Fluxo de onboarding',
+            'Notificações push', 'Moderação de perfis', 'Login social', 'Chat em tempo real',
+            'Correção de idade', 'Filtro de busca', 'Pagamentos', 'Relatórios', 'Regression Tests']
+
+STATUS = ['Concluído', 'Em andamento', 'Tarefas pendentes', 'TESTE']
+STATUS_PESOS = [0.8, 0.08, 0.11, 0.01]
+
+PRIORIDADES = ['Medium', 'High', 'Low', 'Highest']
+PRIORIDADES_PESOS = [0.7, 0.15, 0.1, 0.05]
+
+
+MESES_NUM = {mes: f"{i + 1:02d}" for i, mes in enumerate(MESES_PT)}
+
+
+def _account_ids(rng, n):
+    return np.array([f"712020:{rng.bytes(16).hex()[:8]}-{rng.bytes(8).hex()[:4]}-4{rng.bytes(8).hex()[:3]}"
+                     f"-a{rng.bytes(8).hex()[:3]}-{rng.bytes(8).hex()[:12]}" for _ in range(n)], dtype=object)
+
+
+def format_jira_dates(datas):
+    """Formata datetimes como o Jira em PT-BR (ex: ``05/jan/26 6:54 PM``)."""
+    datas = pd.DatetimeIndex(datas)
+    validas = ~datas.isna()
+    datas_validas = datas[validas]
+
+    # "05/01/26 06:54 PM" formatado pelo Arrow; depois troca o mês pela
+    # abreviação e tira o zero à esquerda da hora
+    texto = pd.Series(
+        pc.strftime(pa.array(datas_validas.as_unit('s')), format='%d/%m/%y %I:%M %p'),
+        dtype='string'
+    )
+    mes = pd.Series(MESES_PT[datas_validas.month.to_numpy() - 1], dtype='string')
+    hora = texto.str.slice(9, 11).str.lstrip('0')
+    texto = texto.str.slice(0, 3) + mes + texto.str.slice(5, 9) + hora + texto.str.slice(11)
+
+    resultado = np.full(len(datas), None, dtype=object)
+    resultado[validas] = texto.to_numpy(dtype=object)
+    return resultado
+
+
+def generate_jira(rows, seed=42, projetos=('SCRUM', 'MOBILE', 'DATA'), inicio='2024-01-01', dias=730):
+    rng = np.random.default_rng(seed)
+
+    # Títulos repetidos: várias subtarefas compartilham o mesmo resumo
+    n_titulos = max(rows // 4, 1)
+    titulos = (
+        rng.choice(TAGS, n_titulos, p=TAGS_PESOS).astype(object)
+        + rng.choice(EXTRAS, n_titulos, p=EXTRAS_PESOS).astype(object)
+        + ' - '
+        + rng.choice(ASSUNTOS, n_titulos).astype(object)
+        + ' #' + np.arange(n_titulos).astype(str).astype(object)
+    )
+    resumo = titulos[rng.integers(0, n_titulos, rows)]
+
+    pessoas = np.array(PESSOAS, dtype=object)
+    ids_pessoas = _account_ids(rng, len(PESSOAS))
+    i_resp = rng.integers(0, len(PESSOAS), rows)
+    sem_resp = rng.random(rows) < 0.06
+    responsavel = np.where(sem_resp, None, pessoas[i_resp])
+    id_responsavel = np.where(sem_resp, None, ids_pessoas[i_resp])
+    i_rel = rng.integers(0, len(PESSOAS), rows)
+
+    status = rng.choice(STATUS, rows, p=STATUS_PESOS).astype(object)
+    resolucao = np.where(status == 'Concluído', 'Itens concluídos', None)
+
+    minutos = rng.integers(0, dias * 24 * 60, rows)
+    criado = pd.Timestamp(inicio) + pd.to_timedelta(np.sort(minutos)[::-1], unit='min')
+    atualizado = criado + pd.to_timedelta(rng.integers(0, 30 * 24 * 60, rows), unit='min')
+    com_prazo = rng.random(rows) < 0.02
+    limite = pd.DatetimeIndex(np.where(com_prazo, (criado + pd.Timedelta(days=14)).floor('D'), pd.NaT))
+
+    projeto = rng.choice(list(projetos), rows).astype(object)
+    numero = np.arange(rows, 0, -1)
+
+    return pd.DataFrame({
+        'Tipo de item': rng.choice(['Subtask', 'Tarefa'], rows, p=[0.7, 0.3]),
+        'Chave da item': projeto + '-' + numero.astype(str).astype(object),
+        'ID da item': 10000 + numero,
+        'Resumo': resumo,
+        'Responsável': responsavel,
+        'ID do responsável': id_responsavel,
+        'Relator': pessoas[i_rel],
+        'ID do relator': ids_pessoas[i_rel],
+        'Prioridade': rng.choice(PRIORIDADES, rows, p=PRIORIDADES_PESOS),
+        'Status': status,
+        'Resolução': resolucao,
+        'Criado': format_jira_dates(criado),
+        'Atualizado(a)': format_jira_dates(atualizado),
+        'Data limite': format_jira_dates(limite),
+    }, columns=JIRA_HEADER)
+
+
+def write_jira_csv(path, rows, seed=42, **kwargs):
+    generate_jira(rows, seed, **kwargs).to_csv(path, index=False, encoding='utf-8-sig')
+    return path
+
+
+def generate_changelog(jira, seed=42):
+    """Transições de status coerentes com o CSV de ``generate_jira`` (uma por linha).
+
+    Toda issue nasce em "Tarefas pendentes"; as que estão em andamento ou
+    concluídas passam por "Em andamento" e as concluídas terminam em
+    "Concluído" (algumas são reabertas no meio do caminho).
+    """
+    rng = np.random.default_rng(seed)
+    chaves = jira['Chave da item'].to_numpy()
+    status = jira['Status'].to_numpy()
+    criado = pd.to_datetime(jira['Criado'].str.replace(r'/(\w{3})/', lambda m: f"/{MESES_NUM[m.group(1)]}/", regex=True),
+                            format='%d/%m/%y %I:%M %p')
+    n = len(jira)
+
+    iniciou = status != 'Tarefas pendentes'
+    concluiu = status == 'Concluído'
+    reabriu = concluiu & (rng.random(n) < 0.05)
+    inicio = criado + pd.to_timedelta(rng.exponential(3, n), unit='D')
+    fim = inicio + pd.to_timedelta(rng.gamma(2, 2.5, n), unit='D')
+    reaberto = fim + pd.to_timedelta(rng.exponential(1, n), unit='D')
+    fim_final = reaberto + pd.to_timedelta(rng.gamma(1.5, 2, n), unit='D')
+
+    partes = [
+        (iniciou, inicio, 'Tarefas pendentes', 'Em andamento'),
+        (concluiu, fim, 'Em andamento', 'Concluído'),
+        (reabriu, reaberto, 'Concluído', 'Em andamento'),
+        (reabriu, fim_final, 'Em andamento', 'Concluído'),
+    ]
+    frames = [pd.DataFrame({'Chave': chaves[sel], 'Data': datas[sel], 'De': de, 'Para': para})
+              for sel, datas, de, para in partes]
+    eventos = pd.concat(frames, ignore_index=True)
+    eventos['Data'] = eventos['Data'].dt.strftime('%Y-%m-%dT%H:%M:%S.000-0300')
+    return eventos.sort_values('Data', ignore_index=True)
+
+
+def write_changelog_csv(path, jira, seed=42):
+    generate_changelog(jira, seed).to_csv(path, index=False, encoding='utf-8')
+    return path
+
+
+def generate_okr(rows, seed=42):
+    rng = np.random.default_rng(seed)
+    focos = ['Desenvolvimento MVP', 'Qualidade', 'Infraestrutura', 'Produto', 'Time']
+    pesos = rng.integers(1, 15, rows)
+    prazos = pd.Timestamp('2026-01-15') + pd.to_timedelta(rng.integers(0, 75, rows), unit='D')
+
+    colunas = list(OKR_COLUMNS)
+    df = pd.DataFrame({
+        'FOCO': rng.choice(focos, rows),
+        'PRINCIPAL ENTREGA': [f"Entrega {i}" for i in range(rows)],
+        'PROPOSTA DE META': [f"Meta sintética {i}" for i in range(rows)],
+        'PRIORIDADE': rng.choice(['Alta', 'Média', 'Baixa'], rows),
+        'RESPONSÁVEL': rng.choice(PESSOAS, rows),
+        'PESO': [f"{p}%" for p in pesos],
+        'PESO - Média Ponderada Geral': [f"{p:.1f}%" for p in pesos],
+        'RESULTADOS ESPERADOS': 'Resultado esperado',
+        'INDICADOR': '%',
+        'Medição do Indicador': '% entregue',
+        'PRAZO': prazos.strftime('%d/%m/%Y'),
+        'STATUS': rng.choice(['Em andamento', 'Não Iniciado', 'Concluído'], rows),
+        'O QUE FOI ENTREGUE': None,
+        'Time envolvido (informar responsável da meta compartilhda)': 'Time',
+        'Detalhamento Meta para o time': 'Detalhamento',
+    })
+    return df[colunas]
+
+
+def generate_link_rules(df_okr, seed=42):
+    """Regras de vínculo para as metas de ``generate_okr`` (termos dos assuntos e tags)."""
+    rng = np.random.default_rng(seed)
+    palavras = sorted({p.lower() for assunto in ASSUNTOS for p in assunto.split() if len(p) > 3})
+    tags = ['Tag_Endpoint', 'Tag_Homologacao_API', 'Tag_API', 'Tag_Melhoria']
+    metas = {}
+    for entrega in df_okr['PRINCIPAL ENTREGA']:
+        metas[entrega.casefold()] = LinkRule(
+            termos=tuple(rng.choice(palavras, rng.integers(1, 4), replace=False)),
+            tags=tuple(rng.choice(tags, rng.integers(0, 2), replace=False)),
+            mesmo_responsavel=bool(rng.random() < 0.3),
+        )
+    return LinkRules(metas, concluido=('Concluído',), em_andamento=('Em andamento', 'TESTE'))
+
+
+def write_okr_xlsx(path, rows, seed=42):
+    generate_okr(rows, seed).to_excel(path, sheet_name=OKR_SHEET, index=False)
+    return path
@@ -0,0 +1,20 @@
+"""Cache em disco: a limpeza dos antigos só apaga caches do mesmo arquivo."""
+from twobetter import cache as disk_cache
+
+
+def test_limpeza_nao_apaga_cache_de_nome_parecido(tmp_path, monkeypatch):
+    monkeypatch.setattr(disk_cache, 'CACHE_DIR', tmp_path / "cache")
+    disk_cache.CACHE_DIR.mkdir()
+    versao = disk_cache.schema_key()
+    outros = [disk_cache.CACHE_DIR / f"dados.v2.1-1.{versao}.feather",
+              disk_cache.CACHE_DIR / f"PROJ-2026-10.1-1.{versao}.feather"]
+    antigo = disk_cache.CACHE_DIR / f"dados.1-1.{versao}.feather"
+    atual = disk_cache.CACHE_DIR / f"dados.2-2.{versao}.feather"
+    for arquivo in outros + [antigo, atual]:
+        arquivo.touch()
+
+    disk_cache._remove_stale(tmp_path / "dados.csv", keep=atual)
+    disk_cache._remove_stale(tmp_path / "PROJ-2026-1.csv", keep=None)
+
+    assert not antigo.exists()
+    assert atual.exists() and all(arquivo.exists() for arquivo in outros)
@@ -0,0 +1,33 @@
+"""Cubo de contagens: totais completos e mesma timeline nos dois backends."""
+import pandas as pd
+
+from bench import synthetic
+from twobetter import cube
+from twobetter import data
+from twobetter import sqlstore
+from twobetter.jira import read_jira_csv
+
+
+def carregar(tmp_path, linhas=300):
+    df = read_jira_csv(synthetic.write_jira_csv(tmp_path / "jira.csv", linhas))
+    df.loc[df.index[::5], 'Criado'] = pd.NaT
+    df.loc[df.index[::7], 'Responsavel'] = None
+    return df
+
+
+def test_cubo_conta_todas_as_tarefas(tmp_path):
+    df = carregar(tmp_path)
+    assert cube.build_cube(df)['Quantidade'].sum() == len(df)
+
+
+def test_timeline_igual_nos_dois_backends(tmp_path, monkeypatch):
+    monkeypatch.setattr(sqlstore, 'SQL_DIR', tmp_path / "sql")
+    df = carregar(tmp_path)
+    filtros = data.jira_filters()
+    for granularidade in cube.GRANULARIDADES:
+        pandas = data.Dataset(df, backend='pandas').timeline(filtros, granularidade)
+        sql = data.Dataset(df, backend='sql').timeline(filtros, granularidade)
+        esperado = df.dropna(subset=['Criado', 'Status'])
+        assert pandas['Quantidade'].sum() == sql['Quantidade'].sum() == len(esperado)
+        pandas = pandas.astype({'Periodo': str, 'Status': str})
+        assert pandas.to_dict('records') == sql.to_dict('records')
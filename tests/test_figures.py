@@ -0,0 +1,28 @@
+"""Cache de figuras: a figura congelada gera o mesmo JSON que o Streamlit enviaria."""
+import pandas as pd
+import plotly.express as px
+import plotly.io as pio
+import plotly.tools
+
+from twobetter import figures
+
+
+def spec_do_streamlit(figura):
+    # Mesmo caminho do st.plotly_chart até o JSON enviado ao navegador
+    return pio.to_json(plotly.tools.return_figure_from_figure_or_data(figura, validate_figure=True),
+                       validate=False)
+
+
+def grafico(df):
+    return px.bar(df, x='Status', y='Quantidade', color='Status')
+
+
+def test_figura_em_cache_gera_o_mesmo_json():
+    df = pd.DataFrame({'Status': ['A', 'B', 'C'], 'Quantidade': [3, 1, 2]})
+    cache = figures.FigureCache()
+
+    figura = cache.get('status', grafico, df)
+    assert cache.get('status', grafico, df.copy()) is figura
+    assert spec_do_streamlit(figura) == spec_do_streamlit(grafico(df))
+    # Serializar não altera o dicionário guardado
+    assert spec_do_streamlit(figura) == spec_do_streamlit(figura)
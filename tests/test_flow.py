@@ -0,0 +1,52 @@
+"""Log de fluxo: cada pasta de changelog tem o próprio store."""
+import pandas as pd
+
+from twobetter import flow
+
+
+def escrever_changelog(pasta, nome, chaves):
+    pasta.mkdir(parents=True, exist_ok=True)
+    linhas = []
+    for i, chave in enumerate(chaves):
+        linhas.append({'Chave': chave, 'Data': f'2025-01-{1 + i % 20:02d} 10:00', 'De': 'Tarefas pendentes',
+                       'Para': 'Em andamento'})
+        linhas.append({'Chave': chave, 'Data': f'2025-01-{2 + i % 20:02d} 10:00', 'De': 'Em andamento',
+                       'Para': 'Concluído'})
+    pd.DataFrame(linhas).to_csv(pasta / nome, index=False)
+
+
+def test_pastas_diferentes_nao_se_misturam(tmp_path, monkeypatch):
+    monkeypatch.setattr(flow, 'FLOW_DIR', tmp_path / "flow")
+    escrever_changelog(tmp_path / "a", "a.csv", [f"A-{i}" for i in range(50)])
+    escrever_changelog(tmp_path / "b", "b.csv", [f"B-{i}" for i in range(8)])
+
+    assert len(flow.load_flow_log(tmp_path / "a").resumo) == 50
+    assert len(flow.load_flow_log(tmp_path / "b").resumo) == 8
+
+
+def test_arquivo_removido_sai_do_log(tmp_path, monkeypatch):
+    monkeypatch.setattr(flow, 'FLOW_DIR', tmp_path / "flow")
+    pasta = tmp_path / "changelog"
+    escrever_changelog(pasta, "semana1.csv", ["X-1", "X-2"])
+    escrever_changelog(pasta, "semana2.csv", ["X-3"])
+    assert len(flow.load_flow_log(pasta).resumo) == 3
+
+    (pasta / "semana1.csv").unlink()
+    assert list(flow.load_flow_log(pasta).resumo.index) == ["X-3"]
+
+
+def test_update_igual_a_montar_do_zero(tmp_path):
+    escrever_changelog(tmp_path, "antigo.csv", [f"X-{i}" for i in range(0, 40)])
+    # Issues antigas com transições novas, issues novas no meio e no fim das chaves
+    linhas = [{'Chave': chave, 'Data': '2025-02-01 09:00', 'De': 'Concluído', 'Para': 'Em andamento'}
+              for chave in ['X-3', 'X-25', 'X-100', 'A-1', 'X-25']]
+    linhas.append({'Chave': 'X-7', 'Data': '2025-01-08 10:00', 'De': 'Tarefas pendentes', 'Para': 'Em andamento'})
+    pd.DataFrame(linhas).to_csv(tmp_path / "novo.csv", index=False)
+
+    antigo = flow.read_changelog(tmp_path / "antigo.csv")
+    novo = flow.read_changelog(tmp_path / "novo.csv")
+    atualizado = flow.FlowLog(antigo).update(novo)
+    do_zero = flow.FlowLog(flow.merge_events(antigo, novo))
+
+    pd.testing.assert_frame_equal(atualizado.eventos, do_zero.eventos)
+    pd.testing.assert_frame_equal(atualizado.resumo, do_zero.resumo)
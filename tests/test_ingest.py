@@ -0,0 +1,31 @@
+"""Ingestão incremental: cada pasta de dados tem o próprio store."""
+from bench import synthetic
+from twobetter import ingest
+from twobetter.jira import read_jira_csv
+
+
+def escrever_csv(pasta, nome, linhas, primeiro_id):
+    pasta.mkdir(parents=True, exist_ok=True)
+    df = synthetic.generate_jira(linhas)
+    df['ID da item'] = primeiro_id + df['ID da item'] - df['ID da item'].min()
+    df.to_csv(pasta / nome, index=False, encoding='utf-8-sig')
+
+
+def test_pastas_diferentes_nao_se_misturam(tmp_path, monkeypatch):
+    monkeypatch.setattr(ingest, 'STORE_DIR', tmp_path / "store")
+    escrever_csv(tmp_path / "a", "a.csv", 100, primeiro_id=1)
+    escrever_csv(tmp_path / "b", "b.csv", 30, primeiro_id=1000)
+
+    assert len(ingest.load_incremental(tmp_path / "a", read_jira_csv)) == 100
+    assert len(ingest.load_incremental(tmp_path / "b", read_jira_csv)) == 30
+    # De volta à primeira pasta: o store dela continua só com as suas issues
+    assert len(ingest.load_incremental(tmp_path / "a", read_jira_csv)) == 100
+
+
+def test_csv_novo_na_mesma_pasta_e_mesclado(tmp_path, monkeypatch):
+    monkeypatch.setattr(ingest, 'STORE_DIR', tmp_path / "store")
+    escrever_csv(tmp_path / "a", "a1.csv", 50, primeiro_id=1)
+    assert len(ingest.load_incremental(tmp_path / "a", read_jira_csv)) == 50
+
+    escrever_csv(tmp_path / "a", "a2.csv", 20, primeiro_id=1000)
+    assert len(ingest.load_incremental(tmp_path / "a", read_jira_csv)) == 70
@@ -0,0 +1,27 @@
+"""KPIs do Dashboard: mesmas contagens do ``groupby`` original, nos dois backends."""
+from datetime import datetime
+
+import pytest
+
+from bench import synthetic
+from twobetter import data
+from twobetter import sqlstore
+from twobetter.jira import read_jira_csv
+
+
+@pytest.mark.parametrize('backend', ['pandas', 'sql'])
+def test_tarefas_sem_status_contam_por_dev(tmp_path, monkeypatch, backend):
+    monkeypatch.setattr(sqlstore, 'SQL_DIR', tmp_path / "sql")
+    df = read_jira_csv(synthetic.write_jira_csv(tmp_path / "jira.csv", 300))
+    df.loc[df.index[::7], 'Status'] = None
+    df.loc[df.index[::11], 'Responsavel'] = None
+
+    stats = data.Dataset(df, backend=backend).stats(data.jira_filters(), datetime(2025, 1, 1))
+
+    esperado = df.groupby('Responsavel').agg({
+        'Chave': 'count',
+        'Status': lambda x: (x == 'Concluído').sum()
+    }).rename(columns={'Chave': 'Total', 'Status': 'Concluidas'})
+    assert stats.devs_ativos == df['Responsavel'].nunique()
+    assert stats.dev_stats['Total'].sort_index().to_dict() == esperado['Total'].to_dict()
+    assert stats.dev_stats['Concluidas'].sort_index().to_dict() == esperado['Concluidas'].to_dict()
@@ -0,0 +1,54 @@
+"""Vínculo Jira x OKR: posições de cada regra e progresso ponderado."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from bench import synthetic
+from twobetter import data
+from twobetter import linkage
+from twobetter.jira import read_jira_csv
+from twobetter.linkage import LinkRule, LinkRules
+
+
+def test_regras_e_progresso_ponderado(tmp_path):
+    df = read_jira_csv(synthetic.write_jira_csv(tmp_path / "jira.csv", 500))
+    dataset = data.Dataset(df)
+    chaves = df['Chave'].astype(str).tolist()
+
+    regras = LinkRules({
+        # Chaves repetidas e uma que não existe: cada tarefa conta uma vez
+        'por chave': LinkRule(chaves=(chaves[3], chaves[3], chaves[10], 'NADA-1')),
+        'sem tarefas': LinkRule(termos=('zzzinexistente',)),
+        'por area': LinkRule(areas=('Backend',)),
+    }, concluido=('Concluído',), em_andamento=('Em andamento',))
+    df_okr = pd.DataFrame({
+        'Foco': ['A', 'A', 'B', 'B', 'B'],
+        # Entrega repetida: as duas metas usam as mesmas tarefas
+        'Entrega': ['Por chave', 'Sem tarefas', 'Por area', 'por  AREA', 'Sem regra'],
+        'Responsavel': ['x', 'y', 'z', 'w', 'v'],
+        'Peso_Num': [0.1, 0.2, 0.3, 0.15, 0.25],
+        'Status': ['Em andamento'] * 5,
+    })
+
+    posicoes = dataset.linker.goal_positions(df_okr, regras)
+    assert list(posicoes[0]) == [3, 10]
+    assert len(posicoes[1]) == 0 and len(posicoes[4]) == 0
+    assert list(posicoes[2]) == list(np.flatnonzero(df['Area'] == 'Backend'))
+    assert posicoes[3] is posicoes[2]
+
+    progresso = dataset.okr_progress(df_okr, regras)
+    status = [df['Status'].iloc[p] for p in posicoes.values()]
+    assert progresso['Tarefas'].tolist() == [len(s) for s in status]
+    assert progresso['Concluidas'].tolist() == [int((s == 'Concluído').sum()) for s in status]
+    assert progresso['Em_Andamento'].tolist() == [int((s == 'Em andamento').sum()) for s in status]
+    assert progresso['Progresso'].isna().tolist() == [False, True, False, False, True]
+    assert progresso['Status_Jira'].isna().tolist() == [False, True, False, False, True]
+
+    # Média ponderada só pelas metas com tarefas; a cobertura é o peso delas
+    vinculadas = progresso.iloc[[0, 2, 3]]
+    esperado = (vinculadas['Progresso'] * vinculadas['Peso_Num']).sum() / vinculadas['Peso_Num'].sum()
+    media, cobertura = linkage.weighted_progress(progresso)
+    assert media == pytest.approx(esperado)
+    assert cobertura == pytest.approx(0.55 / 1.0)
+
+    assert linkage.weighted_progress(progresso.iloc[[1, 4]]) == (None, 0.0)
@@ -0,0 +1,16 @@
+"""Cartões de metas da página de OKRs."""
+import pandas as pd
+
+from twobetter.okr import OKR_COLUMNS, SEM_FOCO, goal_cards
+
+
+def test_metas_sem_foco_tem_cartao():
+    df = pd.DataFrame({coluna: ['x', 'y', 'z'] for coluna in OKR_COLUMNS.values()})
+    df['Foco'] = ['Produto', None, 'Produto']
+    df['Entrega'] = ['E1', 'E2', 'E3']
+
+    cartoes = goal_cards(df)
+
+    assert list(cartoes) == ['Produto', SEM_FOCO]
+    assert '**E2**' in cartoes[SEM_FOCO]
+    assert '**E1**' in cartoes['Produto'] and '**E3**' in cartoes['Produto']
@@ -0,0 +1,25 @@
+"""Cache em disco das planilhas de OKR."""
+from bench import synthetic
+from twobetter import okr_loader
+
+
+def caches(pasta, stem):
+    return sorted(f.name for f in pasta.iterdir() if okr_loader.CACHE_NAME_RE.match(f.name)['stem'] == stem)
+
+
+def test_planilhas_com_prefixo_comum_nao_apagam_o_cache_uma_da_outra(tmp_path, monkeypatch):
+    pasta = tmp_path / "cache"
+    monkeypatch.setattr(okr_loader, 'OKR_CACHE_DIR', pasta)
+    nomes = ["okr.xlsx", "okr.2026.xlsx", "okr[1].xlsx"]
+    for nome in nomes:
+        okr_loader.load_workbook_quarters(synthetic.write_okr_xlsx(tmp_path / nome, 10))
+    outras = {stem: caches(pasta, stem) for stem in ("okr.2026", "okr[1]")}
+    assert all(outras.values())
+
+    # Nova versão de okr.xlsx: só os caches antigos dela saem
+    antigos = caches(pasta, "okr")
+    okr_loader.load_workbook_quarters(synthetic.write_okr_xlsx(tmp_path / "okr.xlsx", 12, seed=7))
+
+    assert {stem: caches(pasta, stem) for stem in outras} == outras
+    novos = caches(pasta, "okr")
+    assert novos and not set(novos) & set(antigos)
@@ -0,0 +1,29 @@
+"""Leitura paralela: o mesmo resultado da leitura sequencial do CSV."""
+import pandas as pd
+
+from bench import synthetic
+from twobetter import parallel
+from twobetter.jira import read_jira_csv
+
+
+def test_faixas_iguais_a_leitura_sequencial(tmp_path):
+    df = synthetic.generate_jira(3000)
+    # Resumos com quebras de linha, vírgulas e aspas entre aspas
+    df.loc[::7, 'Resumo'] = 'Linha 1\nLinha 2, com "aspas"\n\nfim #' + df.loc[::7, 'ID da item'].astype(str)
+    # Cada metade do arquivo vê projetos, tipos e status que a outra não vê
+    metade = len(df) // 2
+    df.loc[:metade, 'Chave da item'] = 'ANTES-' + df.loc[:metade, 'ID da item'].astype(str)
+    df.loc[:metade, 'Status'] = 'Tarefas pendentes'
+    df.loc[metade:, 'Tipo de item'] = 'Epic'
+    caminho = tmp_path / "jira.csv"
+    df.to_csv(caminho, index=False, encoding='utf-8-sig')
+
+    _, faixas = parallel.split_ranges(caminho, 4)
+    assert len(faixas) == 4
+
+    sequencial = read_jira_csv(caminho)
+    paralelo = parallel.read_jira_csv_parallel(caminho, workers=2, min_bytes=0)
+
+    assert paralelo['Resumo'].str.contains('\n').sum() == len(df.loc[::7])
+    pd.testing.assert_frame_equal(paralelo, sequencial)
+    assert paralelo.attrs['datas_invalidas'] == sequencial.attrs['datas_invalidas']
@@ -0,0 +1,71 @@
+"""Partições por projeto x mês: recortes iguais ao frame completo filtrado."""
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from bench import synthetic
+from twobetter import data
+from twobetter import partitions
+from twobetter.jira import read_jira_csv
+
+
+def recorte(df, projetos, meses):
+    mask = (np.isin(partitions.project_of(df['Chave']), list(projetos))
+            & np.isin(partitions.month_of(df['Criado']), list(meses)))
+    return df[mask].reset_index(drop=True)
+
+
+def test_recorte_igual_ao_frame_filtrado(tmp_path, monkeypatch):
+    monkeypatch.setattr(partitions, 'PARTITION_DIR', tmp_path / "partitions")
+    df = read_jira_csv(synthetic.write_jira_csv(tmp_path / "jira.csv", 3000))
+    df.loc[df.index[::50], 'Criado'] = pd.NaT
+
+    store = partitions.PartitionStore.open_or_build(('jira', 1), lambda: df)
+    assert sum(p.linhas for p in store.manifest.partitions) == len(df)
+
+    periodo = (date(2025, 3, 10), date(2025, 6, 20))
+    particoes = store.manifest.select(['SCRUM', 'MOBILE'], periodo)
+    meses = {p.mes for p in particoes}
+    assert meses == {'2025-03', '2025-04', '2025-05', '2025-06'}
+
+    lido = store.read(particoes)
+    pd.testing.assert_frame_equal(lido, recorte(df, ['SCRUM', 'MOBILE'], meses))
+
+    # Filtrar o recorte dá o mesmo que filtrar o dataset completo
+    filtros = data.jira_filters(periodo, status='Concluído')
+    completo = data.Dataset(df)
+    no_recorte = data.Dataset(lido).mask(filtros).sum()
+    projetos = np.isin(partitions.project_of(df['Chave']), ['SCRUM', 'MOBILE'])
+    assert no_recorte > 0
+    assert no_recorte == (completo.mask(filtros) & projetos).sum()
+
+
+def test_mes_regravado_em_nova_versao(tmp_path, monkeypatch):
+    monkeypatch.setattr(partitions, 'PARTITION_DIR', tmp_path / "partitions")
+    df = read_jira_csv(synthetic.write_jira_csv(tmp_path / "jira.csv", 2000))
+    antigo = partitions.PartitionStore.open_or_build(('jira', 1), lambda: df)
+
+    # Nova exportação: o mês de março do SCRUM muda (status e tarefas a menos)
+    marco = recorte(df, ['SCRUM'], ['2025-03'])
+    mask = ((partitions.project_of(df['Chave']) == 'SCRUM')
+            & (partitions.month_of(df['Criado']) == '2025-03'))
+    novo_df = df.drop(df.index[mask][:3]).reset_index(drop=True)
+    novo_df.loc[(partitions.project_of(novo_df['Chave']) == 'SCRUM')
+                & (partitions.month_of(novo_df['Criado']) == '2025-03'), 'Status'] = 'Concluído'
+    novo = partitions.PartitionStore.open_or_build(('jira', 2), lambda: novo_df)
+
+    linhas = {p.nome: p.linhas for p in novo.manifest.partitions}
+    antes = {p.nome: p.linhas for p in antigo.manifest.partitions}
+    assert linhas['SCRUM.2025-03'] == len(marco) - 3
+    assert {n: v for n, v in linhas.items() if n != 'SCRUM.2025-03'} == \
+        {n: v for n, v in antes.items() if n != 'SCRUM.2025-03'}
+
+    marco_periodo = (date(2025, 3, 1), date(2025, 3, 31))
+    regravado = novo.read(novo.manifest.select(['SCRUM'], marco_periodo))
+    pd.testing.assert_frame_equal(regravado, recorte(novo_df, ['SCRUM'], ['2025-03']))
+    assert (regravado['Status'] == 'Concluído').all()
+
+    # A versão anterior continua legível com o manifesto dela
+    assert partitions.PartitionStore.open(('jira', 1)).manifest == antigo.manifest
+    pd.testing.assert_frame_equal(antigo.read(antigo.manifest.select(['SCRUM'], marco_periodo)), marco)
@@ -0,0 +1,44 @@
+"""Banco SQL embutido: limpeza dos antigos e volta ao pandas em caso de erro."""
+import gc
+from datetime import datetime
+
+from bench import synthetic
+from twobetter import data
+from twobetter import sqlstore
+from twobetter.jira import read_jira_csv
+
+
+def carregar(tmp_path, linhas=300):
+    return read_jira_csv(synthetic.write_jira_csv(tmp_path / "jira.csv", linhas))
+
+
+def test_bancos_em_uso_nao_sao_apagados(tmp_path, monkeypatch):
+    monkeypatch.setattr(sqlstore, 'SQL_DIR', tmp_path / "sql")
+    df = carregar(tmp_path)
+    stores = [sqlstore.SqlStore.open_or_build(df, ('chave', i)) for i in range(sqlstore.MAX_DATABASES + 2)]
+    assert all(store.path.exists() for store in stores)
+    filtros = data.jira_filters()
+    assert all(store.stats(filtros, datetime(2025, 1, 1)).total == len(df) for store in stores)
+
+
+def test_banco_sem_chave_e_apagado_ao_liberar(tmp_path, monkeypatch):
+    monkeypatch.setattr(sqlstore, 'SQL_DIR', tmp_path / "sql")
+    store = sqlstore.SqlStore.open_or_build(carregar(tmp_path))
+    path = store.path
+    assert path.exists()
+    del store
+    gc.collect()
+    assert not path.exists()
+
+
+def test_banco_removido_volta_ao_pandas(tmp_path, monkeypatch):
+    monkeypatch.setattr(sqlstore, 'SQL_DIR', tmp_path / "sql")
+    df = carregar(tmp_path)
+    dataset = data.Dataset(df, ('chave', 'removido'), backend='sql')
+    assert dataset.engine != 'pandas'
+    dataset.sql.path.unlink()
+
+    filtros = data.jira_filters()
+    assert dataset.stats(filtros, datetime(2025, 1, 1)).total == len(df)
+    assert not dataset.timeline(filtros).empty
+    assert dataset.engine == 'pandas'
@@ -0,0 +1,43 @@
+"""Tabela de detalhes: busca por tokens e ordem paginada iguais às do pandas."""
+import re
+
+import numpy as np
+import pandas as pd
+
+from bench import synthetic
+from twobetter import data
+from twobetter.jira import read_jira_csv
+from twobetter.table import SEARCH_COLUMNS, SORTABLE_COLUMNS, DetailsTable
+
+
+def contem(df, busca):
+    # Cada termo casa com o início de uma palavra do Resumo ou da Chave
+    mask = pd.Series(True, index=df.index)
+    for termo in re.findall(r'\w+', busca.lower()):
+        padrao = r'\b' + re.escape(termo)
+        mask &= np.logical_or.reduce([df[c].astype(str).str.contains(padrao, case=False) for c in SEARCH_COLUMNS])
+    return mask.to_numpy()
+
+
+def test_busca_e_ordem_iguais_ao_pandas(tmp_path):
+    df = read_jira_csv(synthetic.write_jira_csv(tmp_path / "jira.csv", 2000))
+    df.loc[df.index[::9], 'Responsavel'] = None
+    tabela = DetailsTable(df)
+    filtro = data.Dataset(df).mask({**data.jira_filters(), 'Tipo': 'Subtask'})
+
+    for busca in ['', 'api', 'chat tempo', 'moderaç perf', 'scrum 1', 'nada-disso']:
+        mask = filtro & tabela.search(busca) if busca else filtro
+        assert (mask == (filtro & contem(df, busca))).all(), busca
+
+        filtrado = df[mask].reset_index()
+        for coluna in SORTABLE_COLUMNS:
+            for crescente in (True, False):
+                valores = filtrado[coluna]
+                if hasattr(valores, 'cat'):
+                    valores = valores.astype(str).where(valores.notna())
+                esperado = filtrado.loc[valores.sort_values(
+                    ascending=crescente, kind='stable', na_position='last').index, 'index']
+                posicoes = tabela.sorted_positions(mask, coluna, crescente)
+                assert (posicoes == esperado.to_numpy()).all(), (busca, coluna, crescente)
+                pagina = tabela.page(posicoes, 2, 25, ['Chave', coluna])
+                pd.testing.assert_frame_equal(pagina, df.loc[esperado.iloc[25:50], ['Chave', coluna]])
@@ -0,0 +1 @@
+"""Camada de dados do dashboard TwoBetter (sem dependência do Streamlit)."""
@@ -0,0 +1,3 @@
+from twobetter.cli import main
+
+main()
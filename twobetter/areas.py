@@ -0,0 +1,88 @@
+"""Classificação de área (Backend, Frontend, QA, ...) a partir do Resumo.
+
+As regras ficam em ``config/areas.json``. Cada área vira um grupo de uma
+única regex compilada; a área escolhida é a primeira da lista que tiver
+alguma tag no texto (mesma prioridade da regra original). A classificação é
+feita uma vez por Resumo distinto, já que subtarefas repetem muito o título.
+"""
+import hashlib
+import json
+import re
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+RULES_PATH = Path(__file__).resolve().parent.parent / "config" / "areas.json"
+
+
+def _compile(tags):
+    return '|'.join(re.escape(tag) for tag in tags)
+
+
+@lru_cache(maxsize=4)
+def _load_rules(path, mtime_ns):
+    rules = json.loads(Path(path).read_text(encoding='utf-8'))
+
+    areas = [regra['area'] for regra in rules['areas']]
+    # Um grupo por área, na ordem de prioridade do arquivo
+    pattern = re.compile(
+        '|'.join(f"({_compile(regra['tags'])})" for regra in rules['areas']),
+        re.IGNORECASE
+    )
+    secondary = [
+        (regra['coluna'], re.compile(_compile(regra['tags']), re.IGNORECASE))
+        for regra in rules.get('secondary_tags', [])
+    ]
+    fingerprint = hashlib.sha1(Path(path).read_bytes()).hexdigest()[:8]
+
+    return areas, rules.get('default', 'Outros'), pattern, secondary, fingerprint
+
+
+def load_rules(path=RULES_PATH):
+    """Regras compiladas; recarregadas automaticamente se o arquivo mudar."""
+    return _load_rules(str(path), Path(path).stat().st_mtime_ns)
+
+
+def rules_fingerprint(path=RULES_PATH):
+    return load_rules(path)[4]
+
+
+def _first_area(texto, pattern):
+    # Menor índice de grupo encontrado = área de maior prioridade
+    melhor = None
+    for match in pattern.finditer(texto):
+        if melhor is None or match.lastindex < melhor:
+            melhor = match.lastindex
+            if melhor == 1:
+                break
+    return melhor
+
+
+def classify_areas(resumos, path=RULES_PATH):
+    """Área de cada Resumo da coluna."""
+    areas, default, pattern, _, _ = load_rules(path)
+
+    codigos, unicos = pd.factorize(resumos.astype(str))
+    grupos = [_first_area(texto, pattern) for texto in unicos]
+
+    # Posição 0 = área padrão, posição i = grupo i da regex
+    nomes = np.array([default] + areas, dtype=object)
+    indices = np.array([grupo or 0 for grupo in grupos], dtype=np.intp)
+
+    return pd.Series(nomes[indices][codigos], index=resumos.index, name='Area')
+
+
+def extract_tags(resumos, path=RULES_PATH):
+    """Colunas booleanas para as tags secundárias (ex: ``[Endpoint]``)."""
+    _, _, _, secondary, _ = load_rules(path)
+
+    codigos, unicos = pd.factorize(resumos.astype(str))
+    tags = {}
+    for coluna, pattern in secondary:
+        encontrada = np.fromiter((pattern.search(texto) is not None for texto in unicos),
+                                 dtype=bool, count=len(unicos))
+        tags[coluna] = encontrada[codigos]
+
+    return pd.DataFrame(tags, index=resumos.index)
@@ -0,0 +1,100 @@
+"""Cache em disco (Arrow/Feather) dos dados já processados.
+
+O arquivo de cache fica em ``.cache/`` ao lado de ``data/`` e é identificado
+pelo nome do CSV, pela impressão digital do arquivo (mtime + tamanho), pela
+versão do esquema e pelas regras de área. Qualquer mudança no CSV ou no
+processamento gera uma nova chave, e os caches antigos do mesmo arquivo são removidos.
+"""
+import glob
+import json
+import os
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from twobetter import areas
+from twobetter.schema import arrow_types_mapper
+
+CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache"
+
+# Incrementar sempre que o processamento do CSV mudar
+SCHEMA_VERSION = 4
+
+_ATTRS_KEY = b'twobetter.attrs'
+
+
+def file_fingerprint(file_path):
+    """Impressão digital barata do arquivo: mtime em ns + tamanho."""
+    stat = Path(file_path).stat()
+    return f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+
+
+def schema_key():
+    """Versão do processamento: esquema + regras de classificação de área."""
+    return f"v{SCHEMA_VERSION}-{areas.rules_fingerprint()}"
+
+
+def cache_path(file_path, fingerprint=None):
+    file_path = Path(file_path)
+    fingerprint = fingerprint or file_fingerprint(file_path)
+    return CACHE_DIR / f"{file_path.stem}.{fingerprint}.{schema_key()}.feather"
+
+
+def write_frame(df, path):
+    """Grava o DataFrame sem compressão (permite leitura via memory-map)."""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[_ATTRS_KEY] = json.dumps(df.attrs, default=str).encode('utf-8')
+    table = table.replace_schema_metadata(metadata)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + f".{os.getpid()}.tmp")
+    feather.write_feather(table, tmp_path, compression='uncompressed')
+    os.replace(tmp_path, path)
+
+
+def read_frame(path):
+    """Lê o frame via memory-map; colunas sem nulos não são copiadas."""
+    table = feather.read_table(path, memory_map=True)
+    df = table.to_pandas(types_mapper=arrow_types_mapper)
+    attrs = (table.schema.metadata or {}).get(_ATTRS_KEY)
+    if attrs:
+        df.attrs.update(json.loads(attrs))
+    return df
+
+
+def _remove_stale(file_path, keep):
+    # Nome exato <stem>.<impressão digital>.<versão>.feather: o glob sozinho também
+    # pegaria caches de outro arquivo cujo nome começa igual (ex: "dados" e "dados.v2")
+    stem = Path(file_path).stem
+    for antigo in CACHE_DIR.glob(f"{glob.escape(stem)}.*.feather"):
+        if antigo != keep and antigo.name[:-len(".feather")].rsplit('.', 2)[0] == stem:
+            antigo.unlink(missing_ok=True)
+
+
+def load_or_build(file_path, build, fingerprint=None):
+    """Lê o frame processado do cache em disco ou o constrói com ``build``.
+
+    ``build(file_path)`` só é chamado quando não há cache válido. Erros de
+    escrita (ex: disco somente leitura) não impedem o carregamento.
+    """
+    path = cache_path(file_path, fingerprint)
+
+    if path.exists():
+        try:
+            return read_frame(path)
+        except (OSError, pa.ArrowException):
+            path.unlink(missing_ok=True)
+
+    df = build(file_path)
+
+    # Relê do arquivo recém-gravado: as colunas passam a apontar para os
+    # buffers (somente leitura) do memory-map em vez de memória do processo
+    try:
+        write_frame(df, path)
+        _remove_stale(file_path, keep=path)
+        return read_frame(path)
+    except (OSError, pa.ArrowException):
+        return df
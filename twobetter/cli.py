@@ -0,0 +1,220 @@
+"""CLI para calcular os indicadores do dashboard sem abrir o Streamlit.
+
+Exemplos (na raiz do projeto):
+    python -m twobetter jira --format json --output snapshot.json
+    python -m twobetter jira --csv data/dados_jira.csv --responsavel "Caio Alves" --granularidade Mês
+    python -m twobetter jira --incremental --format parquet --output snapshots/jira
+    python -m twobetter jira --fluxo --status "Concluído"
+    python -m twobetter jira --backend sql --responsavel "Caio Alves"
+    python -m twobetter jira --projeto SCRUM --projeto MOBILE --inicio 2025-06-01
+    python -m twobetter okr --foco "Desenvolvimento MVP"
+    python -m twobetter okr --trimestre "Q1 2026"
+    python -m twobetter okr --jira
+    python -m twobetter snapshot
+
+Em JSON, todas as tabelas vão em um único arquivo (ou na saída padrão). Em
+Parquet, ``--output`` é uma pasta com um arquivo por tabela.
+"""
+import argparse
+import json
+import sys
+from datetime import date, datetime, timedelta
+from functools import partial
+from pathlib import Path
+
+import pandas as pd
+
+from twobetter import data
+from twobetter import okr_loader
+from twobetter.cube import GRANULARIDADES
+from twobetter.linkage import progress_table, weighted_progress
+from twobetter.okr import filter_okr, okr_snapshot
+
+
+def _to_json(tabelas):
+    saida = {}
+    for nome, tabela in tabelas.items():
+        if isinstance(tabela, pd.DataFrame):
+            saida[nome] = json.loads(tabela.to_json(orient='records', date_format='iso', force_ascii=False))
+        else:
+            saida[nome] = tabela
+    return json.dumps(saida, ensure_ascii=False, indent=2, default=str)
+
+
+def write_output(tabelas, formato, output):
+    if formato == 'json':
+        texto = _to_json(tabelas)
+        if output:
+            Path(output).write_text(texto, encoding='utf-8')
+        else:
+            sys.stdout.write(texto + '\n')
+        return
+
+    if not output:
+        raise SystemExit("--output (pasta) é obrigatório no formato parquet")
+    pasta = Path(output)
+    pasta.mkdir(parents=True, exist_ok=True)
+    for nome, tabela in tabelas.items():
+        if not isinstance(tabela, pd.DataFrame):
+            tabela = pd.DataFrame([tabela])
+        tabela.to_parquet(pasta / f"{nome}.parquet", index=False)
+
+
+def run_jira(args):
+    csv_file = Path(args.csv) if args.csv else data.get_latest_csv()
+    if csv_file is None:
+        raise SystemExit(f"Nenhum arquivo CSV encontrado em {data.DATA_DIR}")
+
+    key = data.dataset_key(csv_file, incremental=args.incremental)
+    if args.projeto:
+        # Só as partições dos projetos e do período são lidas
+        store = data.partition_store(key, load=partial(data.load_jira, key, workers=args.workers))
+        if store is None:
+            raise SystemExit("Não foi possível gravar as partições em .cache/partitions")
+        desconhecidos = set(args.projeto) - set(store.manifest.projects())
+        if desconhecidos:
+            raise SystemExit(f"Projeto {', '.join(sorted(desconhecidos))} não encontrado "
+                             f"(disponíveis: {', '.join(store.manifest.projects())})")
+        inicio, fim = store.manifest.date_bounds(args.projeto)
+    else:
+        dataset = data.Dataset(data.load_jira(key, workers=args.workers), key, backend=args.backend)
+        inicio, fim = dataset.index.date_bounds()
+
+    periodo = None
+    if args.inicio or args.fim:
+        if inicio is None and not (args.inicio and args.fim):
+            raise SystemExit("Nenhuma tarefa com data de criação no recorte: "
+                             "informe --inicio e --fim juntos ou remova o filtro de período")
+        periodo = (args.inicio or inicio.date(), args.fim or fim.date())
+    if args.projeto:
+        # Período sem tarefas: lê os projetos inteiros e o filtro do índice devolve vazio
+        particoes = store.manifest.select(args.projeto, periodo) or store.manifest.select(args.projeto)
+        dataset = data.load_partitions(key, particoes, store, args.backend)
+
+    filtros = data.jira_filters(periodo, args.responsavel, args.status, args.tipo)
+    recent_date = datetime.now() - timedelta(days=7)
+    tabelas = dataset.snapshot(filtros, recent_date, args.granularidade)
+
+    if args.fluxo:
+        changelog_dir = Path(args.changelog) if args.changelog else data.CHANGELOG_DIR
+        log = data.load_flow(changelog_dir)
+        if log is None:
+            raise SystemExit(f"Nenhum histórico de status encontrado em {changelog_dir}")
+        fluxo = dataset.flow_stats(log, dataset.mask(filtros))
+        tabelas['kpis']['fluxo'] = {
+            'issues': fluxo.issues,
+            'concluidas': fluxo.concluidas,
+            'em_andamento': fluxo.em_andamento,
+            'cycle_time_dias': {f"p{p}": v for p, v in fluxo.cycle_time.items()},
+            'lead_time_dias': {f"p{p}": v for p, v in fluxo.lead_time.items()},
+        }
+        tabelas['throughput'] = fluxo.throughput
+        tabelas['wip'] = fluxo.wip
+        tabelas['fluxo_cumulativo'] = fluxo.cumulative_flow.reset_index()
+    return tabelas
+
+
+def run_okr(args):
+    if args.xlsx:
+        trimestres = okr_loader.merge_quarters([data.load_okr_quarters(args.xlsx)])
+    else:
+        trimestres = data.okr_quarters()
+    if not trimestres:
+        raise SystemExit("Arquivo de OKRs não encontrado")
+
+    trimestre = args.trimestre or next(iter(trimestres))
+    if trimestre not in trimestres:
+        raise SystemExit(f"Trimestre {trimestre} não encontrado (disponíveis: {', '.join(trimestres)})")
+    df = trimestres[trimestre]
+
+    df = filter_okr(df, Foco=args.foco, Status=args.status,
+                    Prioridade=args.prioridade, Responsavel=args.responsavel)
+    tabelas = okr_snapshot(df)
+
+    if args.jira:
+        csv_file = data.get_latest_csv()
+        if csv_file is None:
+            raise SystemExit(f"Nenhum arquivo CSV encontrado em {data.DATA_DIR}")
+        key = data.dataset_key(csv_file, incremental=args.incremental)
+        progresso = data.Dataset(data.load_jira(key), key).okr_progress(df)
+        progresso_geral, cobertura = weighted_progress(progresso)
+        tabelas['kpis']['progresso_jira'] = None if progresso_geral is None else round(progresso_geral, 4)
+        tabelas['kpis']['peso_coberto_jira'] = round(cobertura, 4)
+        tabelas['progresso_jira'] = progress_table(progresso)
+    return tabelas
+
+
+def run_snapshot(args):
+    catalogo = data.current_catalog()
+    csv_entry = catalogo.latest_csv
+    if csv_entry is None:
+        raise SystemExit(f"Nenhum arquivo CSV encontrado em {data.DATA_DIR}")
+
+    key = catalogo.jira_key()
+    dataset = data.Dataset(data.load_jira(key), key)
+    trimestres = okr_loader.merge_quarters(
+        data.load_okr_quarters(entry.path, entry.fingerprint) for entry in catalogo.okr_files
+    )
+    path = data.save_snapshot(catalogo, dataset, trimestres, force=True)
+    return {'snapshot': {
+        'arquivo': str(path),
+        'csv': csv_entry.path.name,
+        'linhas': len(dataset.df),
+        'trimestres': list(trimestres),
+    }}
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python -m twobetter', description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest='comando', required=True)
+
+    jira = subparsers.add_parser('jira', help="KPIs, desempenho por dev e timeline do Jira")
+    jira.add_argument('--csv', help="CSV exportado do Jira (padrão: o mais recente em data/)")
+    jira.add_argument('--incremental', action='store_true', help="mescla todos os CSVs da pasta")
+    jira.add_argument('--workers', type=int,
+                      help="processos para ler CSVs grandes (padrão: TWOBETTER_WORKERS ou núcleos)")
+    jira.add_argument('--projeto', action='append', type=str.upper,
+                      help="prefixo da chave (ex: SCRUM); repetível. Lê só as partições do recorte")
+    jira.add_argument('--inicio', type=date.fromisoformat, help="data inicial (AAAA-MM-DD)")
+    jira.add_argument('--fim', type=date.fromisoformat, help="data final (AAAA-MM-DD)")
+    jira.add_argument('--responsavel')
+    jira.add_argument('--status')
+    jira.add_argument('--tipo')
+    jira.add_argument('--granularidade', choices=list(GRANULARIDADES), default='Semana')
+    jira.add_argument('--backend', choices=list(data.BACKENDS),
+                      help="onde calcular filtros e agregações (padrão: TWOBETTER_BACKEND ou pandas)")
+    jira.add_argument('--fluxo', action='store_true',
+                      help="inclui cycle/lead time, throughput, WIP e fluxo cumulativo (data/changelog/)")
+    jira.add_argument('--changelog', help="pasta com o histórico de status (padrão: data/changelog/)")
+    jira.set_defaults(func=run_jira)
+
+    okr = subparsers.add_parser('okr', help="indicadores da planilha de OKRs")
+    okr.add_argument('--xlsx', help="planilha de OKRs (padrão: todas as da pasta okr/)")
+    okr.add_argument('--trimestre', help="ex: 'Q1 2026' (padrão: o mais recente)")
+    okr.add_argument('--foco')
+    okr.add_argument('--status')
+    okr.add_argument('--prioridade')
+    okr.add_argument('--responsavel')
+    okr.add_argument('--jira', action='store_true',
+                     help="inclui o progresso das metas pelas tarefas do Jira (config/okr_links.json)")
+    okr.add_argument('--incremental', action='store_true', help="com --jira, mescla todos os CSVs da pasta")
+    okr.set_defaults(func=run_okr)
+
+    snapshot = subparsers.add_parser('snapshot', help="pré-calcula a visão padrão para a primeira pintura do app")
+    snapshot.set_defaults(func=run_snapshot)
+
+    for sub in (jira, okr, snapshot):
+        sub.add_argument('--format', choices=['json', 'parquet'], default='json')
+        sub.add_argument('--output', help="arquivo JSON ou pasta Parquet (padrão JSON: saída padrão)")
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    write_output(args.func(args), args.format, args.output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""Cubo de contagens pré-agregado para gráficos de tendência.
+
+O cubo guarda a quantidade de tarefas por dia de criação × Status ×
+Responsável × Tipo × Área, com os rótulos de semana e mês já calculados.
+Tarefas sem data de criação ou com dimensões vazias também entram no cubo
+(com rótulos nulos), para que os totais batam com os dados originais.
+Qualquer timeline, com qualquer combinação de filtros, vira um recorte e uma
+soma sobre o cubo, que tem bem menos linhas que os dados originais.
+"""
+import hashlib
+from datetime import timedelta
+
+import pandas as pd
+import pyarrow as pa
+
+from twobetter import cache as disk_cache
+from twobetter.schema import to_categoricals
+
+CUBE_DIR = disk_cache.CACHE_DIR / "cubes"
+
+# Quantidade de cubos mantidos em disco (os mais recentes)
+MAX_CUBES = 8
+
+# Incrementar sempre que o formato do cubo mudar
+CUBE_VERSION = 2
+
+DIMENSIONS = ['Status', 'Responsavel', 'Tipo', 'Area']
+
+# Granularidade -> coluna de rótulo no cubo
+GRANULARIDADES = {'Dia': 'Dia', 'Semana': 'Semana', 'Mês': 'Mes'}
+
+
+def build_cube(df):
+    dias = df['Criado'].dt.floor('D').rename('Data')
+    cube = (
+        df[DIMENSIONS].assign(Data=dias)
+        .groupby(['Data'] + DIMENSIONS, observed=True, dropna=False)
+        .size()
+        .reset_index(name='Quantidade')
+    )
+    cube = cube[cube['Quantidade'] > 0].reset_index(drop=True)
+
+    # Rótulos iguais aos usados na timeline original (to_period().astype(str))
+    cube['Dia'] = cube['Data'].dt.strftime('%Y-%m-%d').astype('category')
+    cube['Semana'] = cube['Data'].dt.to_period('W').astype(str).astype('category')
+    cube['Mes'] = cube['Data'].dt.to_period('M').astype(str).astype('category')
+
+    return to_categoricals(cube, DIMENSIONS)
+
+
+def cube_path(dataset_key):
+    chave = hashlib.sha1(repr((dataset_key, CUBE_VERSION)).encode('utf-8')).hexdigest()[:16]
+    return CUBE_DIR / f"{chave}.feather"
+
+
+def _prune():
+    cubos = sorted(CUBE_DIR.glob("*.feather"), key=lambda f: f.stat().st_mtime, reverse=True)
+    for antigo in cubos[MAX_CUBES:]:
+        antigo.unlink(missing_ok=True)
+
+
+def load_or_build_cube(df, dataset_key):
+    """Lê o cubo salvo para ``dataset_key`` ou o constrói a partir de ``df``."""
+    path = cube_path(dataset_key)
+
+    if path.exists():
+        try:
+            return disk_cache.read_frame(path)
+        except (OSError, pa.ArrowException):
+            path.unlink(missing_ok=True)
+
+    cube = build_cube(df)
+
+    try:
+        disk_cache.write_frame(cube, path)
+        _prune()
+    except (OSError, pa.ArrowException):
+        pass
+
+    return cube
+
+
+def timeline(cube, granularidade='Semana', periodo=None, **filtros):
+    """Quantidade por (período, Status) para os filtros ativos.
+
+    ``periodo`` é um par de datas (inclusive) e filtros com valor ``None``
+    são ignorados, como em ``FilterIndex.select``. Tarefas sem data de
+    criação ou sem Status não têm barra na timeline (como no backend SQL).
+    """
+    coluna = GRANULARIDADES[granularidade]
+
+    mask = pd.Series(True, index=cube.index)
+    if periodo:
+        inicio, fim = pd.Timestamp(periodo[0]), pd.Timestamp(periodo[1]) + timedelta(days=1)
+        mask &= (cube['Data'] >= inicio) & (cube['Data'] < fim)
+    for dimensao, valor in filtros.items():
+        if valor is not None:
+            mask &= cube[dimensao] == valor
+
+    return (
+        cube[mask]
+        .groupby([coluna, 'Status'], observed=True, dropna=True)['Quantidade']
+        .sum()
+        .reset_index()
+        .rename(columns={coluna: 'Periodo'})
+    )
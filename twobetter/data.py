@@ -0,0 +1,368 @@
+"""Localização e carregamento dos dados do dashboard, sem Streamlit.
+
+``Dataset`` junta o frame do Jira com as estruturas derivadas (índice de
+filtros, agregador, cubo, tabela de detalhes e vínculo com os OKRs), criadas
+sob demanda. É o que o app e a CLI usam para calcular KPIs, desempenho por
+dev, timelines, o progresso das metas e, com o changelog em
+``data/changelog/``, as métricas de fluxo.
+
+No app, um mesmo ``Dataset`` é compartilhado por todas as sessões: ele é
+somente leitura (o pandas com Copy-on-Write garante que recortes e colunas
+derivadas nunca alteram o frame original) e cada estrutura derivada é
+construída uma única vez, mesmo com várias sessões pedindo ao mesmo tempo.
+
+A camada do Jira (leitura do CSV, índice, agregador, cubo, banco SQL,
+tabela, fluxo, partições) é importada dentro das funções que a usam: a
+página de OKRs usa este módulo só para planilhas e snapshot e não paga a
+importação do resto.
+"""
+import os
+import threading
+from datetime import datetime, timedelta
+from functools import partial, wraps
+from pathlib import Path
+
+import pandas as pd
+
+from twobetter import cache as disk_cache
+from twobetter import okr_loader
+from twobetter import snapshot
+from twobetter.linkage import load_link_rules
+from twobetter.watcher import CSV_PATTERN, OKR_PATTERN, Catalog, DataWatcher, scan_folder
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+DATA_DIR = BASE_DIR / "data"
+OKR_DIR = BASE_DIR / "okr"
+OKR_PATH = OKR_DIR / "OKRs_TwoBetter_Q1_2026.xlsx"
+CHANGELOG_DIR = DATA_DIR / "changelog"
+
+# Onde rodam filtros e agregações: 'pandas' (em memória) ou 'sql' (banco embutido, ver ``sqlstore``)
+BACKENDS = ('pandas', 'sql')
+BACKEND = os.environ.get('TWOBETTER_BACKEND', 'pandas')
+
+
+# Função para encontrar o CSV mais recente na pasta data
+def get_latest_csv(data_dir=DATA_DIR):
+    data_dir = Path(data_dir)
+
+    if not data_dir.exists():
+        return None
+
+    csv_files = list(data_dir.glob("*.csv"))
+
+    if not csv_files:
+        return None
+
+    # Retorna o mais recente por data de modificação
+    latest_file = max(csv_files, key=lambda x: x.stat().st_mtime)
+    return latest_file
+
+
+def dataset_key(csv_file, incremental=False):
+    """Chave que identifica o conjunto de dados e muda quando ele muda.
+
+    No modo incremental a chave é a pasta do CSV com a impressão digital de
+    todos os arquivos dela.
+    """
+    csv_file = Path(csv_file)
+    if incremental:
+        from twobetter import ingest
+        files = ingest.list_csv_files(csv_file.parent)
+        return (csv_file.parent, ingest.files_fingerprint(files), disk_cache.schema_key())
+    return (csv_file, disk_cache.file_fingerprint(csv_file), disk_cache.schema_key())
+
+
+def load_jira(key, workers=None):
+    """Frame processado para a chave de ``dataset_key`` (usa os caches em disco).
+
+    CSVs grandes, ou vários pendentes no modo incremental, são lidos em um
+    pool de ``workers`` processos (padrão: ``TWOBETTER_WORKERS`` ou núcleos).
+    """
+    from twobetter import ingest, parallel
+    from twobetter.jira import read_jira_csv
+
+    path, fingerprint, _ = key
+    if path.is_dir():
+        return ingest.load_incremental(
+            path, read_jira_csv, build_many=partial(parallel.read_jira_csvs, workers=workers)
+        )
+    return disk_cache.load_or_build(
+        path, partial(parallel.read_jira_csv_parallel, workers=workers), fingerprint
+    )
+
+
+def load_okr_quarters(okr_path, fingerprint=None):
+    """Trimestres de uma planilha de OKR -> frame (ver ``okr_loader``)."""
+    okr_path = Path(okr_path)
+
+    if not okr_path.exists():
+        return {}
+
+    return okr_loader.load_workbook_quarters(okr_path, fingerprint)
+
+
+def okr_quarters(okr_dir=OKR_DIR):
+    """Trimestres de todas as planilhas da pasta, do mais recente ao mais antigo."""
+    planilhas = scan_folder(okr_dir, OKR_PATTERN)
+    return okr_loader.merge_quarters(load_okr_quarters(e.path, e.fingerprint) for e in planilhas)
+
+
+# Função para carregar dados de OKR
+def load_okr_data(okr_path=OKR_PATH, trimestre=None):
+    """Frame de um trimestre da planilha (padrão: o mais recente)."""
+    trimestres = okr_loader.merge_quarters([load_okr_quarters(okr_path)])
+
+    if not trimestres:
+        return None
+
+    return trimestres.get(trimestre) if trimestre else next(iter(trimestres.values()))
+
+
+def flow_files_key(changelog_dir=CHANGELOG_DIR):
+    """Chave dos arquivos de changelog (``None`` sem nenhum): muda com qualquer arquivo novo ou alterado."""
+    from twobetter import flow
+    arquivos = flow.list_changelog_files(changelog_dir)
+    if not arquivos:
+        return None
+    fingerprint = tuple((f.name, disk_cache.file_fingerprint(f)) for f in arquivos)
+    return (Path(changelog_dir), fingerprint, flow.flow_key())
+
+
+def load_flow(changelog_dir=CHANGELOG_DIR):
+    """Histórico de status da pasta de changelog (ver ``flow``), ou ``None``."""
+    from twobetter import flow
+    return flow.load_flow_log(changelog_dir)
+
+
+def open_partitions(key):
+    """Partições por projeto e mês já gravadas para a chave de ``dataset_key``, ou ``None``."""
+    from twobetter import partitions
+    return partitions.PartitionStore.open(key)
+
+
+def partition_store(key, load=None):
+    """Partições da chave, gravadas a partir de ``load()`` (padrão: ``load_jira``) se preciso."""
+    from twobetter import partitions
+    return partitions.PartitionStore.open_or_build(key, load or partial(load_jira, key))
+
+
+def partition_key(key, particoes):
+    """Chave do recorte (caches de cubo e banco SQL separados do dataset completo)."""
+    return ('particoes', key, tuple(p.nome for p in particoes))
+
+
+def load_partitions(key, particoes, store=None, backend=None):
+    """Dataset só com as tarefas das partições escolhidas (lidas via memory-map)."""
+    store = store or partition_store(key)
+    return Dataset(store.read(particoes), partition_key(key, particoes), backend=backend)
+
+
+def current_catalog(data_dir=DATA_DIR, okr_dir=OKR_DIR):
+    """Catálogo das pastas agora (o app usa o mantido pelo observador)."""
+    return Catalog(Path(data_dir), scan_folder(data_dir, CSV_PATTERN), scan_folder(okr_dir, OKR_PATTERN))
+
+
+def snapshot_key(catalogo):
+    """Chave do snapshot da visão padrão (arquivo único), ou ``None`` sem CSV."""
+    jira_key = catalogo.jira_key()
+    if jira_key is None:
+        return None
+    okr_key = tuple((entry.path.name, entry.fingerprint) for entry in catalogo.okr_files)
+    return snapshot.snapshot_key(jira_key, okr_key, load_link_rules().fingerprint)
+
+
+def save_snapshot(catalogo, dataset, trimestres, force=False):
+    """Grava o snapshot da visão padrão, se ainda não houver um para esses dados.
+
+    Retorna o caminho gravado ou ``None``.
+    """
+    key = snapshot_key(catalogo)
+    if key is None or (not force and snapshot.snapshot_path(key).exists()):
+        return None
+
+    inicio, fim = dataset.index.date_bounds()
+    filtros = jira_filters((inicio.date(), fim.date()) if inicio is not None else None)
+    # Mesma janela de atividade recente do app
+    recent_date = (datetime.now() - timedelta(days=7)).replace(second=0, microsecond=0)
+    resumo = snapshot.build_snapshot(key, dataset, filtros, recent_date, trimestres, load_link_rules())
+    return snapshot.write_snapshot(resumo)
+
+
+def watch(get_dataset=None, get_okr=None, data_dir=DATA_DIR, okr_dir=OKR_DIR):
+    """Inicia o observador das pastas, que mantém o catálogo e os datasets aquecidos.
+
+    ``get_dataset(key)``/``get_okr(path, fingerprint)`` são os carregadores com
+    cache compartilhado do app; sem eles, cada chamada carrega de novo. A cada
+    versão publicada, o snapshot da visão padrão e as partições por projeto e
+    mês são gravados (ver ``snapshot`` e ``partitions``).
+    """
+    if get_dataset is None:
+        def get_dataset(key):
+            return Dataset(load_jira(key), key)
+    if get_okr is None:
+        get_okr = load_okr_quarters
+
+    def on_publish(catalogo, datasets, okr):
+        dataset = datasets.get(catalogo.jira_key())
+        if dataset is not None:
+            trimestres = okr_loader.merge_quarters(okr[entry] for entry in catalogo.okr_files)
+            save_snapshot(catalogo, dataset, trimestres)
+        # Partições de cada dataset aquecido (arquivo único e modo incremental)
+        for aquecido in datasets.values():
+            partition_store(aquecido.key, load=lambda df=aquecido.df: df)
+
+    return DataWatcher(data_dir, okr_dir, get_dataset, get_okr, on_publish=on_publish).start()
+
+
+def jira_filters(periodo=None, responsavel=None, status=None, tipo=None):
+    """Filtros no formato de ``FilterIndex.select``; 'Todos' equivale a sem filtro."""
+    def valor(v):
+        return None if v in (None, 'Todos') else v
+
+    return dict(
+        periodo=tuple(periodo) if periodo and len(periodo) == 2 else None,
+        Responsavel=valor(responsavel),
+        Status=valor(status),
+        Tipo=valor(tipo)
+    )
+
+
+def shared_property(metodo):
+    """Como ``cached_property``, mas calculada uma única vez entre threads."""
+    nome = metodo.__name__
+
+    @property
+    @wraps(metodo)
+    def propriedade(self):
+        valores = self.__dict__
+        if nome not in valores:
+            with self._lock:
+                if nome not in valores:
+                    valores[nome] = metodo(self)
+        return valores[nome]
+
+    return propriedade
+
+
+class Dataset:
+    def __init__(self, df, key=None, backend=None):
+        self.df = df
+        self.key = key
+        self.backend = backend or BACKEND
+        if self.backend not in BACKENDS:
+            raise ValueError(f"Backend desconhecido: {self.backend} (opções: {', '.join(BACKENDS)})")
+        self._lock = threading.RLock()
+
+    @shared_property
+    def index(self):
+        from twobetter.filters import FilterIndex
+        return FilterIndex(self.df)
+
+    @shared_property
+    def aggregator(self):
+        from twobetter.kpis import DashboardAggregator
+        return DashboardAggregator(self.df, self.index)
+
+    @shared_property
+    def cube(self):
+        from twobetter import cube as rollup_cube
+        if self.key is None:
+            return rollup_cube.build_cube(self.df)
+        return rollup_cube.load_or_build_cube(self.df, self.key)
+
+    @shared_property
+    def details(self):
+        from twobetter.table import DetailsTable
+        return DetailsTable(self.df)
+
+    @shared_property
+    def sql(self):
+        """Banco embutido com as contagens do dataset, ou ``None`` se não puder ser criado."""
+        from twobetter import sqlstore
+        try:
+            return sqlstore.SqlStore.open_or_build(self.df, self.key)
+        except sqlstore.SQL_ERRORS:
+            return None
+
+    @property
+    def engine(self):
+        """Onde as agregações rodam de fato: 'pandas', 'sqlite' ou 'duckdb'."""
+        if self.backend == 'sql' and self.sql is not None:
+            return self.sql.engine
+        return 'pandas'
+
+    def warm(self):
+        """Constrói as estruturas derivadas usadas pelo backend (observador em segundo plano)."""
+        estruturas = ['index', 'details']
+        estruturas += ['sql'] if self.backend == 'sql' else ['aggregator', 'cube']
+        for estrutura in estruturas:
+            getattr(self, estrutura)
+        return self
+
+    @shared_property
+    def linker(self):
+        from twobetter.linkage import IssueLinker
+        return IssueLinker(self.df, self.index, self.details)
+
+    def okr_progress(self, df_okr, regras=None):
+        """Progresso de cada meta de OKR pelas tarefas vinculadas (ver ``linkage``)."""
+        return self.linker.progress(df_okr, regras or load_link_rules())
+
+    @shared_property
+    def created(self):
+        """Data de criação por chave, para o lead time e o fluxo cumulativo."""
+        criado = pd.Series(self.df['Criado'].to_numpy(), index=self.df['Chave'].astype(str), name='Criado')
+        return criado[~criado.index.duplicated()]
+
+    def flow_stats(self, log, mask=None, agora=None):
+        """Métricas de fluxo das tarefas selecionadas (todas, sem ``mask``)."""
+        from twobetter import flow
+        chaves = self.df['Chave'] if mask is None else self.df['Chave'][mask]
+        return flow.compute_flow_stats(log, chaves.astype(str), self.created, agora)
+
+    def mask(self, filtros):
+        return self.index.select(**filtros)
+
+    def _sql_failed(self):
+        """Banco inutilizável (ex: arquivo removido): as próximas consultas vão ao pandas."""
+        with self._lock:
+            self.__dict__['sql'] = None
+
+    def stats(self, filtros, recent_date, mask=None):
+        if self.engine != 'pandas':
+            from twobetter import sqlstore
+            try:
+                return self.sql.stats(filtros, recent_date)
+            except sqlstore.SQL_ERRORS:
+                self._sql_failed()
+        return self.aggregator.compute(self.mask(filtros) if mask is None else mask, recent_date)
+
+    def timeline(self, filtros, granularidade='Semana'):
+        from twobetter import cube as rollup_cube
+        if self.engine != 'pandas':
+            from twobetter import sqlstore
+            try:
+                return self.sql.timeline(filtros, granularidade)
+            except sqlstore.SQL_ERRORS:
+                self._sql_failed()
+        return rollup_cube.timeline(self.cube, granularidade, **filtros)
+
+    def snapshot(self, filtros, recent_date, granularidade='Semana'):
+        """KPIs, distribuições, desempenho por dev e timeline em tabelas simples."""
+        stats = self.stats(filtros, recent_date)
+
+        return {
+            'kpis': {
+                'total': stats.total,
+                'concluidas': stats.concluidas,
+                'em_andamento': stats.em_andamento,
+                'pendentes': stats.pendentes,
+                'devs_ativos': stats.devs_ativos,
+                'taxa_conclusao': round(stats.taxa_conclusao, 2),
+            },
+            'status_counts': stats.status_counts.rename('Quantidade').reset_index(),
+            'area_counts': stats.area_counts.rename('Quantidade').reset_index(),
+            'dev_stats': stats.dev_stats.sort_values('Total', ascending=False).reset_index(),
+            'recent_activity': stats.recent_summary,
+            'timeline': self.timeline(filtros, granularidade),
+        }
@@ -0,0 +1,48 @@
+"""Conversão vetorizada das datas exportadas pelo Jira em PT-BR."""
+import numpy as np
+import pandas as pd
+
+# Formato usado pelo Jira na exportação CSV, ex: "05/jan/26 6:54 PM".
+# O mês é trocado pelo número antes da conversão para não depender do locale.
+JIRA_DATE_FORMAT = '%d/%m/%y %I:%M %p'
+
+# Abreviações de mês em PT-BR (e EN, para exportações em inglês) -> número
+MESES = {
+    'jan': '01', 'fev': '02', 'mar': '03', 'abr': '04',
+    'mai': '05', 'jun': '06', 'jul': '07', 'ago': '08',
+    'set': '09', 'out': '10', 'nov': '11', 'dez': '12',
+    'feb': '02', 'apr': '04', 'may': '05', 'aug': '08',
+    'sep': '09', 'oct': '10', 'dec': '12',
+}
+
+
+def parse_jira_dates(valores):
+    """Converte uma coluna inteira de datas do Jira.
+
+    Cada texto distinto é convertido uma única vez: o mês é mapeado em uma
+    passada vetorizada e tudo passa por um único ``to_datetime``.
+
+    Retorna ``(datas, invalidas)``, onde ``invalidas`` traz os textos
+    originais (não vazios) que não puderam ser convertidos.
+    """
+    # Código -1 (vazio) aponta para o último elemento das tabelas abaixo
+    codigos, unicos = pd.factorize(valores)
+    texto = pd.Series(unicos, dtype='string').str.strip()
+
+    partes = texto.str.split('/', n=2, expand=True)
+    if partes.shape[1] == 3:
+        mes = partes[1].str.lower().map(MESES).astype('string')
+        normalizado = partes[0] + '/' + mes + '/' + partes[2]
+    else:
+        normalizado = pd.Series(pd.NA, index=texto.index, dtype='string')
+
+    convertidos = pd.to_datetime(normalizado, format=JIRA_DATE_FORMAT, errors='coerce')
+    falhou = (convertidos.isna() & texto.ne('')).to_numpy(dtype=bool, na_value=False)
+
+    tabela_datas = np.append(convertidos.to_numpy(dtype='datetime64[ns]'), np.datetime64('NaT', 'ns'))
+    tabela_falhas = np.append(falhou, False)
+
+    datas = pd.Series(tabela_datas[codigos], index=valores.index, name=valores.name)
+    invalidas = valores[tabela_falhas[codigos]]
+
+    return datas, invalidas
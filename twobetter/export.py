@@ -0,0 +1,67 @@
+"""Exportação dos dados filtrados em CSV, Parquet ou XLSX.
+
+O arquivo é escrito em blocos de ``CHUNK_ROWS`` linhas para um arquivo
+temporário (em memória até ``SPOOL_BYTES``, depois em disco), então o pico
+de memória da escrita não cresce com o tamanho da exportação. O conteúdo
+final ainda é lido inteiro por ``export_bytes`` (o ``st.download_button``
+precisa dos bytes), mas só no clique: o app passa uma função ao botão em vez
+de gerar e guardar o arquivo a cada rerun.
+"""
+import tempfile
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+CHUNK_ROWS = 50_000
+SPOOL_BYTES = 16 * 1024 * 1024
+
+# Formato -> (extensão, MIME)
+FORMATOS = {
+    'CSV': ('csv', 'text/csv'),
+    'Parquet': ('parquet', 'application/vnd.apache.parquet'),
+    'Excel (XLSX)': ('xlsx', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'),
+}
+
+
+def _chunks(df):
+    for inicio in range(0, len(df), CHUNK_ROWS):
+        yield df.iloc[inicio:inicio + CHUNK_ROWS]
+
+
+def write_csv(df, destino):
+    # BOM + cabeçalho, como o antigo to_csv().encode('utf-8-sig')
+    destino.write(df.iloc[:0].to_csv(index=False).encode('utf-8-sig'))
+    for chunk in _chunks(df):
+        destino.write(chunk.to_csv(index=False, header=False).encode('utf-8'))
+
+
+def write_parquet(df, destino):
+    schema = pa.Schema.from_pandas(df, preserve_index=False)
+    with pq.ParquetWriter(destino, schema) as writer:
+        for chunk in _chunks(df):
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+
+
+def write_xlsx(df, destino, sheet_name='Dados'):
+    from openpyxl import Workbook
+
+    # write_only: as linhas vão direto para o arquivo, sem montar a planilha em memória
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(sheet_name)
+    sheet.append([str(coluna) for coluna in df.columns])
+    for chunk in _chunks(df):
+        valores = chunk.astype(object).where(chunk.notna(), None)
+        for linha in valores.itertuples(index=False, name=None):
+            sheet.append(linha)
+    workbook.save(destino)
+
+
+_WRITERS = {'CSV': write_csv, 'Parquet': write_parquet, 'Excel (XLSX)': write_xlsx}
+
+
+def export_bytes(df, formato):
+    """Conteúdo do arquivo exportado no ``formato`` pedido (chave de ``FORMATOS``)."""
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_BYTES) as destino:
+        _WRITERS[formato](df, destino)
+        destino.seek(0)
+        return destino.read()
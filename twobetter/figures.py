@@ -0,0 +1,101 @@
+"""Memoização das figuras Plotly pelo conteúdo dos agregados que as alimentam.
+
+Os gráficos são montados a partir de tabelas pequenas (contagens por status,
+por área, por dev, a timeline já agregada...). ``FigureCache.get`` calcula o
+hash dessas entradas e, se nada mudou, devolve a figura já montada em vez de
+chamar o Plotly de novo; interações que não mexem nos dados de um gráfico
+(ex: colunas da tabela de detalhes) não refazem nenhuma figura.
+
+Junto com a figura fica o dicionário que o ``st.plotly_chart`` serializa
+(``freeze``): a cada rerun o Streamlit chama ``to_dict`` e codifica o
+resultado em JSON, e a cópia profunda do ``to_dict`` é a maior parte desse
+custo. O JSON em si não dá para reaproveitar: o ``st.plotly_chart`` não
+aceita uma especificação pronta (um ``dict`` é revalidado montando um
+``go.Figure``, o que custa mais que a cópia).
+
+O cache é limitado por ``max_entries`` e descarta a figura usada há mais
+tempo. As figuras são compartilhadas: quem as recebe só desenha, nunca altera.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from twobetter import instrument
+
+FIGURE_CACHE_ENTRIES = 256
+
+
+def content_hash(valor):
+    """Hash estável do conteúdo (valores, índice, nomes e tipos) de uma entrada."""
+    sha = hashlib.sha1()
+    if isinstance(valor, (pd.Series, pd.DataFrame)):
+        sha.update(repr((type(valor).__name__, valor.shape)).encode())
+        if isinstance(valor, pd.DataFrame):
+            sha.update(repr((list(valor.columns), [str(t) for t in valor.dtypes])).encode())
+        else:
+            sha.update(repr((valor.name, str(valor.dtype))).encode())
+        sha.update(repr((list(valor.index.names), str(valor.index.dtype))).encode())
+        sha.update(pd.util.hash_pandas_object(valor, index=True).to_numpy().tobytes())
+    elif isinstance(valor, np.ndarray):
+        sha.update(repr((valor.shape, str(valor.dtype))).encode())
+        sha.update(np.ascontiguousarray(valor).tobytes())
+    else:
+        sha.update(repr(valor).encode())
+    return sha.hexdigest()
+
+
+def freeze(figura):
+    """Guarda na figura o dicionário que ela gera, já sem ``uid`` nos traços.
+
+    ``to_dict`` passa a devolver sempre esse dicionário, sem copiar a figura;
+    por isso a figura não pode mais ser alterada.
+    """
+    spec = figura.to_dict()
+    for traco in spec.get('data', []):
+        # O plotly.io.to_json tira os uid do dicionário recebido: sem eles, nada muda
+        traco.pop('uid', None)
+    # Atributo da instância encobre o método (sem subclasse: o Plotly só é
+    # importado pelas páginas, ao montar a primeira figura)
+    object.__setattr__(figura, 'to_dict', lambda: spec)
+    return figura
+
+
+class FigureCache:
+    """Figuras por ``(nome, hash das entradas)``, com descarte LRU."""
+
+    def __init__(self, max_entries=FIGURE_CACHE_ENTRIES):
+        self.max_entries = max_entries
+        self._figuras = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._figuras)
+
+    def get(self, nome, construir, *entradas):
+        """Figura de ``construir(*entradas)``, montada (e congelada) só se as entradas mudaram."""
+        chave = (nome, tuple(content_hash(e) for e in entradas))
+        run = instrument.current_run()
+
+        with self._lock:
+            figura = self._figuras.get(chave)
+            if figura is not None:
+                self._figuras.move_to_end(chave)
+                run.cache_hits['figura'] += 1
+                return figura
+
+        run.cache_misses['figura'] += 1
+        figura = freeze(construir(*entradas))
+
+        with self._lock:
+            self._figuras[chave] = figura
+            self._figuras.move_to_end(chave)
+            while len(self._figuras) > self.max_entries:
+                self._figuras.popitem(last=False)
+        return figura
+
+    def clear(self):
+        with self._lock:
+            self._figuras.clear()
@@ -0,0 +1,85 @@
+"""Índice de filtros do Dashboard, construído uma vez por conjunto de dados.
+
+Guarda os códigos categóricos das colunas filtráveis, o ``Criado`` ordenado
+(int64) para busca binária do período e as máscaras booleanas de cada valor
+já usado. Combinar filtros vira um AND entre máscaras, sem copiar o frame.
+"""
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+
+FILTER_COLUMNS = ['Responsavel', 'Status', 'Tipo']
+
+# Colunas indexadas: as filtráveis e as usadas nas agregações
+INDEXED_COLUMNS = FILTER_COLUMNS + ['Area']
+
+_NAT = np.iinfo(np.int64).min
+
+
+class FilterIndex:
+    def __init__(self, df, columns=INDEXED_COLUMNS, date_column='Criado'):
+        self.size = len(df)
+
+        # Códigos e valores distintos de cada coluna filtrável
+        self._codes = {}
+        self._values = {}
+        for coluna in columns:
+            codigos, valores = pd.factorize(df[coluna], sort=True)
+            self._codes[coluna] = codigos
+            self._values[coluna] = {valor: i for i, valor in enumerate(valores)}
+
+        # Datas em ns ordenadas; NaT (menor int64) fica no início
+        datas = df[date_column].to_numpy(dtype='datetime64[ns]').view('i8')
+        self._order = np.argsort(datas, kind='stable')
+        self._sorted_dates = datas[self._order]
+        self._first_valid = int(np.searchsorted(self._sorted_dates, _NAT, side='right'))
+
+        self._masks = {}
+
+    def options(self, coluna):
+        """Valores distintos da coluna, em ordem alfabética."""
+        return list(self._values[coluna])
+
+    def codes(self, coluna):
+        """Códigos da coluna (posição em ``options``; -1 para vazio)."""
+        return self._codes[coluna]
+
+    def date_bounds(self):
+        """Menor e maior data (``Timestamp``) ou ``(None, None)`` sem datas."""
+        if self._first_valid >= self.size:
+            return None, None
+        return (pd.Timestamp(self._sorted_dates[self._first_valid]),
+                pd.Timestamp(self._sorted_dates[-1]))
+
+    def value_mask(self, coluna, valor):
+        chave = (coluna, valor)
+        mask = self._masks.get(chave)
+        if mask is None:
+            codigo = self._values[coluna].get(valor, -2)
+            mask = self._codes[coluna] == codigo
+            mask.flags.writeable = False
+            self._masks[chave] = mask
+        return mask
+
+    def date_mask(self, inicio, fim):
+        """Linhas com data entre ``inicio`` e ``fim`` (dias inteiros, inclusive)."""
+        inicio = pd.Timestamp(inicio).as_unit('ns').value
+        fim = (pd.Timestamp(fim) + timedelta(days=1)).as_unit('ns').value
+        lo = max(int(np.searchsorted(self._sorted_dates, inicio, side='left')), self._first_valid)
+        hi = int(np.searchsorted(self._sorted_dates, fim, side='left'))
+
+        mask = np.zeros(self.size, dtype=bool)
+        mask[self._order[lo:hi]] = True
+        return mask
+
+    def select(self, periodo=None, **valores):
+        """Máscara booleana combinando o período e os filtros por valor.
+
+        Filtros com valor ``None`` são ignorados.
+        """
+        mask = self.date_mask(*periodo) if periodo else np.ones(self.size, dtype=bool)
+        for coluna, valor in valores.items():
+            if valor is not None:
+                mask &= self.value_mask(coluna, valor)
+        return mask
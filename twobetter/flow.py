@@ -0,0 +1,543 @@
+"""Métricas de fluxo (lead time, cycle time, throughput, WIP) pelo histórico de status.
+
+O CSV do Jira só traz o status atual; as transições vêm de exportações do
+changelog colocadas em ``data/changelog/``:
+
+- JSON no formato da API do Jira (``{"issues": [{"key": ..., "changelog":
+  {"histories": [...]}}]}``) ou uma lista de registros planos;
+- CSV com uma transição por linha (``Chave``, ``Data``, ``De``, ``Para``, ou
+  os cabeçalhos em inglês ``Issue key``, ``Created``, ``From``, ``To``).
+
+As transições ficam num log compacto (categorias + datas) ordenado por
+issue e data, de modo que o histórico de cada issue é um trecho contíguo.
+``FlowLog`` guarda também um resumo por issue (início, conclusão, status
+atual). Ao chegar um arquivo novo, só ele é lido do disco; as categorias
+são unificadas com um merge das já ordenadas e só o histórico das issues que
+aparecem no arquivo é reordenado e resumido: o trecho e as linhas do resumo
+voltam para o lugar por ``searchsorted``. Throughput, percentis e o fluxo
+cumulativo saem do resumo e dos intervalos entre transições com operações
+vetorizadas (``searchsorted`` sobre inícios e fins ordenados), sem laço por
+issue ou por dia.
+
+Log e resumo ficam em ``.cache/flow/`` com o manifesto dos arquivos já lidos,
+como no modo incremental do CSV: uma subpasta por pasta de changelog. Se um
+arquivo já lido some ou muda, o log é refeito a partir dos arquivos atuais,
+para que as transições dele não fiquem no histórico.
+"""
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from functools import reduce
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from twobetter import cache as disk_cache
+from twobetter.dates import parse_jira_dates
+
+FLOW_DIR = disk_cache.CACHE_DIR / "flow"
+
+# Incrementar sempre que a leitura ou o resumo mudarem
+FLOW_VERSION = 1
+
+CHANGELOG_SUFFIXES = ('.csv', '.json')
+
+# Status que marcam o início do trabalho e a conclusão (PT-BR e EN)
+STATUS_INICIADO = ('Em andamento', 'TESTE', 'In Progress', 'In Review', 'Testing')
+STATUS_CONCLUIDO = ('Concluído', 'Done', 'Closed', 'Resolved')
+
+PERCENTIS = (50, 85, 95)
+JANELA_THROUGHPUT = 4
+
+# Cabeçalhos aceitos no CSV do changelog -> nomes usados no log
+CHANGELOG_COLUMNS = {
+    'Chave': 'Chave', 'Chave da item': 'Chave', 'Issue key': 'Chave', 'Key': 'Chave',
+    'Data': 'Data', 'Created': 'Data', 'Date': 'Data',
+    'De': 'De', 'From': 'De', 'From Status': 'De',
+    'Para': 'Para', 'To': 'Para', 'To Status': 'Para',
+    'Campo': 'Campo', 'Field': 'Campo',
+}
+
+EVENT_COLUMNS = ['Chave', 'Data', 'De', 'Para']
+SUMMARY_COLUMNS = ['Primeira', 'Ultima', 'Status', 'Inicio', 'Fim']
+
+_OFFSET_RE = r'(?:Z|[+-]\d{2}:?\d{2})$'
+
+
+def flow_key():
+    """Versão do processamento: muda junto com as regras de status."""
+    regras = repr((STATUS_INICIADO, STATUS_CONCLUIDO)).encode('utf-8')
+    return f"v{FLOW_VERSION}-{hashlib.sha1(regras).hexdigest()[:8]}"
+
+
+# =============================================
+# Leitura do changelog
+# =============================================
+
+def parse_changelog_dates(valores):
+    """Datas do changelog: formato da exportação CSV do Jira ou ISO 8601.
+
+    O fuso das datas ISO é descartado (fica a hora local mostrada no Jira,
+    como no CSV).
+    """
+    datas, invalidas = parse_jira_dates(valores)
+    if invalidas.empty:
+        return datas
+    texto = invalidas.astype(str).str.strip().str.replace(_OFFSET_RE, '', regex=True)
+    datas.loc[invalidas.index] = pd.to_datetime(texto, format='ISO8601', errors='coerce')
+    return datas
+
+
+def _json_records(conteudo):
+    issues = conteudo.get('issues', []) if isinstance(conteudo, dict) else conteudo
+    for issue in issues:
+        if 'changelog' not in issue:
+            # Registro plano: mesmos cabeçalhos aceitos no CSV
+            registro = {CHANGELOG_COLUMNS.get(k, k): v for k, v in issue.items()}
+            if registro.get('Campo', 'status').lower() == 'status':
+                yield registro.get('Chave'), registro.get('Data'), registro.get('De'), registro.get('Para')
+            continue
+        for historico in issue['changelog'].get('histories', []):
+            for item in historico.get('items', []):
+                if item.get('field', '').lower() == 'status':
+                    yield issue.get('key'), historico.get('created'), item.get('fromString'), item.get('toString')
+
+
+def read_changelog(path):
+    """Transições de status de um arquivo de changelog (CSV ou JSON)."""
+    path = Path(path)
+    if path.suffix.lower() == '.json':
+        conteudo = json.loads(path.read_text(encoding='utf-8-sig'))
+        eventos = pd.DataFrame(list(_json_records(conteudo)), columns=EVENT_COLUMNS)
+    else:
+        eventos = pd.read_csv(path, encoding='utf-8-sig', dtype=str)
+        eventos = eventos.rename(columns=CHANGELOG_COLUMNS)
+        if 'Campo' in eventos.columns:
+            eventos = eventos[eventos['Campo'].str.lower() == 'status']
+        eventos = eventos.reindex(columns=EVENT_COLUMNS)
+
+    eventos['Data'] = parse_changelog_dates(eventos['Data'].astype(object))
+    return compact_events(eventos.dropna(subset=['Chave', 'Data', 'Para']))
+
+
+def _build_log(codigos, datas, categorias):
+    """Monta o log a partir dos códigos: ordena por (Chave, Data) e tira repetidos."""
+    chave, de, para = codigos['Chave'], codigos['De'], codigos['Para']
+    # De/Para só desempatam transições no mesmo instante (e deixam repetidas lado a lado)
+    ordem = np.lexsort((para, de, datas, chave))
+    chave, datas, de, para = chave[ordem], datas[ordem], de[ordem], para[ordem]
+
+    repetida = np.zeros(len(ordem), dtype=bool)
+    repetida[1:] = ((chave[1:] == chave[:-1]) & (datas[1:] == datas[:-1])
+                    & (de[1:] == de[:-1]) & (para[1:] == para[:-1]))
+    manter = ~repetida
+
+    return _frame({'Chave': chave[manter], 'De': de[manter], 'Para': para[manter]}, datas[manter], categorias)
+
+
+def compact_events(eventos):
+    """Log compacto: categorias, sem repetidos, ordenado por (Chave, Data)."""
+    codigos, categorias = {}, {}
+    for coluna in ('Chave', 'De', 'Para'):
+        codigos[coluna], valores = pd.factorize(eventos[coluna].astype(object), sort=True)
+        categorias[coluna] = pd.CategoricalDtype(pd.Index(valores, dtype=object))
+    datas = eventos['Data'].to_numpy(dtype='datetime64[ns]').view('i8')
+    return _build_log(codigos, datas, categorias)
+
+
+def _recode(logs):
+    """Tipos categóricos unificados dos logs e os códigos de cada log neles.
+
+    Só as categorias são comparadas entre os logs; as linhas são recodificadas
+    com uma tabela de tradução por log (e nem isso quando as categorias do log
+    já são as do resultado).
+    """
+    categorias, codigos = {}, [{} for _ in logs]
+    for coluna in ('Chave', 'De', 'Para'):
+        # Categorias já ordenadas: a união é um merge linear, sem hash nem reordenação
+        uniao = reduce(pd.Index.union, (pd.Index(log[coluna].cat.categories, dtype=object) for log in logs))
+        # Sem categorias novas, o tipo do primeiro log serve (e não é validado de novo)
+        primeiro = logs[0][coluna].dtype
+        categorias[coluna] = primeiro if len(uniao) == len(primeiro.categories) else pd.CategoricalDtype(uniao)
+        for log, destino in zip(logs, codigos):
+            originais = log[coluna].cat.codes.to_numpy()
+            if len(log[coluna].cat.categories) == len(uniao):
+                destino[coluna] = originais
+                continue
+            # Posição extra no fim: código -1 (vazio) continua -1
+            traducao = np.append(uniao.get_indexer(log[coluna].cat.categories), -1)
+            destino[coluna] = traducao[originais]
+    return categorias, codigos
+
+
+def _datas(log):
+    return log['Data'].to_numpy(dtype='datetime64[ns]').view('i8')
+
+
+def _frame(codigos, datas, categorias):
+    return pd.DataFrame({
+        'Chave': pd.Categorical.from_codes(codigos['Chave'], dtype=categorias['Chave']),
+        'Data': datas.view('datetime64[ns]'),
+        'De': pd.Categorical.from_codes(codigos['De'], dtype=categorias['De']),
+        'Para': pd.Categorical.from_codes(codigos['Para'], dtype=categorias['Para']),
+    })
+
+
+def merge_events(*logs):
+    """Junta logs (categorias unificadas) e reordena o resultado por issue e data."""
+    logs = [log for log in logs if log is not None and not log.empty]
+    if not logs:
+        return pd.DataFrame(columns=EVENT_COLUMNS)
+    if len(logs) == 1:
+        return logs[0]
+
+    categorias, codigos = _recode(logs)
+    codigos = {coluna: np.concatenate([c[coluna] for c in codigos]) for coluna in ('Chave', 'De', 'Para')}
+    datas = np.concatenate([_datas(log) for log in logs])
+    return _build_log(codigos, datas, categorias)
+
+
+def insert_events(eventos, novos):
+    """Encaixa ``novos`` no log ordenado ``eventos`` sem reordenar o log inteiro.
+
+    Só o histórico das issues que aparecem em ``novos`` é reordenado (junto
+    com as transições novas); o trecho resultante volta para o lugar pelo
+    ``searchsorted`` das chaves. Retorna o log completo, o trecho, as linhas
+    de ``eventos`` que ele substituiu e as linhas do log que vieram dele.
+    """
+    categorias, (antigos, recentes) = _recode([eventos, novos])
+
+    # Trechos [inicio, fim) das issues afetadas no log ordenado por chave
+    chaves = antigos['Chave']
+    afetadas = np.unique(recentes['Chave'])
+    marcas = np.zeros(len(chaves) + 1, dtype=np.int64)
+    np.add.at(marcas, np.searchsorted(chaves, afetadas, side='left'), 1)
+    np.add.at(marcas, np.searchsorted(chaves, afetadas, side='right'), -1)
+    substituidas = np.cumsum(marcas[:-1]) > 0
+
+    datas = _datas(eventos)
+    trecho = _build_log(
+        {coluna: np.concatenate([antigos[coluna][substituidas], recentes[coluna]]) for coluna in antigos},
+        np.concatenate([datas[substituidas], _datas(novos)]),
+        categorias,
+    )
+
+    resto = ~substituidas
+    codigos_trecho = {coluna: trecho[coluna].cat.codes.to_numpy() for coluna in antigos}
+    posicoes = np.searchsorted(chaves[resto], codigos_trecho['Chave'])
+    codigos = {coluna: np.insert(antigos[coluna][resto], posicoes, codigos_trecho[coluna]) for coluna in antigos}
+    log = _frame(codigos, np.insert(datas[resto], posicoes, _datas(trecho)), categorias)
+
+    # np.insert põe cada linha do trecho antes da posição pedida no resto
+    do_trecho = np.zeros(len(log), dtype=bool)
+    do_trecho[posicoes + np.arange(len(trecho))] = True
+    return log, trecho, substituidas, do_trecho
+
+
+# =============================================
+# Resumo por issue e log incremental
+# =============================================
+
+def _primeiras(eventos):
+    """Primeira linha de cada issue no log ordenado (uma por linha do resumo)."""
+    chaves = eventos['Chave'].cat.codes.to_numpy()
+    return np.flatnonzero(np.append(True, chaves[1:] != chaves[:-1]))
+
+
+def summarize(eventos, iniciado=STATUS_INICIADO, concluido=STATUS_CONCLUIDO):
+    """Uma linha por issue: primeira e última transição, início, conclusão e status atual.
+
+    ``Fim`` só existe quando o status atual é de conclusão (uma issue
+    reaberta volta a contar como em andamento).
+    """
+    if eventos.empty:
+        return pd.DataFrame(columns=SUMMARY_COLUMNS, index=pd.Index([], name='Chave'))
+
+    # Log ordenado por (Chave, Data): cada issue é um trecho [primeiras[i], ultimas[i]]
+    chaves = eventos['Chave'].cat.codes.to_numpy()
+    primeiras = _primeiras(eventos)
+    ultimas = np.append(primeiras[1:], len(chaves)) - 1
+
+    datas = eventos['Data'].to_numpy(dtype='datetime64[ns]').view('i8')
+    para = eventos['Para']
+    status = para.cat.categories.to_numpy(dtype=object)[para.cat.codes.to_numpy()[ultimas]]
+    eh_iniciado = para.isin(iniciado).to_numpy()
+    eh_concluido = para.isin(concluido).to_numpy()
+
+    # Primeira entrada em andamento e última conclusão de cada trecho
+    nat = np.iinfo(np.int64).min
+    inicio = np.minimum.reduceat(np.where(eh_iniciado, datas, np.iinfo(np.int64).max), primeiras)
+    fim = np.maximum.reduceat(np.where(eh_concluido, datas, nat), primeiras)
+    inicio[inicio == np.iinfo(np.int64).max] = nat
+    fim[~eh_concluido[ultimas]] = nat
+
+    indice = eventos['Chave'].cat.categories.to_numpy(dtype=object)[chaves[primeiras]]
+    return pd.DataFrame({
+        'Primeira': datas[primeiras].view('datetime64[ns]'),
+        'Ultima': datas[ultimas].view('datetime64[ns]'),
+        'Status': pd.array(status, dtype=str),
+        'Inicio': inicio.view('datetime64[ns]'),
+        'Fim': fim.view('datetime64[ns]'),
+    }, index=pd.Index(indice, name='Chave', dtype=str))
+
+
+class FlowLog:
+    """Log de transições ordenado por issue e data, com o resumo por issue."""
+
+    def __init__(self, eventos, resumo=None):
+        self.eventos = eventos
+        self.resumo = summarize(eventos) if resumo is None else resumo
+
+    def __len__(self):
+        return len(self.eventos)
+
+    def update(self, novos):
+        """Novo ``FlowLog`` com as transições de ``novos`` encaixadas.
+
+        Só as issues presentes em ``novos`` têm o histórico reordenado e o
+        resumo refeito; as linhas delas substituem as antigas no resumo.
+        """
+        if novos is None or novos.empty:
+            return self
+        if self.eventos.empty:
+            return FlowLog(novos)
+        eventos, trecho, substituidas, do_trecho = insert_events(self.eventos, novos)
+
+        # Uma linha do resumo por issue, na ordem do log: as do trecho vêm do
+        # resumo novo, as demais do atual (sem comparar chaves de texto)
+        primeiras = _primeiras(self.eventos)
+        if len(primeiras) != len(self.resumo):
+            return FlowLog(eventos)
+        mantidas = np.flatnonzero(~substituidas[primeiras])
+        novas = do_trecho[_primeiras(eventos)]
+        linhas = np.empty(len(novas), dtype=np.int64)
+        linhas[~novas] = mantidas
+        linhas[novas] = len(self.resumo) + np.arange(int(novas.sum()))
+        resumo = pd.concat([self.resumo, summarize(trecho)]).iloc[linhas]
+        return FlowLog(eventos, resumo)
+
+
+def store_dir(changelog_dir):
+    """Pasta do log de ``changelog_dir`` (uma por pasta de changelog)."""
+    caminho = str(Path(changelog_dir).resolve())
+    return FLOW_DIR / hashlib.sha1(caminho.encode('utf-8')).hexdigest()[:16]
+
+
+def _read_manifest(pasta):
+    try:
+        manifest = json.loads((pasta / "manifest.json").read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    return manifest if manifest.get('flow_key') == flow_key() else {}
+
+
+def _write_manifest(pasta, manifest):
+    manifest_path = pasta / "manifest.json"
+    tmp_path = manifest_path.with_name(manifest_path.name + f".{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(manifest, indent=2), encoding='utf-8')
+    os.replace(tmp_path, manifest_path)
+
+
+def list_changelog_files(changelog_dir):
+    """Arquivos de changelog da pasta, do mais antigo para o mais recente."""
+    changelog_dir = Path(changelog_dir)
+    if not changelog_dir.is_dir():
+        return []
+    arquivos = [f for f in changelog_dir.iterdir()
+                if f.suffix.lower() in CHANGELOG_SUFFIXES and not f.name.startswith(('.', '~$'))]
+    return sorted(arquivos, key=lambda f: (f.stat().st_mtime_ns, f.name))
+
+
+def load_flow_log(changelog_dir):
+    """``FlowLog`` de todos os arquivos da pasta; só os novos ou alterados são lidos.
+
+    Retorna ``None`` se não houver nenhuma transição.
+    """
+    files = list_changelog_files(changelog_dir)
+    pasta = store_dir(changelog_dir)
+    events_path, summary_path = pasta / "events.feather", pasta / "summary.feather"
+    seen = _read_manifest(pasta).get('files', {})
+
+    # Arquivo já lido que sumiu ou mudou: as transições dele não podem ficar no
+    # log (não se sabe de que arquivo veio cada uma), então tudo é relido
+    atuais = {f.name: disk_cache.file_fingerprint(f) for f in files}
+    if any(atuais.get(nome) != fingerprint for nome, fingerprint in seen.items()):
+        seen = {}
+
+    log = None
+    if seen and events_path.exists() and summary_path.exists():
+        try:
+            eventos = disk_cache.read_frame(events_path)
+            resumo = disk_cache.read_frame(summary_path).set_index('Chave')
+            log = FlowLog(eventos, resumo)
+        except (OSError, KeyError, pa.ArrowException):
+            seen = {}
+
+    pending = [f for f in files if seen.get(f.name) != atuais[f.name]]
+    if log is not None and not pending:
+        return log
+
+    for file_path in pending:
+        novos = read_changelog(file_path)
+        log = FlowLog(novos) if log is None else log.update(novos)
+        seen[file_path.name] = atuais[file_path.name]
+
+    if log is None or not len(log):
+        return None
+
+    try:
+        disk_cache.write_frame(log.eventos, events_path)
+        disk_cache.write_frame(log.resumo.reset_index(), summary_path)
+        _write_manifest(pasta, {'flow_key': flow_key(), 'changelog_dir': str(Path(changelog_dir).resolve()),
+                                'files': seen})
+    except (OSError, pa.ArrowException):
+        pass
+    return log
+
+
+# =============================================
+# Métricas
+# =============================================
+
+def _dias(delta):
+    return delta.dt.total_seconds() / 86400
+
+
+def cycle_times(resumo):
+    """Dias entre o início do trabalho e a conclusão (issues concluídas com início)."""
+    return _dias(resumo['Fim'] - resumo['Inicio']).dropna()
+
+
+def lead_times(resumo, criado=None):
+    """Dias entre a criação e a conclusão.
+
+    ``criado`` (Série ``Chave -> Criado`` do CSV) é opcional; sem ela, a
+    primeira transição faz as vezes da criação.
+    """
+    origem = resumo['Primeira']
+    if criado is not None:
+        origem = criado.reindex(resumo.index).fillna(origem)
+    return _dias(resumo['Fim'] - origem).dropna()
+
+
+def percentiles(valores, percentis=PERCENTIS):
+    if len(valores) == 0:
+        return {p: None for p in percentis}
+    return {p: float(v) for p, v in zip(percentis, np.percentile(valores.to_numpy(), percentis))}
+
+
+def throughput(resumo, janela=JANELA_THROUGHPUT):
+    """Issues concluídas por semana e a média móvel de ``janela`` semanas."""
+    fim = resumo['Fim'].dropna()
+    if fim.empty:
+        return pd.DataFrame(columns=['Semana', 'Concluidas', 'Media_Movel'])
+
+    semanas = fim.dt.to_period('W')
+    contagem = semanas.value_counts().sort_index()
+    todas = pd.period_range(contagem.index.min(), contagem.index.max(), freq='W')
+    contagem = contagem.reindex(todas, fill_value=0)
+
+    return pd.DataFrame({
+        'Semana': contagem.index.start_time,
+        'Concluidas': contagem.to_numpy(),
+        'Media_Movel': contagem.rolling(janela, min_periods=1).mean().round(2).to_numpy(),
+    })
+
+
+def wip_aging(resumo, agora, iniciado=STATUS_INICIADO):
+    """Issues em andamento e há quantos dias começaram, da mais antiga para a mais nova."""
+    em_andamento = resumo[resumo['Status'].isin(iniciado)]
+    inicio = em_andamento['Inicio'].fillna(em_andamento['Ultima'])
+    wip = pd.DataFrame({
+        'Chave': em_andamento.index,
+        'Status': em_andamento['Status'].to_numpy(),
+        'Inicio': inicio.to_numpy(),
+        'Idade_Dias': _dias(pd.Timestamp(agora) - inicio).round(1).to_numpy(),
+    })
+    return wip.sort_values('Idade_Dias', ascending=False, ignore_index=True)
+
+
+def cumulative_flow(eventos, criado=None, freq='D'):
+    """Quantidade de issues em cada status no fim de cada período.
+
+    Cada transição abre um intervalo ``[Data, próxima transição da issue)``
+    no status ``Para``; com ``criado`` (Série ``Chave -> Criado``), o status
+    de origem da primeira transição conta desde a criação. A contagem em um
+    instante é o número de inícios até ele menos o de fins até ele, as duas
+    por ``searchsorted`` sobre arrays ordenados.
+    """
+    if eventos.empty:
+        return pd.DataFrame()
+
+    datas = eventos['Data'].to_numpy(dtype='datetime64[ns]').view('i8')
+    chaves = eventos['Chave'].cat.codes.to_numpy()
+    aberto = np.iinfo(np.int64).max
+    # Log ordenado por issue: o fim do intervalo é a transição seguinte da mesma issue
+    mesma_issue = np.append(chaves[1:] == chaves[:-1], False)
+    inicios = [datas]
+    fins = [np.where(mesma_issue, np.append(datas[1:], 0), aberto)]
+    status = [eventos['Para'].astype(object).to_numpy()]
+
+    if criado is not None:
+        primeiras = np.flatnonzero(np.append(True, ~mesma_issue[:-1]))
+        nomes = eventos['Chave'].cat.categories.to_numpy(dtype=object)[chaves[primeiras]]
+        origem = criado.reindex(nomes).to_numpy(dtype='datetime64[ns]').view('i8')
+        validas = (origem != np.iinfo(np.int64).min) & eventos['De'].notna().to_numpy()[primeiras]
+        inicios.append(origem[validas])
+        fins.append(datas[primeiras][validas])
+        status.append(eventos['De'].astype(object).to_numpy()[primeiras][validas])
+
+    inicios, fins, status = np.concatenate(inicios), np.concatenate(fins), np.concatenate(status)
+    codigos, nomes_status = pd.factorize(status)
+
+    periodos = pd.period_range(pd.Timestamp(inicios.min()), pd.Timestamp(datas.max()), freq=freq)
+    # Fim de cada período (último instante antes do próximo)
+    instantes = periodos.end_time.as_unit('ns').asi8
+
+    colunas = {}
+    for codigo, nome in enumerate(nomes_status):
+        sel = codigos == codigo
+        colunas[nome] = (np.searchsorted(np.sort(inicios[sel]), instantes, side='right')
+                         - np.searchsorted(np.sort(fins[sel]), instantes, side='right'))
+
+    return pd.DataFrame(colunas, index=pd.Index(periodos.start_time, name='Data'))
+
+
+@dataclass(frozen=True)
+class FlowStats:
+    issues: int
+    concluidas: int
+    em_andamento: int
+    cycle_time: dict              # percentil -> dias
+    lead_time: dict               # percentil -> dias
+    throughput: pd.DataFrame      # Semana, Concluidas, Media_Movel
+    wip: pd.DataFrame             # Chave, Status, Inicio, Idade_Dias
+    cumulative_flow: pd.DataFrame  # uma coluna por status, índice Data
+
+
+def compute_flow_stats(log, chaves=None, criado=None, agora=None):
+    """Métricas de fluxo, opcionalmente só das issues em ``chaves`` (ex: filtros do Dashboard)."""
+    resumo, eventos = log.resumo, log.eventos
+    if chaves is not None:
+        chaves = pd.Index(chaves)
+        resumo = resumo[resumo.index.isin(chaves)]
+        # Pelas categorias: o teste de pertinência roda uma vez por issue, não por transição
+        selecionadas = eventos['Chave'].cat.categories.isin(chaves)
+        eventos = eventos[selecionadas[eventos['Chave'].cat.codes.to_numpy()]]
+    if agora is None:
+        agora = pd.Timestamp.now()
+
+    wip = wip_aging(resumo, agora)
+    return FlowStats(
+        issues=len(resumo),
+        concluidas=int(resumo['Fim'].notna().sum()),
+        em_andamento=len(wip),
+        cycle_time=percentiles(cycle_times(resumo)),
+        lead_time=percentiles(lead_times(resumo, criado)),
+        throughput=throughput(resumo),
+        wip=wip,
+        cumulative_flow=cumulative_flow(eventos, criado),
+    )
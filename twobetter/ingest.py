@@ -0,0 +1,119 @@
+"""Ingestão incremental de vários CSVs exportados do Jira.
+
+Cada CSV em ``data/`` é tratado como um delta. As issues são mescladas pelo
+``ID`` e, quando a mesma issue aparece mais de uma vez, vence a linha com o
+``Atualizado`` mais recente. O resultado fica salvo em ``.cache/store/``
+junto com um manifesto dos arquivos já processados, então cada execução só
+lê os CSVs novos ou alterados. Cada pasta de dados tem o próprio store
+(subpasta com o hash do caminho), então pastas diferentes nunca se misturam.
+"""
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+
+from twobetter import cache as disk_cache
+from twobetter.schema import compact
+
+STORE_DIR = disk_cache.CACHE_DIR / "store"
+
+# Coluna usada para identificar a mesma issue entre exportações
+KEY_COLUMN = 'ID'
+
+
+def list_csv_files(data_dir):
+    """CSVs da pasta ordenados do mais antigo para o mais recente."""
+    return sorted(data_dir.glob("*.csv"), key=lambda f: (f.stat().st_mtime_ns, f.name))
+
+
+def files_fingerprint(files):
+    """Chave que muda sempre que algum CSV é adicionado ou alterado."""
+    return tuple((f.name, disk_cache.file_fingerprint(f)) for f in files)
+
+
+def store_dir(data_dir):
+    """Pasta do store mesclado de ``data_dir`` (uma por pasta de dados)."""
+    caminho = str(Path(data_dir).resolve())
+    return STORE_DIR / hashlib.sha1(caminho.encode('utf-8')).hexdigest()[:16]
+
+
+def read_manifest(pasta):
+    try:
+        manifest = json.loads((pasta / "manifest.json").read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    if manifest.get('schema_key') != disk_cache.schema_key():
+        return {}
+    return manifest
+
+
+def write_manifest(pasta, manifest):
+    manifest_path = pasta / "manifest.json"
+    tmp_path = manifest_path.with_name(manifest_path.name + f".{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(manifest, indent=2), encoding='utf-8')
+    os.replace(tmp_path, manifest_path)
+
+
+def merge_issues(frames):
+    """Junta os frames mantendo a versão mais recente de cada issue.
+
+    Em empate de ``Atualizado`` vence o frame que aparece por último.
+    """
+    merged = pd.concat(frames, ignore_index=True)
+    merged = merged.sort_values('Atualizado', kind='stable', na_position='first')
+    merged = merged.drop_duplicates(subset=KEY_COLUMN, keep='last')
+    return merged.sort_values('Criado', ascending=False, ignore_index=True)
+
+
+def load_incremental(data_dir, build, build_many=None):
+    """Carrega o histórico mesclado de todos os CSVs da pasta.
+
+    ``build(file_path)`` processa um único CSV e só é chamado para arquivos
+    ainda não vistos (ou alterados) desde a última execução. Se informado,
+    ``build_many(files)`` processa todos os pendentes de uma vez (ex: em
+    paralelo). Arquivos removidos da pasta não apagam as issues já guardadas
+    no store.
+    """
+    files = list_csv_files(data_dir)
+    pasta = store_dir(data_dir)
+    store_path = pasta / "jira.feather"
+    manifest = read_manifest(pasta)
+    seen = manifest.get('files', {})
+
+    store = None
+    if seen and store_path.exists():
+        try:
+            store = disk_cache.read_frame(store_path)
+        except (OSError, pa.ArrowException):
+            seen = {}
+
+    pending = [f for f in files if seen.get(f.name) != disk_cache.file_fingerprint(f)]
+
+    if store is not None and not pending:
+        return store
+
+    frames = [store] if store is not None else []
+    datas_invalidas = dict(store.attrs.get('datas_invalidas', {})) if store is not None else {}
+    novos = build_many(pending) if build_many is not None else map(build, pending)
+    for file_path, df in zip(pending, novos):
+        for coluna, valores in df.attrs.get('datas_invalidas', {}).items():
+            datas_invalidas.setdefault(coluna, []).extend(valores)
+        frames.append(df)
+        seen[file_path.name] = disk_cache.file_fingerprint(file_path)
+
+    if not frames:
+        return None
+
+    merged = compact(merge_issues(frames))
+    merged.attrs['datas_invalidas'] = datas_invalidas
+
+    try:
+        disk_cache.write_frame(merged, store_path)
+        write_manifest(pasta, {'schema_key': disk_cache.schema_key(), 'data_dir': str(Path(data_dir).resolve()),
+                               'files': seen})
+        return disk_cache.read_frame(store_path)
+    except (OSError, pa.ArrowException):
+        return merged
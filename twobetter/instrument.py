@@ -0,0 +1,143 @@
+"""Instrumentação leve para medir onde vai o tempo de cada rerun.
+
+Cada execução do script abre um ``Run`` com ``start_run``. Dentro dele:
+
+- ``span(nome)`` mede um bloco (pode ser aninhado);
+- ``lap(nome)`` mede o trecho desde a última marca, útil em código linear;
+- ``count(nome, valor)`` guarda contagens (ex: linhas filtradas);
+- ``cached(decorator, nome)`` envolve funções ``st.cache_data``/``cache_resource``
+  e conta acertos e faltas do cache.
+
+Ao final, ``Run.finish()`` fecha a medição do tempo total e
+``write_log(run)`` acrescenta o rerun a ``.cache/diagnostics.jsonl`` (com
+rotação por tamanho). O módulo não depende do Streamlit.
+"""
+import functools
+import json
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+
+from twobetter import cache as disk_cache
+
+LOG_PATH = disk_cache.CACHE_DIR / "diagnostics.jsonl"
+LOG_MAX_BYTES = 5 * 1024 * 1024
+
+_local = threading.local()
+
+
+class Run:
+    def __init__(self, page):
+        self.page = page
+        self.started = time.perf_counter()
+        self.timestamp = datetime.now().isoformat(timespec='seconds')
+        self.spans = []
+        self.counts = {}
+        self.cache_hits = Counter()
+        self.cache_misses = Counter()
+        self.total = None
+        self._last_lap = self.started
+        self._depth = 0
+
+    @contextmanager
+    def span(self, nome):
+        inicio = time.perf_counter()
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            fim = time.perf_counter()
+            self.spans.append({'name': nome, 'ms': round((fim - inicio) * 1000, 2), 'depth': self._depth})
+            self._last_lap = fim
+
+    def lap(self, nome):
+        agora = time.perf_counter()
+        self.spans.append({'name': nome, 'ms': round((agora - self._last_lap) * 1000, 2), 'depth': self._depth})
+        self._last_lap = agora
+
+    def count(self, nome, valor):
+        self.counts[nome] = int(valor)
+
+    def finish(self):
+        self.total = round((time.perf_counter() - self.started) * 1000, 2)
+        return self.total
+
+    def to_dict(self):
+        return {
+            'timestamp': self.timestamp,
+            'page': self.page,
+            'total_ms': self.total,
+            'spans': self.spans,
+            'counts': self.counts,
+            'cache_hits': dict(self.cache_hits),
+            'cache_misses': dict(self.cache_misses),
+        }
+
+
+class _NullRun(Run):
+    """Usado quando nenhum rerun foi iniciado (ex: CLI): não mede nada."""
+
+    def __init__(self):
+        super().__init__(page=None)
+
+    @contextmanager
+    def span(self, nome):
+        yield
+
+    def lap(self, nome):
+        pass
+
+
+def start_run(page):
+    _local.run = Run(page)
+    return _local.run
+
+
+def current_run():
+    run = getattr(_local, 'run', None)
+    return run if run is not None else _NullRun()
+
+
+def cached(cache_decorator, nome):
+    """Aplica ``cache_decorator`` e conta acertos/faltas no rerun atual.
+
+    O corpo original só executa em uma falta de cache, então a falta é
+    registrada lá dentro; se a chamada terminar sem falta, foi um acerto.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def on_miss(*args, **kwargs):
+            current_run().cache_misses[nome] += 1
+            return func(*args, **kwargs)
+
+        cached_func = cache_decorator(on_miss)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            run = current_run()
+            faltas = run.cache_misses[nome]
+            with run.span(nome):
+                resultado = cached_func(*args, **kwargs)
+            if run.cache_misses[nome] == faltas:
+                run.cache_hits[nome] += 1
+            return resultado
+
+        wrapper.clear = getattr(cached_func, 'clear', None)
+        return wrapper
+
+    return decorator
+
+
+def write_log(run, path=LOG_PATH):
+    """Acrescenta o rerun ao log JSON-lines, rotacionando para ``.1`` se ficar grande."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.exists() and path.stat().st_size > LOG_MAX_BYTES:
+            path.replace(path.with_name(path.name + '.1'))
+        with path.open('a', encoding='utf-8') as log:
+            log.write(json.dumps(run.to_dict(), ensure_ascii=False) + '\n')
+    except OSError:
+        pass
@@ -0,0 +1,47 @@
+"""Leitura e processamento do CSV exportado do Jira."""
+import pandas as pd
+
+from twobetter.areas import classify_areas, extract_tags
+from twobetter.dates import parse_jira_dates
+from twobetter.schema import compact, loaded_columns
+
+# Nomes curtos para as 14 colunas da exportação (na ordem do CSV)
+JIRA_COLUMNS = ['Tipo', 'Chave', 'ID', 'Resumo', 'Responsavel', 'ID_Responsavel',
+                'Relator', 'ID_Relator', 'Prioridade', 'Status', 'Resolucao',
+                'Criado', 'Atualizado', 'Data_Limite']
+
+DATE_COLUMNS = ['Criado', 'Atualizado', 'Data_Limite']
+
+
+def process_jira_frame(df):
+    """Deriva as colunas do dashboard a partir do CSV cru já renomeado."""
+    # Converter datas (uma passada vetorizada por coluna) e guardar as
+    # não reconhecidas para exibir no dashboard
+    datas_invalidas = {}
+    for coluna in DATE_COLUMNS:
+        if coluna not in df.columns:
+            continue
+        df[coluna], invalidas = parse_jira_dates(df[coluna])
+        if not invalidas.empty:
+            datas_invalidas[coluna] = invalidas.tolist()
+
+    # Extrair área do resumo (Backend, Frontend, QA, etc) e tags secundárias
+    # conforme as regras de config/areas.json
+    df['Area'] = classify_areas(df['Resumo'])
+    df = df.join(extract_tags(df['Resumo']))
+
+    # Depois do join, que não preserva attrs
+    df.attrs['datas_invalidas'] = datas_invalidas
+
+    # Limpar responsáveis
+    df['Responsavel'] = df['Responsavel'].fillna('Não atribuído')
+
+    return compact(df)
+
+
+def read_jira_csv(file_path):
+    # Renomear colunas para facilitar (pela posição) e ler só as usadas
+    df = pd.read_csv(file_path, encoding='utf-8-sig', header=0, names=JIRA_COLUMNS,
+                     usecols=loaded_columns())
+
+    return process_jira_frame(df)
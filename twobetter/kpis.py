@@ -0,0 +1,111 @@
+"""Agregações do Dashboard calculadas a partir dos códigos do índice.
+
+Todos os KPIs e dados de gráficos saem de contagens (``np.bincount``) sobre
+os códigos categóricos já guardados no ``FilterIndex``, sem montar
+sub-frames nem usar ``groupby`` com lambdas.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+STATUS_CONCLUIDO = 'Concluído'
+STATUS_EM_ANDAMENTO = 'Em andamento'
+STATUS_PENDENTE = 'Tarefas pendentes'
+
+
+@dataclass(frozen=True)
+class DashboardStats:
+    total: int
+    concluidas: int
+    em_andamento: int
+    pendentes: int
+    devs_ativos: int
+    status_counts: pd.Series     # quantidade por Status, decrescente
+    area_counts: pd.Series       # quantidade por Area, decrescente
+    dev_stats: pd.DataFrame      # Total, Concluidas, Pendentes, Taxa_Conclusao por Responsavel
+    recent_summary: pd.DataFrame  # Responsavel, Tarefas Atualizadas (None no snapshot)
+
+    @property
+    def taxa_conclusao(self):
+        return (self.concluidas / self.total * 100) if self.total > 0 else 0
+
+
+def _counts(codigos, tamanho):
+    # Código -1 (vazio) vai para a posição 0 e é descartado
+    return np.bincount(codigos + 1, minlength=tamanho + 1)[1:]
+
+
+def _sorted_counts(contagem, valores, nome):
+    serie = pd.Series(contagem, index=pd.Index(valores, name=nome), name='count')
+    serie = serie[serie > 0]
+    return serie.sort_values(ascending=False, kind='stable')
+
+
+class DashboardAggregator:
+    """Pré-computa o que não depende dos filtros.
+
+    A timeline de criação fica no cubo de contagens (``twobetter.cube``).
+    """
+
+    def __init__(self, df, index):
+        self._index = index
+        self._responsaveis = index.options('Responsavel')
+        self._status = index.options('Status')
+        self._areas = index.options('Area')
+
+        self._atualizado = df['Atualizado'].to_numpy(dtype='datetime64[ns]')
+
+    def compute(self, mask, recent_since):
+        """Todos os KPIs e dados de gráficos para as linhas em ``mask``."""
+        n_status = len(self._status)
+        resp = self._index.codes('Responsavel')[mask]
+        status = self._index.codes('Status')[mask]
+        area = self._index.codes('Area')[mask]
+
+        # Uma contagem agrupada por (responsável, status); -1 vira a linha 0
+        com_status = status >= 0
+        por_dev_status = np.bincount(
+            (resp[com_status] + 1) * n_status + status[com_status],
+            minlength=(len(self._responsaveis) + 1) * n_status
+        ).reshape(len(self._responsaveis) + 1, n_status)
+        por_status = por_dev_status.sum(axis=0)
+        por_dev = por_dev_status[1:]
+
+        def contagem_status(nome):
+            if nome not in self._status:
+                return 0
+            return int(por_status[self._status.index(nome)])
+
+        # Performance por dev: o total conta também as tarefas sem Status
+        total_dev = _counts(resp, len(self._responsaveis))
+        if STATUS_CONCLUIDO in self._status:
+            concluidas_dev = por_dev[:, self._status.index(STATUS_CONCLUIDO)]
+        else:
+            concluidas_dev = np.zeros_like(total_dev)
+        dev_stats = pd.DataFrame(
+            {'Total': total_dev, 'Concluidas': concluidas_dev},
+            index=pd.Index(self._responsaveis, name='Responsavel')
+        )
+        dev_stats = dev_stats[dev_stats['Total'] > 0]
+        dev_stats['Pendentes'] = dev_stats['Total'] - dev_stats['Concluidas']
+        dev_stats['Taxa_Conclusao'] = (dev_stats['Concluidas'] / dev_stats['Total'] * 100).round(1)
+        dev_stats = dev_stats.sort_values('Total', ascending=True, kind='stable')
+
+        # Atividade recente por dev
+        recentes = self._atualizado[mask] >= np.datetime64(pd.Timestamp(recent_since).as_unit('ns'))
+        recent_summary = _sorted_counts(
+            _counts(resp[recentes], len(self._responsaveis)), self._responsaveis, 'Responsavel'
+        ).rename('Tarefas Atualizadas').reset_index()
+
+        return DashboardStats(
+            total=int(mask.sum()),
+            concluidas=contagem_status(STATUS_CONCLUIDO),
+            em_andamento=contagem_status(STATUS_EM_ANDAMENTO),
+            pendentes=contagem_status(STATUS_PENDENTE),
+            devs_ativos=int((total_dev > 0).sum()),
+            status_counts=_sorted_counts(por_status, self._status, 'Status'),
+            area_counts=_sorted_counts(_counts(area, len(self._areas)), self._areas, 'Area'),
+            dev_stats=dev_stats,
+            recent_summary=recent_summary,
+        )
@@ -0,0 +1,231 @@
+"""Vínculo entre as tarefas do Jira e as metas de OKR.
+
+As regras ficam em ``config/okr_links.json``, uma por meta (pela Entrega):
+
+- ``termos``: frases buscadas no Resumo/Chave (todas as palavras, por prefixo);
+- ``tags``: colunas de tag secundária (ex: ``Tag_Regression``);
+- ``chaves``: chaves de tarefas (ex: ``SCRUM-42``);
+- ``areas`` e ``responsaveis``: restringem as tarefas encontradas (sozinhos,
+  selecionam todas as tarefas da área ou da pessoa);
+- ``mesmo_responsavel``: só tarefas do responsável da meta.
+
+Os termos usam o índice invertido da tabela de detalhes (token -> posições)
+e as restrições as máscaras do ``FilterIndex``, então cada meta custa o
+tamanho das listas que ela casa, não o total de tarefas. As posições de cada
+regra ficam memorizadas no ``IssueLinker`` do dataset: se só a planilha muda,
+apenas metas com regras novas são calculadas; um CSV novo traz outro dataset,
+com outro ``IssueLinker``.
+"""
+import hashlib
+import json
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+LINKS_PATH = Path(__file__).resolve().parent.parent / "config" / "okr_links.json"
+
+STATUS_CONCLUIDO = ('Concluído',)
+STATUS_EM_ANDAMENTO = ('Em andamento',)
+
+
+@dataclass(frozen=True)
+class LinkRule:
+    termos: tuple = ()
+    tags: tuple = ()
+    chaves: tuple = ()
+    areas: tuple = ()
+    responsaveis: tuple = ()
+    mesmo_responsavel: bool = False
+
+
+@dataclass(frozen=True)
+class LinkRules:
+    metas: dict = field(default_factory=dict)   # entrega normalizada -> LinkRule
+    concluido: tuple = STATUS_CONCLUIDO
+    em_andamento: tuple = STATUS_EM_ANDAMENTO
+    fingerprint: str = ''
+
+    def rule(self, entrega):
+        return self.metas.get(_normalize(entrega))
+
+
+def _normalize(texto):
+    return ' '.join(str(texto).split()).casefold()
+
+
+@lru_cache(maxsize=4)
+def _load_rules(path, mtime_ns):
+    conteudo = Path(path).read_bytes()
+    regras = json.loads(conteudo)
+
+    metas = {}
+    for meta in regras.get('metas', []):
+        metas[_normalize(meta['entrega'])] = LinkRule(
+            termos=tuple(t for t in meta.get('termos', []) if t.strip()),
+            tags=tuple(meta.get('tags', [])),
+            chaves=tuple(meta.get('chaves', [])),
+            areas=tuple(meta.get('areas', [])),
+            responsaveis=tuple(meta.get('responsaveis', [])),
+            mesmo_responsavel=bool(meta.get('mesmo_responsavel', False)),
+        )
+
+    return LinkRules(
+        metas,
+        concluido=tuple(regras.get('status_concluido', STATUS_CONCLUIDO)),
+        em_andamento=tuple(regras.get('status_em_andamento', STATUS_EM_ANDAMENTO)),
+        fingerprint=hashlib.sha1(conteudo).hexdigest()[:8],
+    )
+
+
+def load_link_rules(path=LINKS_PATH):
+    """Regras de vínculo; recarregadas se o arquivo mudar (sem arquivo, nenhuma meta vinculada)."""
+    path = Path(path)
+    if not path.exists():
+        return LinkRules()
+    return _load_rules(str(path), path.stat().st_mtime_ns)
+
+
+class IssueLinker:
+    """Tarefas do Jira de cada regra, a partir dos índices já prontos do dataset."""
+
+    def __init__(self, df, index, details):
+        self._df = df
+        self._index = index
+        self._details = details
+        self._posicoes = {}
+        self._por_chave = None
+
+    def _key_positions(self, chaves):
+        if self._por_chave is None:
+            self._por_chave = {chave: i for i, chave in enumerate(self._df['Chave'].to_numpy())}
+        encontradas = [self._por_chave[c] for c in chaves if c in self._por_chave]
+        return np.array(encontradas, dtype=np.int64)
+
+    def _restrict(self, posicoes, coluna, valores):
+        mask = np.zeros(self._index.size, dtype=bool)
+        for valor in valores:
+            mask |= self._index.value_mask(coluna, valor)
+        return posicoes[mask[posicoes]]
+
+    def positions(self, regra, responsavel=None):
+        """Posições (ordenadas) das tarefas vinculadas à regra."""
+        responsaveis = regra.responsaveis
+        if regra.mesmo_responsavel:
+            responsaveis = responsaveis + (responsavel,)
+        chave = (regra, responsaveis)
+
+        posicoes = self._posicoes.get(chave)
+        if posicoes is not None:
+            return posicoes
+
+        partes = [self._details.positions(termo) for termo in regra.termos]
+        for tag in regra.tags:
+            if tag in self._df.columns:
+                partes.append(np.flatnonzero(self._df[tag].to_numpy(dtype=bool)))
+        if regra.chaves:
+            partes.append(self._key_positions(regra.chaves))
+
+        if partes:
+            # União das listas por uma máscara (mais barato que ordenar a concatenação)
+            encontradas = np.zeros(self._index.size, dtype=bool)
+            for parte in partes:
+                encontradas[parte] = True
+            posicoes = np.flatnonzero(encontradas)
+        elif regra.areas or responsaveis:
+            posicoes = np.arange(self._index.size, dtype=np.int64)
+        else:
+            posicoes = np.empty(0, dtype=np.int64)
+
+        if regra.areas:
+            posicoes = self._restrict(posicoes, 'Area', regra.areas)
+        if responsaveis:
+            posicoes = self._restrict(posicoes, 'Responsavel', responsaveis)
+
+        posicoes.flags.writeable = False
+        self._posicoes[chave] = posicoes
+        return posicoes
+
+    def goal_positions(self, df_okr, regras):
+        """Posições das tarefas de cada meta (mesmo índice de ``df_okr``)."""
+        vazio = np.empty(0, dtype=np.int64)
+        posicoes = {}
+        for indice, entrega, responsavel in zip(df_okr.index, df_okr['Entrega'], df_okr['Responsavel']):
+            regra = regras.rule(entrega)
+            posicoes[indice] = vazio if regra is None else self.positions(regra, responsavel)
+        return posicoes
+
+    def progress(self, df_okr, regras):
+        """Tarefas, concluídas e progresso (simples e ponderado pelo peso) de cada meta."""
+        codigos = self._index.codes('Status')
+        # Tabelas código -> bool; a posição extra no fim atende o código -1 (vazio)
+        opcoes = self._index.options('Status') + [None]
+        concluido = np.array([s in regras.concluido for s in opcoes], dtype=bool)
+        andamento = np.array([s in regras.em_andamento for s in opcoes], dtype=bool)
+
+        tarefas, concluidas, em_andamento = [], [], []
+        for posicoes in self.goal_positions(df_okr, regras).values():
+            status = codigos[posicoes]
+            tarefas.append(len(posicoes))
+            concluidas.append(int(concluido[status].sum()))
+            em_andamento.append(int(andamento[status].sum()))
+
+        progresso = pd.DataFrame({
+            'Foco': df_okr['Foco'],
+            'Entrega': df_okr['Entrega'],
+            'Responsavel': df_okr['Responsavel'],
+            'Peso_Num': df_okr['Peso_Num'],
+            'Status': df_okr['Status'],
+            'Tarefas': np.array(tarefas, dtype=np.int64),
+            'Concluidas': np.array(concluidas, dtype=np.int64),
+            'Em_Andamento': np.array(em_andamento, dtype=np.int64),
+        }, index=df_okr.index)
+        progresso['Pendentes'] = progresso['Tarefas'] - progresso['Concluidas'] - progresso['Em_Andamento']
+        progresso['Progresso'] = (progresso['Concluidas'] / progresso['Tarefas']).where(progresso['Tarefas'] > 0)
+        progresso['Progresso_Ponderado'] = progresso['Progresso'] * progresso['Peso_Num']
+        progresso['Status_Jira'] = jira_status(progresso)
+        return progresso
+
+
+def jira_status(progresso):
+    """Status da meta pelas tarefas (vazio quando nenhuma tarefa foi vinculada)."""
+    status = np.select(
+        [progresso['Tarefas'] == 0,
+         progresso['Concluidas'] == progresso['Tarefas'],
+         (progresso['Concluidas'] + progresso['Em_Andamento']) > 0],
+        [None, 'Concluído', 'Em andamento'],
+        default='Não Iniciado'
+    )
+    return pd.Series(status, index=progresso.index, dtype=object)
+
+
+def weighted_progress(progresso):
+    """Progresso ponderado pelo peso das metas vinculadas e o peso que elas cobrem.
+
+    Retorna ``(progresso, cobertura)`` em fração; ``progresso`` é ``None``
+    se nenhuma meta tiver tarefas vinculadas.
+    """
+    vinculadas = progresso[progresso['Tarefas'] > 0]
+    peso_total = progresso['Peso_Num'].sum()
+    peso_vinculado = vinculadas['Peso_Num'].sum()
+    cobertura = float(peso_vinculado / peso_total) if peso_total else 0.0
+    if not peso_vinculado:
+        return None, cobertura
+    return float(vinculadas['Progresso_Ponderado'].sum() / peso_vinculado), cobertura
+
+
+def progress_table(progresso):
+    """Tabela de exibição: uma linha por meta, progresso em %."""
+    return pd.DataFrame({
+        'Entrega': progresso['Entrega'],
+        'Foco': progresso['Foco'],
+        'Tarefas': progresso['Tarefas'],
+        'Concluídas': progresso['Concluidas'],
+        'Em andamento': progresso['Em_Andamento'],
+        'Progresso (%)': (progresso['Progresso'] * 100).round(1),
+        'Peso (%)': (progresso['Peso_Num'] * 100).round(1),
+        'Status (planilha)': progresso['Status'],
+        'Status (Jira)': progresso['Status_Jira'],
+    })
@@ -0,0 +1,162 @@
+"""Leitura da planilha de OKRs e cálculo dos indicadores da página."""
+from dataclasses import dataclass
+
+import pandas as pd
+
+OKR_SHEET = 'Proposta de Metas Q1'
+
+# Colunas da planilha -> nomes usados no dashboard
+OKR_COLUMNS = {
+    'FOCO': 'Foco',
+    'PRINCIPAL ENTREGA': 'Entrega',
+    'PROPOSTA DE META': 'Meta',
+    'PRIORIDADE': 'Prioridade',
+    'RESPONSÁVEL': 'Responsavel',
+    'PESO': 'Peso',
+    'PESO - Média Ponderada Geral': 'Peso_Decimal',
+    'RESULTADOS ESPERADOS': 'Resultados_Esperados',
+    'INDICADOR': 'Indicador',
+    'Medição do Indicador': 'Medicao',
+    'PRAZO': 'Prazo',
+    'STATUS': 'Status',
+    'O QUE FOI ENTREGUE': 'Entregue',
+    'Time envolvido (informar responsável da meta compartilhda)': 'Time',
+    'Detalhamento Meta para o time': 'Detalhamento'
+}
+
+
+def process_okr_frame(df):
+    # Renomear colunas para facilitar
+    df = df.rename(columns=OKR_COLUMNS)
+
+    # Converter peso para decimal
+    df['Peso_Num'] = df['Peso'].str.replace('%', '').astype(float) / 100
+
+    return df
+
+
+def read_okr_workbook(okr_path, sheet_name=OKR_SHEET):
+    return process_okr_frame(pd.read_excel(okr_path, sheet_name=sheet_name))
+
+
+# Coluna -> valor que significa "sem filtro"
+OKR_FILTERS = {'Foco': 'Todos', 'Status': 'Todos', 'Prioridade': 'Todas', 'Responsavel': 'Todos'}
+
+
+def okr_options(df, coluna):
+    return sorted(df[coluna].dropna().unique().tolist())
+
+
+def filter_okr(df, **valores):
+    """Aplica os filtros da sidebar; valores vazios ou 'Todos'/'Todas' são ignorados."""
+    mask = pd.Series(True, index=df.index)
+    for coluna, valor in valores.items():
+        if valor is not None and valor != OKR_FILTERS.get(coluna):
+            mask &= df[coluna] == valor
+    return df[mask]
+
+
+# Ícones dos cartões de metas
+STATUS_ICONS = {'Em andamento': '🟡', 'Não Iniciado': '🔵', 'Concluído': '🟢'}
+PRIORIDADE_BADGES = {'Alta': '🔴 Alta', 'Média': '🟠 Média', 'Baixa': '🟢 Baixa'}
+
+# Foco das metas com a coluna FOCO vazia na planilha
+SEM_FOCO = 'Sem foco'
+
+
+def _texto(serie, vazio='—'):
+    return serie.astype(object).where(serie.notna(), vazio).astype(str)
+
+
+def goal_cards(df):
+    """Cartões da seção "Detalhes das Metas": um bloco de markdown por foco.
+
+    Os cartões são montados de uma vez com operações de string nas colunas
+    e agrupados por foco na ordem em que aparecem na planilha. Metas sem foco
+    ficam no bloco ``SEM_FOCO``.
+    """
+    if df.empty:
+        return {}
+
+    status = df['Status'].map(STATUS_ICONS).fillna('⚪')
+    prioridade = df['Prioridade'].map(PRIORIDADE_BADGES).fillna(_texto(df['Prioridade']))
+    detalhamento = _texto(df['Detalhamento'], '').str.replace(']', '\\]', regex=False)
+    detalhamento = ('\n\n:gray[📝 ' + detalhamento + ']').where(detalhamento != '', '')
+
+    cartoes = (
+        '**' + _texto(df['Entrega']) + '** ' + status
+        + '\n\n- **Meta:** ' + _texto(df['Meta'])
+        + '\n- **Responsável:** ' + _texto(df['Responsavel'])
+        + ' | **Prioridade:** ' + prioridade
+        + ' | **Peso:** ' + _texto(df['Peso'])
+        + '\n- **Prazo:** ' + _texto(df['Prazo'])
+        + ' | **Indicador:** ' + _texto(df['Indicador'])
+        + '\n- **Resultado Esperado:** ' + _texto(df['Resultados_Esperados'])
+        + detalhamento
+    )
+    blocos = cartoes.groupby(df['Foco'].fillna(SEM_FOCO), sort=False).agg('\n\n---\n\n'.join)
+    return blocos.to_dict()
+
+
+@dataclass(frozen=True)
+class OkrStats:
+    total: int
+    em_andamento: int
+    nao_iniciadas: int
+    peso_total: float
+    prioridade_alta: int
+    status_counts: pd.Series
+    foco_counts: pd.Series
+    peso_por_foco: pd.Series     # peso (%) por foco, crescente
+    resp_counts: pd.Series
+    resp_summary: pd.DataFrame   # Responsável, Peso Total (%), Qtd Metas
+    prazos: pd.DataFrame         # Entrega, Prazo (datetime), Status, Prioridade
+
+
+def compute_okr_stats(df):
+    status_counts = df['Status'].value_counts()
+    resp_counts = df['Responsavel'].value_counts()
+
+    peso_por_resp = df.groupby('Responsavel')['Peso_Num'].sum().sort_values(ascending=False) * 100
+    resp_summary = pd.DataFrame({
+        'Responsável': peso_por_resp.index,
+        'Peso Total (%)': peso_por_resp.values,
+        'Qtd Metas': [resp_counts.get(r, 0) for r in peso_por_resp.index]
+    })
+
+    prazos = df[['Entrega', 'Prazo', 'Status', 'Prioridade']].copy()
+    prazos['Prazo'] = pd.to_datetime(prazos['Prazo'], format='%d/%m/%Y', errors='coerce')
+    prazos = prazos.dropna(subset=['Prazo']).sort_values('Prazo')
+
+    return OkrStats(
+        total=len(df),
+        em_andamento=int(status_counts.get('Em andamento', 0)),
+        nao_iniciadas=int(status_counts.get('Não Iniciado', 0)),
+        peso_total=float(df['Peso_Num'].sum() * 100),
+        prioridade_alta=int((df['Prioridade'] == 'Alta').sum()),
+        status_counts=status_counts,
+        foco_counts=df['Foco'].value_counts(),
+        peso_por_foco=df.groupby('Foco')['Peso_Num'].sum().sort_values(ascending=True) * 100,
+        resp_counts=resp_counts,
+        resp_summary=resp_summary,
+        prazos=prazos,
+    )
+
+
+def okr_snapshot(df):
+    """Indicadores da página de OKRs em tabelas simples (para a CLI)."""
+    stats = compute_okr_stats(df)
+    return {
+        'kpis': {
+            'total': stats.total,
+            'em_andamento': stats.em_andamento,
+            'nao_iniciadas': stats.nao_iniciadas,
+            'peso_total': round(stats.peso_total, 2),
+            'prioridade_alta': stats.prioridade_alta,
+        },
+        'status_counts': stats.status_counts.rename('Quantidade').reset_index(),
+        'foco_counts': stats.foco_counts.rename('Quantidade').reset_index(),
+        'peso_por_foco': stats.peso_por_foco.rename('Peso (%)').reset_index(),
+        'resp_summary': stats.resp_summary,
+        'prazos': stats.prazos,
+    }
@@ -0,0 +1,188 @@
+"""Descoberta e leitura das planilhas trimestrais de OKR.
+
+Cada planilha em ``okr/`` pode ter uma ou mais abas de metas (``Proposta de
+Metas Q1``, ``Proposta de Metas Q2``...). O ano vem do nome do arquivo (ex:
+``OKRs_TwoBetter_Q1_2026.xlsx``) ou da própria aba; numa planilha com uma
+única aba de metas, o trimestre do nome do arquivo prevalece sobre o da aba
+(cópias do modelo costumam manter o nome da aba).
+
+As abas são lidas em modo somente leitura, linha a linha (``python-calamine``
+quando instalado, senão ``openpyxl`` em ``read_only``), todas numa única
+abertura da planilha. Cada aba processada vai para ``.cache/okr/`` em Feather,
+identificada pelo hash do conteúdo do arquivo, então editar a planilha
+invalida o cache e trocar de trimestre não reabre nenhum arquivo.
+"""
+import glob
+import hashlib
+import json
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from twobetter import cache as disk_cache
+from twobetter.okr import process_okr_frame
+
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:  # python-calamine é opcional
+    CalamineWorkbook = None
+
+OKR_CACHE_DIR = disk_cache.CACHE_DIR / "okr"
+
+# Incrementar sempre que o processamento da planilha mudar
+OKR_SCHEMA_VERSION = 1
+
+SHEET_RE = re.compile(r'metas\s*q([1-4])(?:\D*(20\d{2}))?', re.IGNORECASE)
+YEAR_RE = re.compile(r'(?<!\d)(20\d{2})(?!\d)')
+FILE_QUARTER_RE = re.compile(r'(?<![A-Za-z])Q([1-4])(?!\d)', re.IGNORECASE)
+# Nome dos arquivos de cache: <stem>.<digest>.v<versão>.<resto>
+CACHE_NAME_RE = re.compile(r'^(?P<stem>.*)\.(?P<digest>[0-9a-f]{16})\.v(?P<versao>\d+)\.[^.]+(?:\.feather)?$')
+
+
+@dataclass(frozen=True, order=True)
+class Quarter:
+    ano: int
+    trimestre: int
+    sheet: str
+
+    @property
+    def label(self):
+        return f"Q{self.trimestre} {self.ano}"
+
+
+@lru_cache(maxsize=64)
+def _digest(path, fingerprint):
+    sha = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for bloco in iter(lambda: f.read(1 << 20), b''):
+            sha.update(bloco)
+    return sha.hexdigest()[:16]
+
+
+def file_digest(path, fingerprint=None):
+    """Hash do conteúdo da planilha (memoizado pela impressão digital mtime + tamanho)."""
+    path = Path(path)
+    return _digest(path, fingerprint or disk_cache.file_fingerprint(path))
+
+
+def sheet_quarters(path, sheet_names):
+    """Abas de metas da planilha e o trimestre de cada uma."""
+    path = Path(path)
+    ano_arquivo = YEAR_RE.search(path.stem)
+    if ano_arquivo:
+        ano_padrao = int(ano_arquivo.group(1))
+    else:
+        ano_padrao = datetime.fromtimestamp(path.stat().st_mtime).year
+
+    trimestres = []
+    for nome in sheet_names:
+        encontrado = SHEET_RE.search(nome)
+        if encontrado:
+            ano = int(encontrado.group(2)) if encontrado.group(2) else ano_padrao
+            trimestres.append(Quarter(ano, int(encontrado.group(1)), nome))
+
+    trimestre_arquivo = FILE_QUARTER_RE.search(path.stem)
+    if len(trimestres) == 1 and trimestre_arquivo:
+        trimestres = [Quarter(trimestres[0].ano, int(trimestre_arquivo.group(1)), trimestres[0].sheet)]
+    return trimestres
+
+
+def _rows_to_frame(linhas):
+    linhas = iter(linhas)
+    cabecalho = next(linhas, None)
+    if cabecalho is None:
+        return pd.DataFrame()
+    # Linhas totalmente vazias (formatação sem conteúdo) ficam de fora
+    dados = [linha for linha in linhas if any(v not in (None, '') for v in linha)]
+    df = pd.DataFrame(dados, columns=list(cabecalho))
+    df = df.loc[:, [c is not None for c in df.columns]]
+    # Células vazias como NaN e tipos inferidos, igual ao pd.read_excel
+    return df.fillna(np.nan).infer_objects()
+
+
+def read_sheets(path):
+    """Lê todas as abas de metas numa única abertura; devolve ``{Quarter: frame}``."""
+    if CalamineWorkbook is not None:
+        planilha = CalamineWorkbook.from_path(str(path))
+        return {
+            trimestre: _rows_to_frame(planilha.get_sheet_by_name(trimestre.sheet).to_python())
+            for trimestre in sheet_quarters(path, planilha.sheet_names)
+        }
+
+    from openpyxl import load_workbook
+    planilha = load_workbook(path, read_only=True, data_only=True)
+    try:
+        return {
+            trimestre: _rows_to_frame(planilha[trimestre.sheet].iter_rows(values_only=True))
+            for trimestre in sheet_quarters(path, planilha.sheetnames)
+        }
+    finally:
+        planilha.close()
+
+
+def _manifest_path(path, digest):
+    return OKR_CACHE_DIR / f"{Path(path).stem}.{digest}.v{OKR_SCHEMA_VERSION}.json"
+
+
+def _sheet_path(path, digest, trimestre):
+    return OKR_CACHE_DIR / f"{Path(path).stem}.{digest}.v{OKR_SCHEMA_VERSION}.{trimestre.ano}q{trimestre.trimestre}.feather"
+
+
+def _read_cached(path, digest):
+    try:
+        manifesto = json.loads(_manifest_path(path, digest).read_text(encoding='utf-8'))
+        trimestres = [Quarter(**item) for item in manifesto]
+        return {t: disk_cache.read_frame(_sheet_path(path, digest, t)) for t in trimestres}
+    except (OSError, ValueError, TypeError, pa.ArrowException):
+        return None
+
+
+def _write_cached(path, digest, frames):
+    OKR_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    for trimestre, df in frames.items():
+        disk_cache.write_frame(df, _sheet_path(path, digest, trimestre))
+    manifesto = [{'ano': t.ano, 'trimestre': t.trimestre, 'sheet': t.sheet} for t in frames]
+    _manifest_path(path, digest).write_text(json.dumps(manifesto, ensure_ascii=False), encoding='utf-8')
+
+    # Remove caches de versões anteriores da mesma planilha. O stem precisa bater
+    # exatamente: o glob sozinho também pegaria outra planilha cujo nome começa
+    # igual (ex: "okr" e "okr.2026")
+    stem = Path(path).stem
+    for antigo in OKR_CACHE_DIR.glob(f"{glob.escape(stem)}.*"):
+        nome = CACHE_NAME_RE.match(antigo.name)
+        if nome is None or nome['stem'] != stem:
+            continue
+        if (nome['digest'], nome['versao']) != (digest, str(OKR_SCHEMA_VERSION)):
+            antigo.unlink(missing_ok=True)
+
+
+def load_workbook_quarters(path, fingerprint=None):
+    """Trimestres da planilha -> frame processado, do cache em disco quando possível."""
+    digest = file_digest(path, fingerprint)
+
+    frames = _read_cached(path, digest)
+    if frames is not None:
+        return frames
+
+    frames = {t: process_okr_frame(df) for t, df in read_sheets(path).items()}
+    try:
+        _write_cached(path, digest, frames)
+    except (OSError, pa.ArrowException):
+        pass
+    return frames
+
+
+def merge_quarters(workbooks):
+    """Junta os trimestres de várias planilhas (a mais recente vence) em ordem decrescente."""
+    trimestres = {}
+    for frames in workbooks:
+        for trimestre, df in frames.items():
+            trimestres[trimestre.label] = (trimestre, df)
+    ordem = sorted(trimestres.values(), key=lambda item: (item[0].ano, item[0].trimestre), reverse=True)
+    return {trimestre.label: df for trimestre, df in ordem}
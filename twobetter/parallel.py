@@ -0,0 +1,159 @@
+"""Leitura paralela das exportações do Jira em um pool de processos.
+
+Um CSV grande é dividido em faixas de bytes que terminam em fim de linha
+(fora de aspas, já que o ``Resumo`` pode conter quebras de linha); vários
+CSVs são distribuídos um por processo. Cada processo lê a sua parte e deriva
+as colunas (datas, ``Area``, tags) com ``process_jira_frame``. As categorias
+são unificadas no processo principal antes de concatenar, então o resultado
+é igual ao da leitura sequencial.
+
+O número de processos vem de ``TWOBETTER_WORKERS`` (padrão: núcleos
+disponíveis, até ``MAX_WORKERS``); ``TWOBETTER_WORKERS=1`` desliga o modo
+paralelo.
+"""
+import mmap
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from itertools import repeat
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from twobetter.jira import JIRA_COLUMNS, process_jira_frame, read_jira_csv
+from twobetter.schema import CATEGORICAL_COLUMNS, loaded_columns
+
+MAX_WORKERS = 8
+# Abaixo disso o custo de subir o pool (~0,5 s) não compensa
+MIN_PARALLEL_BYTES = 32 * 1024 * 1024
+# Faixas por processo: partes menores equilibram melhor a carga
+CHUNKS_PER_WORKER = 2
+
+_QUOTE = ord('"')
+
+
+def worker_count(workers=None):
+    """Processos a usar: argumento, ``TWOBETTER_WORKERS`` ou núcleos disponíveis."""
+    if workers is None:
+        workers = os.environ.get('TWOBETTER_WORKERS') or None
+    if workers is None:
+        if hasattr(os, 'sched_getaffinity'):
+            nucleos = len(os.sched_getaffinity(0))
+        else:
+            nucleos = os.cpu_count() or 1
+        return min(nucleos, MAX_WORKERS)
+    return max(1, int(workers))
+
+
+def _pool(workers):
+    # forkserver/spawn: o app e o observador têm threads, e fork com threads não é seguro
+    metodos = multiprocessing.get_all_start_methods()
+    contexto = multiprocessing.get_context('forkserver' if 'forkserver' in metodos else 'spawn')
+    return ProcessPoolExecutor(max_workers=workers, mp_context=contexto)
+
+
+def _row_end(buf, arr, pos, aspas):
+    """Início da próxima linha a partir de ``pos``, pulando quebras entre aspas.
+
+    ``aspas`` é a paridade de aspas acumulada até ``pos``.
+    """
+    while True:
+        nl = buf.find(b'\n', pos)
+        if nl < 0:
+            return len(buf)
+        aspas ^= int(np.count_nonzero(arr[pos:nl] == _QUOTE)) & 1
+        pos = nl + 1
+        if not aspas:
+            return pos
+
+
+def split_ranges(file_path, partes):
+    """Divide o CSV em até ``partes`` faixas ``(inicio, fim)`` de linhas inteiras.
+
+    Retorna também os bytes do cabeçalho, que ficam fora das faixas.
+    """
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        arr = np.frombuffer(buf, dtype=np.uint8)
+        try:
+            corpo = _row_end(buf, arr, 0, 0)
+            cabecalho = buf[:corpo]
+            passo = -(-(len(buf) - corpo) // partes)
+
+            limites = [corpo]
+            pos, aspas = corpo, 0
+            for k in range(1, partes):
+                alvo = corpo + k * passo
+                if alvo <= pos:
+                    continue
+                if alvo >= len(buf):
+                    break
+                # Paridade das aspas até o alvo; a faixa termina no fim de linha seguinte
+                aspas = (aspas + int(np.count_nonzero(arr[pos:alvo] == _QUOTE))) & 1
+                pos = _row_end(buf, arr, alvo, aspas)
+                aspas = 0
+                limites.append(pos)
+            limites.append(len(buf))
+        finally:
+            del arr
+
+    faixas = [(a, b) for a, b in zip(limites, limites[1:]) if b > a]
+    return cabecalho, faixas
+
+
+def _parse_range(file_path, inicio, fim):
+    with open(file_path, 'rb') as f:
+        f.seek(inicio)
+        corpo = f.read(fim - inicio)
+    df = pd.read_csv(BytesIO(corpo), header=None, names=JIRA_COLUMNS, usecols=loaded_columns(),
+                     encoding='utf-8')
+    return process_jira_frame(df)
+
+
+def concat_frames(frames):
+    """Concatena frames mantendo as colunas categóricas (categorias unificadas)."""
+    frames = [df.copy(deep=False) for df in frames]
+    for coluna in CATEGORICAL_COLUMNS:
+        partes = [df[coluna] for df in frames if coluna in df.columns]
+        if len(partes) < 2 or not all(isinstance(p.dtype, pd.CategoricalDtype) for p in partes):
+            continue
+        categorias = union_categoricals(partes, sort_categories=True).categories
+        for df in frames:
+            df[coluna] = df[coluna].cat.set_categories(categorias)
+
+    df = pd.concat(frames, ignore_index=True)
+
+    datas_invalidas = {}
+    for parte in frames:
+        for coluna, valores in parte.attrs.get('datas_invalidas', {}).items():
+            datas_invalidas.setdefault(coluna, []).extend(valores)
+    df.attrs['datas_invalidas'] = datas_invalidas
+    return df
+
+
+def read_jira_csv_parallel(file_path, workers=None, min_bytes=MIN_PARALLEL_BYTES):
+    """Mesmo resultado de ``read_jira_csv``, dividindo arquivos grandes entre processos."""
+    workers = worker_count(workers)
+    if workers == 1 or Path(file_path).stat().st_size < min_bytes:
+        return read_jira_csv(file_path)
+
+    cabecalho, faixas = split_ranges(file_path, workers * CHUNKS_PER_WORKER)
+    if len(cabecalho.decode('utf-8-sig').split(',')) != len(JIRA_COLUMNS) or len(faixas) < 2:
+        return read_jira_csv(file_path)
+
+    inicios, fins = zip(*faixas)
+    with _pool(min(workers, len(faixas))) as pool:
+        frames = list(pool.map(_parse_range, repeat(file_path), inicios, fins))
+    return concat_frames(frames)
+
+
+def read_jira_csvs(files, workers=None):
+    """Lê vários CSVs (um por processo); um arquivo sozinho é dividido em faixas."""
+    workers = worker_count(workers)
+    if len(files) < 2 or workers == 1:
+        return [read_jira_csv_parallel(f, workers) for f in files]
+
+    with _pool(min(workers, len(files))) as pool:
+        return list(pool.map(read_jira_csv, files))
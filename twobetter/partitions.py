@@ -0,0 +1,218 @@
+"""Partições do Jira por projeto e mês de criação, lidas sob demanda.
+
+Uma exportação com vários squads vira um arquivo Feather por partição em
+``.cache/partitions/<dados>/``: o projeto vem do prefixo da ``Chave``
+(``SCRUM-42`` -> ``SCRUM``) e o mês do ``Criado`` (tarefas sem data ficam na
+partição ``sem-data``). O manifesto guarda, para cada partição, a quantidade
+de linhas e a primeira e a última data. Assim o seletor de projeto e o filtro
+de período escolhem as partições antes de ler qualquer dado, e só elas são
+lidas (via memory-map) e agregadas.
+
+As partições são gravadas uma vez por versão dos dados (mesma chave de
+``data.dataset_key``), a partir do frame completo: pelo observador assim que
+aquece os dados, ou na primeira vez em que são pedidas.
+"""
+import hashlib
+import json
+import os
+import shutil
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from twobetter import cache as disk_cache
+
+PARTITION_DIR = disk_cache.CACHE_DIR / "partitions"
+
+# Incrementar sempre que o formato das partições ou do manifesto mudar
+PARTITION_VERSION = 1
+
+# Quantidade de versões dos dados mantidas em disco (as mais recentes)
+MAX_STORES = 4
+
+SEM_DATA = 'sem-data'
+SEM_PROJETO = '?'
+
+# Posição original da linha, para remontar o recorte na ordem do frame completo
+_POSICAO = '_posicao'
+
+_ERROS = (OSError, ValueError, KeyError, pa.ArrowException)
+
+
+@dataclass(frozen=True)
+class Partition:
+    projeto: str
+    mes: str                 # 'AAAA-MM' ou SEM_DATA
+    linhas: int
+    inicio: object           # primeira/última data de criação (Timestamp) ou None
+    fim: object
+
+    @property
+    def nome(self):
+        return f"{self.projeto}.{self.mes}"
+
+    def overlaps(self, inicio, fim):
+        """Se a partição tem tarefas criadas entre ``inicio`` e ``fim`` (datas, inclusive)."""
+        return self.inicio is not None and self.inicio.date() <= fim and self.fim.date() >= inicio
+
+
+@dataclass(frozen=True)
+class PartitionManifest:
+    partitions: tuple = ()
+    datas_invalidas: dict = None
+
+    def projects(self):
+        return sorted({p.projeto for p in self.partitions})
+
+    def select(self, projetos=None, periodo=None):
+        """Partições do recorte: projetos (vazio = todos) e período ``(inicio, fim)``.
+
+        Com período, as tarefas sem data ficam de fora, como no filtro do índice.
+        """
+        selecionadas = self.partitions
+        if projetos:
+            selecionadas = [p for p in selecionadas if p.projeto in projetos]
+        if periodo:
+            selecionadas = [p for p in selecionadas if p.overlaps(*periodo)]
+        return tuple(selecionadas)
+
+    def date_bounds(self, projetos=None):
+        """Menor e maior data dos projetos (``Timestamp``) ou ``(None, None)`` sem datas."""
+        datadas = [p for p in self.select(projetos) if p.inicio is not None]
+        if not datadas:
+            return None, None
+        return min(p.inicio for p in datadas), max(p.fim for p in datadas)
+
+
+def _labels(codigos, valores, rotulo, vazio):
+    """Rótulo de cada linha a partir dos códigos de ``pd.factorize`` (-1 vira ``vazio``)."""
+    rotulos = np.array([rotulo(v) or vazio for v in valores] + [vazio], dtype=object)
+    return rotulos[codigos]
+
+
+def project_of(chaves):
+    """Projeto de cada tarefa: o prefixo da chave antes do primeiro '-'."""
+    prefixos = chaves.astype('string').str.replace(r'-.*$', '', regex=True)
+    # Normaliza só os prefixos distintos, não cada linha
+    return _labels(*pd.factorize(prefixos), lambda v: str(v).strip().upper(), SEM_PROJETO)
+
+
+def month_of(criado):
+    """Mês de criação ('AAAA-MM') de cada tarefa; SEM_DATA quando não há data."""
+    meses = criado.to_numpy(dtype='datetime64[ns]').astype('datetime64[M]')
+    return _labels(*pd.factorize(meses), lambda v: str(v)[:7], SEM_DATA)
+
+
+def store_path(key):
+    chave = hashlib.sha1(repr((key, PARTITION_VERSION)).encode('utf-8')).hexdigest()[:16]
+    return PARTITION_DIR / chave
+
+
+def _timestamp(valor):
+    return None if valor is None else pd.Timestamp(valor)
+
+
+@lru_cache(maxsize=8)
+def _read_manifest(path, mtime_ns):
+    conteudo = json.loads((Path(path) / "manifest.json").read_text(encoding='utf-8'))
+    return PartitionManifest(
+        partitions=tuple(Partition(p['projeto'], p['mes'], p['linhas'],
+                                   _timestamp(p['inicio']), _timestamp(p['fim']))
+                         for p in conteudo['partitions']),
+        datas_invalidas=conteudo.get('datas_invalidas', {}),
+    )
+
+
+def _prune(pasta):
+    lojas = sorted((d for d in pasta.iterdir() if d.is_dir()),
+                   key=lambda d: d.stat().st_mtime, reverse=True)
+    for antiga in lojas[MAX_STORES:]:
+        shutil.rmtree(antiga, ignore_errors=True)
+
+
+def write_partitions(df, path):
+    """Grava uma partição por (projeto, mês) de ``df`` e o manifesto em ``path``."""
+    tmp_path = path.with_name(path.name + f".{os.getpid()}.tmp")
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    tmp_path.mkdir(parents=True)
+
+    frame = df.assign(**{_POSICAO: np.arange(len(df), dtype=np.int64)})
+    grupos = frame.groupby([project_of(df['Chave']), month_of(df['Criado'])], sort=True)
+
+    particoes = []
+    for (projeto, mes), parte in grupos:
+        criado = parte['Criado'].dropna()
+        particao = Partition(projeto, mes, len(parte),
+                             criado.min() if len(criado) else None, criado.max() if len(criado) else None)
+        parte = parte.reset_index(drop=True)
+        parte.attrs = {}     # as datas inválidas vão uma vez só, no manifesto
+        disk_cache.write_frame(parte, tmp_path / f"{particao.nome}.feather")
+        particoes.append({'projeto': projeto, 'mes': mes, 'linhas': particao.linhas,
+                          'inicio': None if particao.inicio is None else particao.inicio.isoformat(),
+                          'fim': None if particao.fim is None else particao.fim.isoformat()})
+
+    manifesto = {'version': PARTITION_VERSION, 'partitions': particoes,
+                 'datas_invalidas': df.attrs.get('datas_invalidas', {})}
+    (tmp_path / "manifest.json").write_text(json.dumps(manifesto, indent=2, default=str), encoding='utf-8')
+
+    # Troca a pasta inteira de uma vez (outro processo pode ter gravado a mesma versão)
+    try:
+        os.replace(tmp_path, path)
+    except OSError:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        if not path.exists():
+            raise
+    _prune(path.parent)
+    return path
+
+
+class PartitionStore:
+    """Manifesto e leitura das partições de uma versão dos dados."""
+
+    def __init__(self, path, manifest):
+        self.path = path
+        self.manifest = manifest
+
+    @classmethod
+    def open(cls, key):
+        """Partições já gravadas para ``key``, ou ``None``."""
+        return cls.from_path(store_path(key))
+
+    @classmethod
+    def from_path(cls, path):
+        try:
+            # Um stat por chamada; o manifesto só é relido se o arquivo mudar
+            manifest = _read_manifest(str(path), (path / "manifest.json").stat().st_mtime_ns)
+        except _ERROS:
+            return None
+        return cls(path, manifest) if manifest.partitions else None
+
+    @classmethod
+    def open_or_build(cls, key, load):
+        """Partições de ``key``; sem elas, grava a partir do frame de ``load()``.
+
+        Se não for possível gravar (ex: disco somente leitura), retorna ``None``.
+        """
+        store = cls.open(key)
+        if store is not None:
+            return store
+        try:
+            write_partitions(load(), store_path(key))
+        except _ERROS:
+            return None
+        return cls.open(key)
+
+    def read(self, particoes):
+        """Frame com as tarefas das partições, na ordem do frame completo."""
+        frames = [disk_cache.read_frame(self.path / f"{p.nome}.feather") for p in particoes]
+        if not frames:
+            # Recorte vazio: mesmas colunas e tipos, sem linhas
+            frames = [disk_cache.read_frame(self.path / f"{self.manifest.partitions[0].nome}.feather").iloc[:0]]
+        df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+        df = df.sort_values(_POSICAO, kind='stable', ignore_index=True).drop(columns=_POSICAO)
+        df.attrs['datas_invalidas'] = dict(self.manifest.datas_invalidas or {})
+        return df
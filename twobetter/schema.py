@@ -0,0 +1,114 @@
+"""Esquema compacto do frame do Jira.
+
+Cada coluna da exportação tem um tipo definido em ``JIRA_SCHEMA``:
+
+- ``category``: poucos valores distintos (tipo, status, pessoas, área);
+- ``id``: IDs de conta de 36 caracteres, guardados uma única vez como
+  categorias (cada linha só carrega o código);
+- ``string``: texto livre em strings Arrow (``Resumo``, ``Chave``);
+- ``integer``: reduzido ao menor inteiro que comporta os valores;
+- ``datetime``/``bool``: mantidos como estão.
+
+Colunas marcadas com ``None`` não são usadas por nenhuma página e nem
+chegam a ser lidas do CSV. ``memory_report`` compara o uso de memória por
+coluna antes e depois da compactação.
+"""
+import pickle
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+JIRA_SCHEMA = {
+    'Tipo': 'category',
+    'Chave': 'string',
+    'ID': 'integer',
+    'Resumo': 'string',
+    'Responsavel': 'category',
+    'ID_Responsavel': 'id',
+    'Relator': None,
+    'ID_Relator': None,
+    'Prioridade': 'category',
+    'Status': 'category',
+    'Resolucao': None,
+    'Criado': 'datetime',
+    'Atualizado': 'datetime',
+    'Data_Limite': None,
+}
+
+# Colunas derivadas no processamento
+DERIVED_SCHEMA = {'Area': 'category'}
+
+CATEGORICAL_COLUMNS = [c for c, t in {**JIRA_SCHEMA, **DERIVED_SCHEMA}.items() if t in ('category', 'id')]
+STRING_COLUMNS = [c for c, t in JIRA_SCHEMA.items() if t == 'string']
+DROPPED_COLUMNS = [c for c, t in JIRA_SCHEMA.items() if t is None]
+
+
+def loaded_columns():
+    """Colunas da exportação que são lidas do CSV."""
+    return [c for c, t in JIRA_SCHEMA.items() if t is not None]
+
+
+def _arrow_string_dtype():
+    # Strings Arrow com NaN como ausente (mesma semântica do texto em object)
+    try:
+        return pd.StringDtype('pyarrow', na_value=np.nan)
+    except TypeError:  # pandas < 2.3
+        return pd.StringDtype('pyarrow_numpy')
+
+
+STRING_DTYPE = _arrow_string_dtype()
+
+
+def arrow_types_mapper(tipo):
+    """``types_mapper`` para ``Table.to_pandas``: texto Arrow continua Arrow."""
+    if tipo in (pa.string(), pa.large_string()):
+        return STRING_DTYPE
+    return None
+
+
+def to_categoricals(df, columns):
+    for coluna in columns:
+        if coluna in df.columns and not isinstance(df[coluna].dtype, pd.CategoricalDtype):
+            df[coluna] = df[coluna].astype('category')
+    return df
+
+
+def compact(df):
+    """Aplica o esquema compacto (idempotente: colunas já compactas não mudam)."""
+    df = df.drop(columns=[c for c in DROPPED_COLUMNS if c in df.columns])
+    to_categoricals(df, CATEGORICAL_COLUMNS)
+
+    for coluna in STRING_COLUMNS:
+        if coluna in df.columns and df[coluna].dtype != STRING_DTYPE:
+            df[coluna] = df[coluna].astype(STRING_DTYPE)
+
+    for coluna, tipo in JIRA_SCHEMA.items():
+        if tipo == 'integer' and coluna in df.columns and df[coluna].dtype.kind in 'iu':
+            df[coluna] = pd.to_numeric(df[coluna], downcast='integer')
+
+    return df
+
+
+def memory_usage(df):
+    """Bytes por coluna (contando o conteúdo das strings)."""
+    return df.memory_usage(deep=True, index=False)
+
+
+def pickled_size(df):
+    """Bytes de uma cópia serializada, como a que o ``st.cache_data`` guarda."""
+    return len(pickle.dumps(df, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def memory_report(antes, depois):
+    """Memória por coluna antes e depois da compactação, em MB."""
+    relatorio = pd.DataFrame({
+        'Antes (MB)': memory_usage(antes) / 2**20,
+        'Depois (MB)': memory_usage(depois) / 2**20,
+    }).reindex(antes.columns.union(depois.columns, sort=False)).fillna(0)
+    relatorio.loc['Total'] = relatorio.sum()
+    relatorio['Redução'] = (relatorio['Antes (MB)'] / relatorio['Depois (MB)']).replace(np.inf, np.nan)
+    relatorio['Tipo antes'] = antes.dtypes.astype(str)
+    relatorio['Tipo depois'] = depois.dtypes.astype(str)
+    relatorio.loc[relatorio.index.isin(antes.columns.difference(depois.columns)), 'Tipo depois'] = 'removida'
+    return relatorio.rename_axis('Coluna').round(2)
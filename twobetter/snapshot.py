@@ -0,0 +1,128 @@
+"""Resumo pré-calculado da visão padrão, para a primeira pintura do app.
+
+Numa sessão fria (ex: Streamlit Cloud acordando), o Dashboard precisaria
+ler o CSV, montar o índice e agregar tudo antes de mostrar qualquer coisa. O
+``Snapshot`` guarda o resultado da visão sem filtros: KPIs, distribuições,
+desempenho por dev, timeline em todas as granularidades, as opções dos filtros
+da sidebar e, para a página de OKRs, os trimestres e o progresso pelo Jira.
+A atividade recente (últimos 7 dias a partir de agora) fica de fora: num
+snapshot de dias atrás ela estaria errada, então só aparece com os dados.
+O app desenha a partir dele enquanto o observador aquece os dados completos
+em segundo plano; mudar um filtro passa a usar o dataset.
+
+O arquivo fica em ``.cache/snapshots/`` e é identificado pela chave dos
+dados (CSV, planilhas, regras de vínculo e versão do processamento): dados
+novos geram outro snapshot, gravado pelo observador assim que os aquece ou
+pela CLI (``python -m twobetter snapshot``).
+
+Ler um snapshot não importa a camada do Jira (índice, cubo, agregador): os
+KPIs ficam num dicionário simples e só viram ``DashboardStats`` no
+Dashboard, que a importa de qualquer forma.
+"""
+import hashlib
+import os
+import pickle
+from dataclasses import dataclass, fields
+from datetime import datetime
+
+from twobetter import cache as disk_cache
+
+SNAPSHOT_DIR = disk_cache.CACHE_DIR / "snapshots"
+
+# Incrementar sempre que o conteúdo do Snapshot mudar
+SNAPSHOT_VERSION = 3
+
+# Quantidade de snapshots mantidos em disco (os mais recentes)
+MAX_SNAPSHOTS = 4
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    key: tuple
+    gerado_em: datetime
+    linhas: int
+    datas_invalidas: dict
+    date_bounds: tuple       # (primeira, última) data de criação, ou (None, None)
+    options: dict            # coluna filtrável -> valores (sidebar)
+    filtros: dict            # filtros da visão padrão (período inteiro)
+    stats: dict              # campos de DashboardStats, sem recent_summary (ver ``dashboard_stats``)
+    timelines: dict          # granularidade -> Periodo, Status, Quantidade
+    okr: dict                # trimestre -> frame das metas
+    okr_progress: dict       # trimestre -> progresso pelo Jira, sem filtros de OKR
+
+    def matches(self, filtros):
+        """Se ``filtros`` é a visão padrão que o snapshot cobre."""
+        return filtros == self.filtros
+
+    def dashboard_stats(self):
+        from twobetter.kpis import DashboardStats
+        return DashboardStats(**self.stats)
+
+
+def snapshot_key(jira_key, okr_key, regras_fingerprint):
+    return (jira_key, okr_key, regras_fingerprint, SNAPSHOT_VERSION)
+
+
+def snapshot_path(key):
+    chave = hashlib.sha1(repr(key).encode('utf-8')).hexdigest()[:16]
+    return SNAPSHOT_DIR / f"{chave}.pickle"
+
+
+def build_snapshot(key, dataset, filtros, recent_date, trimestres, regras):
+    """Calcula a visão padrão de ``dataset`` (filtros já com o período inteiro)."""
+    from twobetter.cube import GRANULARIDADES
+    from twobetter.filters import FILTER_COLUMNS
+
+    okr_progress = {}
+    if regras is not None:
+        okr_progress = {trimestre: dataset.okr_progress(df_okr, regras)
+                        for trimestre, df_okr in trimestres.items()}
+
+    return Snapshot(
+        key=key,
+        gerado_em=datetime.now(),
+        linhas=len(dataset.df),
+        datas_invalidas=dict(dataset.df.attrs.get('datas_invalidas', {})),
+        date_bounds=dataset.index.date_bounds(),
+        options={coluna: dataset.index.options(coluna) for coluna in FILTER_COLUMNS},
+        filtros=dict(filtros),
+        stats=_fields(dataset.stats(filtros, recent_date)),
+        timelines={g: dataset.timeline(filtros, g) for g in GRANULARIDADES},
+        okr=dict(trimestres),
+        okr_progress=okr_progress,
+    )
+
+
+def _fields(stats):
+    campos = {campo.name: getattr(stats, campo.name) for campo in fields(stats)}
+    # Relativa à hora de gravação: não vale para quem abre o app depois
+    campos['recent_summary'] = None
+    return campos
+
+
+def _prune():
+    snapshots = sorted(SNAPSHOT_DIR.glob("*.pickle"), key=lambda f: f.stat().st_mtime, reverse=True)
+    for antigo in snapshots[MAX_SNAPSHOTS:]:
+        antigo.unlink(missing_ok=True)
+
+
+def write_snapshot(snapshot):
+    path = snapshot_path(snapshot.key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + f".{os.getpid()}.tmp")
+    with open(tmp_path, 'wb') as arquivo:
+        pickle.dump(snapshot, arquivo, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+    _prune()
+    return path
+
+
+def load_snapshot(key):
+    """Snapshot salvo para ``key``, ou ``None`` (inexistente, de outra versão ou ilegível)."""
+    path = snapshot_path(key)
+    try:
+        with open(path, 'rb') as arquivo:
+            snapshot = pickle.load(arquivo)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+    return snapshot if isinstance(snapshot, Snapshot) and snapshot.key == key else None
@@ -0,0 +1,334 @@
+"""Backend SQL embutido para os filtros e agregações do Dashboard.
+
+Alternativa ao caminho em pandas (``FilterIndex`` + ``DashboardAggregator``
++ cubo), ativada com ``TWOBETTER_BACKEND=sql``. Os dados processados vão para
+um arquivo em ``.cache/sql/`` (DuckDB, se instalado; senão SQLite, da
+biblioteca padrão) com as tabelas:
+
+- ``contagens``: quantidade de tarefas por dia de criação × Status ×
+  Responsável × Tipo × Área (com os rótulos de semana e mês), de onde saem
+  os KPIs, as distribuições, o desempenho por dev e a timeline com período;
+- ``totais``, ``serie_semana`` e ``serie_mes``: as mesmas contagens sem o
+  dia, por semana e por mês, para o caso comum sem filtro de período (bem
+  menos linhas a somar);
+- ``tarefas``: uma linha por tarefa só com as colunas filtráveis e as datas,
+  para a atividade recente (``Atualizado``), que não cabe nas contagens.
+
+Os filtros da sidebar viram cláusulas ``WHERE`` com parâmetros (``?``) e cada
+consulta devolve poucas linhas (uma por status, área ou dev), montadas nas
+mesmas estruturas do caminho em pandas. O arquivo é identificado pela chave
+do dataset, então é construído uma vez por versão dos dados e reaberto nas
+próximas execuções. Bancos ainda abertos por um ``SqlStore`` vivo nunca são
+apagados pela limpeza dos antigos.
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+import uuid
+import weakref
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from twobetter import cache as disk_cache
+from twobetter.cube import DIMENSIONS, GRANULARIDADES
+from twobetter.kpis import STATUS_CONCLUIDO, STATUS_EM_ANDAMENTO, STATUS_PENDENTE, DashboardStats
+
+try:
+    import duckdb
+except ImportError:  # duckdb é opcional
+    duckdb = None
+
+SQL_DIR = disk_cache.CACHE_DIR / "sql"
+
+# Falhas do banco (disco somente leitura, arquivo corrompido...): o dataset volta ao pandas
+SQL_ERRORS = (OSError, sqlite3.Error) + ((duckdb.Error,) if duckdb is not None else ())
+
+# Incrementar sempre que as tabelas ou as consultas mudarem
+SQL_VERSION = 2
+
+# Quantidade de bancos mantidos em disco (os mais recentes)
+MAX_DATABASES = 4
+
+TASK_COLUMNS = ['Responsavel', 'Status', 'Tipo', 'Area', 'Criado', 'Atualizado']
+
+# Granularidade da timeline -> tabela já somada (sem filtro de período)
+SERIES = {'Semana': 'serie_semana', 'Mes': 'serie_mes'}
+
+# Atividade recente: índice que cobre a consulta inteira (sem ler a tabela)
+INDEXES = {
+    'contagens': [('Dia',)],
+    'tarefas': [('Atualizado', 'Responsavel', 'Status', 'Tipo', 'Criado')],
+}
+
+
+def engine_name():
+    return 'duckdb' if duckdb is not None else 'sqlite'
+
+
+def database_path(dataset_key, engine=None):
+    engine = engine or engine_name()
+    chave = hashlib.sha1(repr((dataset_key, SQL_VERSION)).encode('utf-8')).hexdigest()[:16]
+    return SQL_DIR / f"{chave}.{engine}"
+
+
+# Bancos em uso por algum SqlStore deste processo (ex: datasets em cache no app)
+_abertos = weakref.WeakSet()
+
+
+def _prune(engine):
+    em_uso = {store.path for store in list(_abertos)}
+    bancos = sorted(SQL_DIR.glob(f"*.{engine}"), key=lambda f: f.stat().st_mtime, reverse=True)
+    for antigo in bancos[MAX_DATABASES:]:
+        if antigo not in em_uso:
+            antigo.unlink(missing_ok=True)
+
+
+def _epoch_ns(valores):
+    """Datas em ns desde a época (``None`` para NaT), comparáveis como inteiro."""
+    datas = valores.to_numpy(dtype='datetime64[ns]').view('i8')
+    return pd.arrays.IntegerArray(datas, datas == np.iinfo(np.int64).min)
+
+
+def _text(valores):
+    return valores.astype(object).where(valores.notna(), None)
+
+
+def build_tables(df):
+    """Tabelas ``contagens`` e ``tarefas`` a partir do frame processado."""
+    tarefas = pd.DataFrame({coluna: _text(df[coluna]) for coluna in DIMENSIONS})
+    tarefas['Criado'] = _epoch_ns(df['Criado'])
+    tarefas['Atualizado'] = _epoch_ns(df['Atualizado'])
+
+    dias = df['Criado'].dt.floor('D')
+    contagens = (
+        df[DIMENSIONS].assign(Data=dias)
+        .groupby(['Data'] + DIMENSIONS, observed=True, dropna=False)
+        .size()
+        .reset_index(name='Quantidade')
+    )
+    contagens = contagens[contagens['Quantidade'] > 0]
+    datas = contagens['Data']
+    resultado = pd.DataFrame({
+        # Rótulos iguais aos do cubo em pandas
+        'Dia': _text(datas.dt.strftime('%Y-%m-%d')),
+        'Semana': _text(datas.dt.to_period('W').astype(str).where(datas.notna())),
+        'Mes': _text(datas.dt.to_period('M').astype(str).where(datas.notna())),
+    })
+    for coluna in DIMENSIONS:
+        resultado[coluna] = _text(contagens[coluna])
+    resultado['Quantidade'] = contagens['Quantidade'].astype('int64')
+    resultado = resultado.reset_index(drop=True)
+
+    def somar(colunas):
+        return (resultado.groupby(colunas, dropna=False, sort=False)['Quantidade']
+                .sum().reset_index())
+
+    tabelas = {'contagens': resultado, 'totais': somar(DIMENSIONS), 'tarefas': tarefas[TASK_COLUMNS]}
+    for coluna, tabela in SERIES.items():
+        tabelas[tabela] = somar([coluna, 'Status'] + [d for d in DIMENSIONS if d != 'Status'])
+    return tabelas
+
+
+def _create_sqlite(path, tabelas):
+    con = sqlite3.connect(path)
+    try:
+        for nome, tabela in tabelas.items():
+            tipos = ', '.join(
+                f'"{c}" {"INTEGER" if pd.api.types.is_integer_dtype(tabela[c]) else "TEXT"}'
+                for c in tabela.columns
+            )
+            con.execute(f'CREATE TABLE {nome} ({tipos})')
+            marcadores = ', '.join('?' * len(tabela.columns))
+            # Linhas como tuplas de objetos Python (pd.NA -> None)
+            linhas = tabela.astype(object).where(tabela.notna(), None).itertuples(index=False, name=None)
+            con.executemany(f'INSERT INTO {nome} VALUES ({marcadores})', linhas)
+        _create_indexes(con)
+        con.execute('ANALYZE')
+        con.commit()
+    finally:
+        con.close()
+
+
+def _create_duckdb(path, tabelas):
+    con = duckdb.connect(str(path))
+    try:
+        for nome, tabela in tabelas.items():
+            con.register('origem', tabela)
+            con.execute(f'CREATE TABLE {nome} AS SELECT * FROM origem')
+            con.unregister('origem')
+        _create_indexes(con)
+    finally:
+        con.close()
+
+
+def _create_indexes(con):
+    for tabela, indices in INDEXES.items():
+        for colunas in indices:
+            nome = f"ix_{tabela}_{'_'.join(colunas).lower()}"
+            con.execute(f'CREATE INDEX {nome} ON {tabela} ({", ".join(colunas)})')
+
+
+def _where(filtros, coluna_data):
+    """Cláusula ``WHERE`` com parâmetros para os filtros de ``data.jira_filters``."""
+    condicoes, parametros = [], []
+    for coluna, valor in filtros.items():
+        if valor is None:
+            continue
+        if coluna == 'periodo':
+            inicio, fim = valor
+            if coluna_data == 'Dia':
+                condicoes.append('Dia BETWEEN ? AND ?')
+                parametros += [pd.Timestamp(inicio).strftime('%Y-%m-%d'), pd.Timestamp(fim).strftime('%Y-%m-%d')]
+            else:
+                # Dias inteiros, inclusive (como em ``FilterIndex.date_mask``)
+                condicoes.append(f'{coluna_data} >= ? AND {coluna_data} < ?')
+                parametros += [pd.Timestamp(inicio).floor('D').as_unit('ns').value,
+                               (pd.Timestamp(fim).floor('D') + pd.Timedelta(days=1)).as_unit('ns').value]
+        elif coluna in DIMENSIONS:
+            condicoes.append(f'{coluna} = ?')
+            parametros.append(valor)
+        else:
+            raise ValueError(f"Filtro desconhecido: {coluna}")
+    return (' WHERE ' + ' AND '.join(condicoes)) if condicoes else '', parametros
+
+
+def _sorted_counts(serie):
+    # Mesma ordem do caminho em pandas: contagem decrescente, empate em ordem alfabética
+    serie = serie[serie > 0].sort_index()
+    return serie.sort_values(ascending=False, kind='stable')
+
+
+class SqlStore:
+    """Consultas do Dashboard sobre o banco embutido de um dataset."""
+
+    def __init__(self, path, engine=None):
+        self.path = Path(path)
+        self.engine = engine or engine_name()
+        self._local = threading.local()
+        self._duckdb = None
+        _abertos.add(self)
+
+    @classmethod
+    def open_or_build(cls, df, dataset_key=None, engine=None):
+        """Abre o banco salvo para ``dataset_key`` ou o constrói a partir de ``df``.
+
+        Sem chave (ex: frame montado na hora), o banco fica num arquivo temporário
+        em ``.cache/sql/``, apagado quando o ``SqlStore`` deixa de ser usado.
+        """
+        engine = engine or engine_name()
+        temporario = dataset_key is None
+        if temporario:
+            path = SQL_DIR / f"tmp-{os.getpid()}-{uuid.uuid4().hex[:12]}.{engine}"
+        else:
+            path = database_path(dataset_key, engine)
+        if not path.exists():
+            SQL_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(path.name + f".{os.getpid()}.tmp")
+            tmp_path.unlink(missing_ok=True)
+            tabelas = build_tables(df)
+            if engine == 'duckdb':
+                _create_duckdb(tmp_path, tabelas)
+            else:
+                _create_sqlite(tmp_path, tabelas)
+            os.replace(tmp_path, path)
+            _prune(engine)
+        store = cls(path, engine)
+        if temporario:
+            weakref.finalize(store, path.unlink, missing_ok=True)
+        return store
+
+    def _cursor(self):
+        # Uma conexão (somente leitura) por thread: cada sessão do Streamlit roda na sua
+        con = getattr(self._local, 'con', None)
+        if con is None:
+            if self.engine == 'duckdb':
+                if self._duckdb is None:
+                    self._duckdb = duckdb.connect(str(self.path), read_only=True)
+                con = self._duckdb.cursor()
+            else:
+                con = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+            self._local.con = con
+        return con
+
+    def query(self, sql, parametros=()):
+        """Resultado da consulta como DataFrame (poucas linhas)."""
+        cursor = self._cursor().execute(sql, list(parametros))
+        colunas = [descricao[0] for descricao in cursor.description]
+        return pd.DataFrame(cursor.fetchall(), columns=colunas)
+
+    def stats(self, filtros, recent_since):
+        """Mesmo resultado de ``DashboardAggregator.compute`` para os filtros."""
+        where, parametros = _where(filtros, 'Dia')
+        tabela = 'contagens' if filtros.get('periodo') else 'totais'
+        grupos = self.query(
+            f'SELECT Responsavel, Status, Area, SUM(Quantidade) AS Quantidade '
+            f'FROM {tabela}{where} GROUP BY Responsavel, Status, Area',
+            parametros
+        )
+        grupos['Quantidade'] = grupos['Quantidade'].astype('int64')
+        com_status = grupos[grupos['Status'].notna()]
+        status_counts = com_status.groupby('Status')['Quantidade'].sum()
+
+        def contagem_status(nome):
+            return int(status_counts.get(nome, 0))
+
+        # O total por dev conta também as tarefas sem Status
+        por_dev = grupos[grupos['Responsavel'].notna()]
+        dev_stats = pd.DataFrame({
+            'Total': por_dev.groupby('Responsavel')['Quantidade'].sum(),
+            'Concluidas': por_dev['Quantidade'].where(por_dev['Status'] == STATUS_CONCLUIDO, 0)
+                                               .groupby(por_dev['Responsavel']).sum(),
+        }).sort_index()
+        dev_stats.index.name = 'Responsavel'
+        dev_stats = dev_stats[dev_stats['Total'] > 0]
+        dev_stats['Pendentes'] = dev_stats['Total'] - dev_stats['Concluidas']
+        dev_stats['Taxa_Conclusao'] = (dev_stats['Concluidas'] / dev_stats['Total'] * 100).round(1)
+        dev_stats = dev_stats.sort_values('Total', ascending=True, kind='stable')
+
+        where, parametros = _where(filtros, 'Criado')
+        recentes = self.query(
+            f'SELECT Responsavel, COUNT(*) AS Quantidade FROM tarefas'
+            f'{where or " WHERE 1 = 1"} AND Atualizado >= ? AND Responsavel IS NOT NULL '
+            f'GROUP BY Responsavel',
+            parametros + [pd.Timestamp(recent_since).as_unit('ns').value]
+        )
+        recent_summary = _sorted_counts(
+            recentes.set_index('Responsavel')['Quantidade'].astype('int64')
+        ).rename('Tarefas Atualizadas').reset_index()
+
+        return DashboardStats(
+            total=int(grupos['Quantidade'].sum()),
+            concluidas=contagem_status(STATUS_CONCLUIDO),
+            em_andamento=contagem_status(STATUS_EM_ANDAMENTO),
+            pendentes=contagem_status(STATUS_PENDENTE),
+            devs_ativos=len(dev_stats),
+            status_counts=_sorted_counts(status_counts).rename('count'),
+            area_counts=_sorted_counts(
+                grupos[grupos['Area'].notna()].groupby('Area')['Quantidade'].sum()
+            ).rename('count'),
+            dev_stats=dev_stats,
+            recent_summary=recent_summary,
+        )
+
+    def timeline(self, filtros, granularidade='Semana'):
+        """Quantidade por (período, Status), como ``cube.timeline``."""
+        coluna = GRANULARIDADES[granularidade]
+        where, parametros = _where(filtros, 'Dia')
+        tabela = 'contagens' if filtros.get('periodo') else SERIES.get(coluna, 'contagens')
+        condicao = f'{where or " WHERE 1 = 1"} AND {coluna} IS NOT NULL AND Status IS NOT NULL'
+        timeline = self.query(
+            f'SELECT {coluna} AS Periodo, Status, SUM(Quantidade) AS Quantidade '
+            f'FROM {tabela}{condicao} GROUP BY {coluna}, Status ORDER BY {coluna}, Status',
+            parametros
+        )
+        timeline['Quantidade'] = timeline['Quantidade'].astype('int64')
+        return timeline
+
+    def close(self):
+        con = getattr(self._local, 'con', None)
+        if con is not None:
+            con.close()
+            self._local.con = None
@@ -0,0 +1,91 @@
+"""Tabela de detalhes paginada: ordenação pré-computada e busca por tokens.
+
+A ordem de cada coluna ordenável é calculada uma única vez por conjunto de
+dados; ordenar as linhas filtradas vira só selecionar as posições da ordem
+global que passam no filtro. A busca em Resumo/Chave usa um índice invertido
+(token -> posições) com casamento por prefixo.
+"""
+import bisect
+import re
+
+import numpy as np
+
+SORTABLE_COLUMNS = ['Criado', 'Atualizado', 'Chave', 'Resumo', 'Responsavel',
+                    'Status', 'Tipo', 'Area']
+
+SEARCH_COLUMNS = ['Resumo', 'Chave']
+
+_TOKEN_RE = re.compile(r'\w+')
+
+
+def tokenize(texto):
+    return _TOKEN_RE.findall(str(texto).lower())
+
+
+class DetailsTable:
+    def __init__(self, df):
+        self._df = df
+        self._orders = {}
+
+        # Índice invertido: token -> posições (ordenadas) das linhas
+        postings = {}
+        for coluna in SEARCH_COLUMNS:
+            for posicao, texto in enumerate(df[coluna].to_numpy()):
+                for token in set(tokenize(texto)):
+                    postings.setdefault(token, []).append(posicao)
+        self._vocabulary = sorted(postings)
+        self._postings = [np.unique(np.array(postings[token], dtype=np.int64))
+                          for token in self._vocabulary]
+
+    def _order(self, coluna, ascending=True):
+        """Posições das linhas ordenadas pela coluna (vazios no fim, empates na ordem original)."""
+        ordem = self._orders.get((coluna, ascending))
+        if ordem is None:
+            serie = self._df[coluna]
+            if hasattr(serie, 'cat'):
+                # Categóricas ordenam pelo texto, não pela ordem das categorias
+                serie = serie.astype(str).where(serie.notna())
+            ordem = serie.reset_index(drop=True).sort_values(
+                ascending=ascending, kind='stable', na_position='last').index.to_numpy()
+            self._orders[(coluna, ascending)] = ordem
+        return ordem
+
+    def positions(self, texto):
+        """Posições (ordenadas) das linhas que têm todos os termos de ``texto`` (por prefixo).
+
+        Só percorre as listas de posições dos tokens casados, não as linhas.
+        """
+        resultado = None
+        for termo in tokenize(texto):
+            inicio = bisect.bisect_left(self._vocabulary, termo)
+            fim = bisect.bisect_left(self._vocabulary, termo + '\uffff')
+            if fim - inicio == 1:
+                encontrados = self._postings[inicio]
+            elif fim > inicio:
+                encontrados = np.sort(np.concatenate(self._postings[inicio:fim]))
+                encontrados = encontrados[np.r_[True, encontrados[1:] != encontrados[:-1]]]
+            else:
+                encontrados = np.empty(0, dtype=np.int64)
+            if resultado is None:
+                resultado = encontrados
+            else:
+                resultado = np.intersect1d(resultado, encontrados, assume_unique=True)
+        if resultado is None:
+            return np.arange(len(self._df), dtype=np.int64)
+        return resultado
+
+    def search(self, texto):
+        """Máscara das linhas que têm todos os termos de ``texto`` (por prefixo)."""
+        mask = np.zeros(len(self._df), dtype=bool)
+        mask[self.positions(texto)] = True
+        return mask
+
+    def sorted_positions(self, mask, coluna, ascending=True):
+        """Posições das linhas em ``mask`` na ordem pedida, sem reordenar nada."""
+        ordem = self._order(coluna, ascending)
+        return ordem[mask[ordem]]
+
+    def page(self, posicoes, pagina, tamanho, colunas):
+        """Somente as linhas da página ``pagina`` (começando em 1)."""
+        inicio = (pagina - 1) * tamanho
+        return self._df.iloc[posicoes[inicio:inicio + tamanho]][colunas]
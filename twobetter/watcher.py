@@ -0,0 +1,268 @@
+"""Observação das pastas ``data/`` e ``okr/`` em segundo plano.
+
+``DataWatcher`` mantém em memória um ``Catalog`` com os arquivos disponíveis,
+então o app não precisa listar a pasta nem dar ``stat()`` em cada rerun.
+Mudanças são detectadas pelo watchdog (inotify no Linux) quando ele está
+instalado; sem ele, ou com ``TWOBETTER_WATCH=poll`` (pastas de rede, onde o
+inotify não enxerga alterações feitas por outras máquinas), as pastas são
+varridas a cada ``POLL_INTERVAL`` segundos.
+
+Quando um arquivo chega, uma thread processa os dados (caches em disco,
+índice de filtros, agregador e cubo ou banco SQL, tabela de detalhes) e só então troca
+catálogo e datasets de uma vez. Até lá os usuários continuam vendo a versão
+anterior, já aquecida.
+"""
+import os
+import threading
+from dataclasses import dataclass, field
+from fnmatch import fnmatch
+from pathlib import Path
+
+from twobetter import cache as disk_cache
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # watchdog é opcional
+    FileSystemEventHandler = object
+    Observer = None
+
+POLL_INTERVAL = 5.0
+# Espera após o último evento antes de processar (cópia ainda em andamento)
+SETTLE_SECONDS = 1.0
+
+CSV_PATTERN = "*.csv"
+OKR_PATTERN = "*.xlsx"
+
+
+@dataclass(frozen=True)
+class FileEntry:
+    path: Path
+    fingerprint: str
+    mtime_ns: int
+
+
+def scan_folder(folder, pattern):
+    """Arquivos da pasta do mais antigo para o mais recente (um ``stat`` por arquivo).
+
+    Ignora arquivos ocultos e os de trava do Excel (``~$...``).
+    """
+    entradas = []
+    try:
+        itens = os.scandir(folder)
+    except OSError:
+        return ()
+
+    with itens:
+        for item in itens:
+            if item.name.startswith(('.', '~$')) or not fnmatch(item.name, pattern):
+                continue
+            try:
+                stat = item.stat()
+            except OSError:
+                continue
+            entradas.append(FileEntry(
+                Path(item.path), f"{stat.st_mtime_ns:x}-{stat.st_size:x}", stat.st_mtime_ns
+            ))
+
+    return tuple(sorted(entradas, key=lambda e: (e.mtime_ns, e.path.name)))
+
+
+@dataclass(frozen=True)
+class Catalog:
+    data_dir: Path
+    csv_files: tuple = ()
+    okr_files: tuple = ()
+    version: int = 0
+
+    @property
+    def latest_csv(self):
+        return self.csv_files[-1] if self.csv_files else None
+
+    @property
+    def latest_okr(self):
+        return self.okr_files[-1] if self.okr_files else None
+
+    def jira_key(self, incremental=False):
+        """Mesma chave de ``data.dataset_key``, montada sem acessar o disco."""
+        if not self.csv_files:
+            return None
+        if incremental:
+            fingerprint = tuple((e.path.name, e.fingerprint) for e in self.csv_files)
+            return (self.data_dir, fingerprint, disk_cache.schema_key())
+        latest = self.latest_csv
+        return (latest.path, latest.fingerprint, disk_cache.schema_key())
+
+
+class _EventHandler(FileSystemEventHandler):
+    def __init__(self, notify):
+        super().__init__()
+        self.notify = notify
+
+    # Aberturas e leituras (inclusive as do próprio carregamento) não contam
+    EVENTOS = {'created', 'modified', 'moved', 'deleted', 'closed'}
+
+    def on_any_event(self, event):
+        if not event.is_directory and event.event_type in self.EVENTOS:
+            self.notify()
+
+
+@dataclass
+class _Published:
+    """O que os reruns enxergam; trocado inteiro, nunca alterado no lugar."""
+    catalog: Catalog
+    datasets: dict = field(default_factory=dict)
+    okr: dict = field(default_factory=dict)
+
+
+class DataWatcher:
+    """Catálogo das pastas de dados e datasets aquecidos em segundo plano.
+
+    ``get_dataset(key)`` e ``get_okr(path, fingerprint)`` devem ser as mesmas
+    funções (com cache compartilhado) que as sessões usam, para que o que é
+    aquecido aqui seja exatamente o objeto que elas recebem, sem cópia.
+    ``on_publish(catalogo, datasets, okr)`` é chamada a cada versão publicada.
+    """
+
+    def __init__(self, data_dir, okr_dir, get_dataset, get_okr, poll_interval=POLL_INTERVAL, on_publish=None):
+        self.data_dir = Path(data_dir)
+        self.okr_dir = Path(okr_dir)
+        self.get_dataset = get_dataset
+        self.get_okr = get_okr
+        self.on_publish = on_publish
+        self.poll_interval = poll_interval
+        self.backend = None
+        self.last_error = None
+
+        # Modos pedidos pelos usuários (arquivo único / incremental)
+        self._modos = {False}
+        self._lock = threading.Lock()
+        self._changed = threading.Event()
+        self._stop = threading.Event()
+        self._observer = None
+        self._thread = None
+        self._published = _Published(self._scan(version=0))
+
+    @property
+    def catalog(self):
+        return self._published.catalog
+
+    def _scan(self, version):
+        return Catalog(
+            self.data_dir,
+            csv_files=scan_folder(self.data_dir, CSV_PATTERN),
+            okr_files=scan_folder(self.okr_dir, OKR_PATTERN),
+            version=version
+        )
+
+    def start(self):
+        """Aquece a versão atual e passa a observar as pastas."""
+        if self._thread is not None:
+            return self
+
+        # Pasta ainda inexistente não pode ser observada: usa polling até reiniciar
+        pastas = (self.data_dir, self.okr_dir)
+        if (Observer is not None and os.environ.get('TWOBETTER_WATCH') != 'poll'
+                and all(pasta.is_dir() for pasta in pastas)):
+            observer = Observer()
+            handler = _EventHandler(self._changed.set)
+            for pasta in pastas:
+                observer.schedule(handler, str(pasta), recursive=False)
+            try:
+                observer.start()
+            except OSError:  # ex: limite de inotify atingido
+                observer = None
+            self._observer = observer
+
+        self.backend = 'inotify' if self._observer is not None else 'polling'
+        self._changed.set()
+        self._thread = threading.Thread(target=self._run, name='twobetter-watcher', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._changed.set()
+        if self._observer is not None:
+            self._observer.stop()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self):
+        while not self._stop.is_set():
+            if self._observer is not None:
+                self._changed.wait()
+            elif not self._changed.wait(self.poll_interval):
+                # Polling: só reprocessa se algo mudou desde a última varredura
+                if self._scan(self.catalog.version) == self.catalog:
+                    continue
+            if self._stop.is_set():
+                break
+
+            # Agrupa rajadas de eventos (cópia de um arquivo grande)
+            self._changed.clear()
+            while self._changed.wait(SETTLE_SECONDS) and not self._stop.is_set():
+                self._changed.clear()
+
+            try:
+                self.refresh()
+                self.last_error = None
+            except Exception as erro:  # a thread não pode morrer
+                self.last_error = erro
+
+    def refresh(self):
+        """Varre as pastas, aquece o que mudou e publica tudo de uma vez."""
+        atual = self._published
+        novo = self._scan(atual.catalog.version)
+
+        with self._lock:
+            modos = sorted(self._modos)
+
+        datasets = {}
+        for incremental in modos:
+            key = novo.jira_key(incremental)
+            if key is None:
+                continue
+            dataset = atual.datasets.get(key)
+            if dataset is None:
+                dataset = self.warm(key)
+            datasets[key] = dataset
+
+        # Todas as planilhas (todos os trimestres), não só a mais recente
+        okr = {}
+        for entry in novo.okr_files:
+            trimestres = atual.okr.get(entry)
+            if trimestres is None:
+                trimestres = self.get_okr(entry.path, entry.fingerprint)
+            okr[entry] = trimestres
+
+        if novo == atual.catalog and datasets.keys() == atual.datasets.keys() and okr.keys() == atual.okr.keys():
+            return atual.catalog
+
+        catalogo = Catalog(novo.data_dir, novo.csv_files, novo.okr_files, atual.catalog.version + 1)
+        self._published = _Published(catalogo, datasets, okr)
+
+        # Ex: snapshot da visão padrão; falhas aqui não desfazem a publicação
+        if self.on_publish is not None:
+            self.on_publish(catalogo, datasets, okr)
+        return catalogo
+
+    def warm(self, key):
+        """Carrega o frame e constrói todas as estruturas derivadas."""
+        return self.get_dataset(key).warm()
+
+    def dataset(self, key):
+        """Dataset aquecido para a chave, ou ``None`` se ainda não houver.
+
+        Pedir uma chave de um modo novo faz a thread passar a aquecê-lo.
+        """
+        incremental = key[0] == self.data_dir
+        with self._lock:
+            if incremental not in self._modos:
+                self._modos.add(incremental)
+                self._changed.set()
+        return self._published.datasets.get(key)
+
+    def okr(self, entry):
+        """Trimestres aquecidos da planilha do catálogo, ou ``None``."""
+        return self._published.okr.get(entry)
@@ -0,0 +1 @@
+"""Páginas do app Streamlit, importadas sob demanda por ``app.py``."""
@@ -0,0 +1,90 @@
+"""Peças compartilhadas pelas páginas do app: caches, observador e renderização.
+
+Importado uma única vez por processo: os decoradores de cache e o observador
+não são recriados a cada rerun, e as páginas (``views.dashboard``,
+``views.okrs``) só são importadas quando escolhidas no menu.
+"""
+import pandas as pd
+import streamlit as st
+
+from twobetter import data
+from twobetter import export
+from twobetter import figures
+from twobetter import instrument
+from twobetter import snapshot
+
+# Os dados ficam compartilhados entre sessões: recortes e colunas novas nunca
+# podem alterar o original (Copy-on-Write, já padrão a partir do pandas 3)
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+
+# Renderização de gráficos e tabelas medida pelo painel de diagnóstico:
+# o trecho desde a última marca conta como construção, a chamada como render
+# A figura vem do cache de figuras: só é montada quando os agregados mudam
+def plotly_chart(nome, construir, *entradas):
+    diag = instrument.current_run()
+    fig = get_figure_cache().get(nome, construir, *entradas)
+    diag.lap(f"figura.{nome}")
+    with diag.span(f"render.{nome}"):
+        st.plotly_chart(fig, use_container_width=True)
+
+def dataframe(df_tabela, nome):
+    diag = instrument.current_run()
+    diag.lap(f"tabela.{nome}")
+    with diag.span(f"render.{nome}"):
+        st.dataframe(df_tabela, use_container_width=True, hide_index=True)
+
+# Função para carregar os dados e montar as estruturas derivadas (índice,
+# agregador, cubo, tabela). Fica em cache_resource: um único Dataset somente
+# leitura por chave, compartilhado por todas as sessões sem cópia.
+# A chave (arquivo ou pasta, impressão digital e versão do processamento)
+# muda quando o CSV ou as regras de área mudam, invalidando os caches
+@instrument.cached(st.cache_resource(max_entries=4), 'load_dataset')
+def load_dataset(path, fingerprint, schema_key):
+    dataset_key = (path, fingerprint, schema_key)
+    return data.Dataset(data.load_jira(dataset_key), dataset_key)
+
+# Função para carregar só as partições (projeto x mês) escolhidas na sidebar
+# Cada recorte é um dataset próprio, com índice e agregações só das suas tarefas
+@instrument.cached(st.cache_resource(max_entries=8), 'load_partitions')
+def load_partitions(dataset_key, particoes):
+    return data.load_partitions(dataset_key, particoes, store=data.open_partitions(dataset_key))
+
+# Exportação sob demanda: o download_button recebe uma função e o arquivo só
+# é gerado no clique, numa thread à parte (obter_df devolve o recorte a
+# exportar). Nada fica em cache nem é refeito a cada rerun: os bytes só
+# existem durante o download
+def export_sidebar(obter_df, nome_arquivo, label, key):
+    formato = st.sidebar.selectbox("Formato", list(export.FORMATOS), key=f"{key}_formato")
+    extensao, mime = export.FORMATOS[formato]
+    st.sidebar.download_button(
+        label=label,
+        data=lambda: export.export_bytes(obter_df(), formato),
+        file_name=f"{nome_arquivo}.{extensao}",
+        mime=mime,
+        key=f"{key}_baixar"
+    )
+
+# Função para carregar dados de OKR (a impressão digital invalida o cache)
+# Também compartilhada entre sessões; quem usa só filtra, nunca altera
+@instrument.cached(st.cache_resource(max_entries=8), 'load_okr_quarters')
+def load_okr_quarters(path, fingerprint):
+    return data.load_okr_quarters(path, fingerprint)
+
+# Função para ler o snapshot da visão padrão (primeira pintura sem carregar o CSV)
+# A chave muda com os dados; o observador grava um novo snapshot a cada versão
+@instrument.cached(st.cache_resource(max_entries=2), 'load_snapshot')
+def load_snapshot(key):
+    return snapshot.load_snapshot(key)
+
+# Cache de figuras Plotly (um por servidor, compartilhado entre sessões)
+@st.cache_resource
+def get_figure_cache():
+    return figures.FigureCache()
+
+# Observador das pastas data/ e okr/ (um por servidor, compartilhado entre sessões)
+# Mantém o catálogo de arquivos e aquece novos dados em segundo plano,
+# usando as mesmas funções em cache que as sessões
+@st.cache_resource
+def get_watcher():
+    return data.watch(get_dataset=lambda key: load_dataset(*key), get_okr=load_okr_quarters)
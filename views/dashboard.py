@@ -0,0 +1,515 @@
+"""Página Dashboard: KPIs, gráficos, fluxo e detalhes das tarefas do Jira.
+
+Importada só quando a página é escolhida; o Plotly só é importado quando uma
+figura precisa ser montada (fora do cache de figuras).
+"""
+from datetime import datetime, timedelta
+
+import pandas as pd
+import streamlit as st
+
+from twobetter import data
+from twobetter import instrument
+from twobetter.cube import GRANULARIDADES
+from twobetter.filters import FILTER_COLUMNS
+from twobetter.table import SORTABLE_COLUMNS
+from views.common import dataframe, export_sidebar, load_dataset, load_partitions, load_snapshot, plotly_chart
+
+# Cores fixas por status nos gráficos
+CORES_STATUS = {
+    'Concluído': '#2ecc71',
+    'Em andamento': '#f39c12',
+    'Tarefas pendentes': '#3498db',
+    'TESTE': '#9b59b6'
+}
+
+# Função para calcular KPIs e dados dos gráficos
+# A chave do cache é o estado dos filtros, então repetir uma combinação é instantâneo
+@instrument.cached(st.cache_data(max_entries=256), 'compute_dashboard_stats')
+def compute_dashboard_stats(_dataset, _mask, dataset_key, filtros, recent_date):
+    return _dataset.stats(dict(filtros), recent_date, mask=_mask)
+
+# Função para recortar a timeline do cubo conforme filtros e granularidade
+@instrument.cached(st.cache_data(max_entries=256), 'compute_timeline')
+def compute_timeline(_dataset, dataset_key, granularidade, filtros):
+    return _dataset.timeline(dict(filtros), granularidade)
+
+# Função para ordenar/buscar as linhas da tabela de detalhes
+# Memoizada por (filtros, busca, ordenação); a paginação só fatia o resultado.
+# Cada entrada guarda as posições de todas as linhas filtradas, por isso são
+# poucas: a ordem de cada coluna já fica em cache no DetailsTable
+@instrument.cached(st.cache_data(max_entries=16), 'compute_details_order')
+def compute_details_order(_dataset, _mask, dataset_key, filtros, busca, ordenar_por, crescente):
+    mask = _mask & _dataset.details.search(busca) if busca else _mask
+    return _dataset.details.sorted_positions(mask, ordenar_por, crescente)
+
+# Função para carregar o histórico de status (data/changelog)
+# A chave muda com qualquer arquivo novo; só os arquivos novos são lidos (manifesto em .cache/flow)
+@instrument.cached(st.cache_resource(max_entries=2), 'load_flow_log')
+def load_flow_log(changelog_dir, fingerprint, flow_key):
+    return data.load_flow(changelog_dir)
+
+# Função para calcular as métricas de fluxo das tarefas filtradas
+# Memoizada pelos filtros e pela hora (a idade do WIP anda com o relógio)
+@instrument.cached(st.cache_data(max_entries=64), 'compute_flow_stats')
+def compute_flow_stats(_dataset, _log, _mask, dataset_key, flow_key, filtros, agora):
+    return _dataset.flow_stats(_log, _mask, pd.Timestamp(agora))
+
+
+def render(catalogo, data_watcher):
+    """Desenha a página; devolve o dataset usado (``None`` sem CSV ou pelo snapshot)."""
+    diag = instrument.current_run()
+    dataset = None
+
+    st.title("📊 TwoBetter - Dashboard de Atividades")
+    st.markdown("---")
+
+    # Modo incremental: cada CSV da pasta é um delta, mesclado por ID
+    modo_incremental = st.sidebar.toggle(
+        "Mesclar todos os CSVs",
+        help="Trata cada CSV da pasta data/ como uma exportação parcial. "
+             "Vale a versão mais recente (Atualizado) de cada tarefa."
+    )
+    # Lembrado para a página de OKRs usar o mesmo conjunto de tarefas
+    st.session_state['jira_incremental'] = modo_incremental
+
+    # Arquivo mais recente da pasta data (catálogo mantido pelo observador)
+    csv_entry = catalogo.latest_csv
+
+    if csv_entry is not None:
+        dataset_key = catalogo.jira_key(incremental=modo_incremental)
+
+        # Normalmente já aquecido em segundo plano. Se ainda não estiver (sessão
+        # fria), a primeira pintura sai do snapshot da visão padrão, sem ler o CSV
+        dataset = data_watcher.dataset(dataset_key)
+        resumo = None
+        if dataset is None and not modo_incremental:
+            chave_snapshot = data.snapshot_key(catalogo)
+            resumo = load_snapshot(chave_snapshot) if chave_snapshot is not None else None
+        # Partições por projeto e mês (só o manifesto; gravadas pelo observador):
+        # com elas, o carregamento espera o recorte escolhido na sidebar
+        particoes = data.open_partitions(dataset_key)
+        if dataset is None and resumo is None and particoes is None:
+            dataset = load_dataset(*dataset_key)
+
+        if modo_incremental:
+            # Mostrar quantos arquivos foram mesclados
+            st.sidebar.success(f"📁 {len(dataset_key[1])} arquivo(s) mesclado(s)")
+        else:
+            # Mostrar qual arquivo está sendo usado
+            st.sidebar.success(f"📁 Arquivo: {csv_entry.path.name}")
+        st.sidebar.caption(f"Última atualização: {datetime.fromtimestamp(csv_entry.mtime_ns / 1e9).strftime('%d/%m/%Y %H:%M')}")
+
+        # Avisar sobre datas que não puderam ser convertidas
+        if dataset is not None:
+            datas_invalidas = dataset.df.attrs.get('datas_invalidas', {})
+        else:
+            datas_invalidas = resumo.datas_invalidas if resumo is not None else particoes.manifest.datas_invalidas
+        if datas_invalidas:
+            total_invalidas = sum(len(valores) for valores in datas_invalidas.values())
+            with st.sidebar.expander(f"⚠️ {total_invalidas} data(s) não reconhecida(s)"):
+                for coluna, valores in datas_invalidas.items():
+                    st.caption(f"**{coluna}:** " + ", ".join(map(str, valores[:20])))
+
+        # Sidebar com filtros
+        st.sidebar.markdown("---")
+        st.sidebar.header("🔍 Filtros")
+
+        # Filtro de projeto (prefixo da chave), com mais de um projeto nos dados
+        projetos = []
+        if particoes is not None and len(particoes.manifest.projects()) > 1:
+            projetos = st.sidebar.multiselect("Projeto", particoes.manifest.projects(), placeholder="Todos")
+
+        # Limites do período: do manifesto das partições, do índice ou do snapshot
+        if particoes is not None:
+            primeira_data, ultima_data = particoes.manifest.date_bounds(projetos)
+        elif dataset is None:
+            primeira_data, ultima_data = resumo.date_bounds
+        else:
+            primeira_data, ultima_data = dataset.index.date_bounds()
+
+        # Filtro de período
+        min_date = primeira_data.date() if primeira_data is not None else datetime.now().date()
+        max_date = ultima_data.date() if ultima_data is not None else datetime.now().date()
+
+        date_range = st.sidebar.date_input(
+            "Período",
+            value=(min_date, max_date),
+            min_value=min_date,
+            max_value=max_date
+        )
+
+        # Só as partições do recorte são lidas: sempre que há projeto escolhido e,
+        # enquanto os dados completos não estão em memória, também pelo período
+        if particoes is not None:
+            periodo = tuple(date_range) if len(date_range) == 2 else None
+            # Período sem tarefas: lê os projetos inteiros e o filtro do índice devolve vazio
+            selecionadas = particoes.manifest.select(projetos, periodo) or particoes.manifest.select(projetos)
+            if projetos or (dataset is None and len(selecionadas) < len(particoes.manifest.partitions)):
+                dataset = load_partitions(dataset_key, selecionadas)
+                dataset_key = dataset.key
+                resumo = None
+                st.sidebar.caption(f"🗂️ {len(selecionadas)} de {len(particoes.manifest.partitions)} partições (projeto × mês)")
+                diag.count('particoes_lidas', len(selecionadas))
+            elif dataset is None and resumo is None:
+                dataset = load_dataset(*dataset_key)
+
+        # Opções dos filtros: do índice (construído uma vez por conjunto de dados)
+        # ou, na primeira pintura, as mesmas guardadas no snapshot
+        if dataset is None:
+            opcoes = resumo.options
+        else:
+            opcoes = {coluna: dataset.index.options(coluna) for coluna in FILTER_COLUMNS}
+
+        # Filtro de responsável
+        responsaveis = ['Todos'] + opcoes['Responsavel']
+        selected_responsavel = st.sidebar.selectbox("Responsável", responsaveis)
+
+        # Filtro de status
+        status_list = ['Todos'] + opcoes['Status']
+        selected_status = st.sidebar.selectbox("Status", status_list)
+
+        # Filtro de tipo
+        tipos = ['Todos'] + opcoes['Tipo']
+        selected_tipo = st.sidebar.selectbox("Tipo", tipos)
+
+        # Aplicar filtros (AND das máscaras do índice, sem copiar o frame inteiro)
+        filtros = data.jira_filters(date_range, selected_responsavel, selected_status, selected_tipo)
+
+        # Fora da visão padrão o snapshot não serve: agora sim carrega os dados completos
+        if dataset is None and not resumo.matches(filtros):
+            with st.spinner("Carregando os dados completos..."):
+                dataset = data_watcher.dataset(dataset_key) or load_dataset(*dataset_key)
+
+        if dataset is not None:
+            df = dataset.df
+            mask = dataset.mask(filtros)
+            diag.lap('filtros')
+            diag.count('linhas_total', len(df))
+            diag.count('linhas_filtradas', int(mask.sum()))
+        else:
+            st.sidebar.caption(
+                f"⚡ Visão pré-calculada em {resumo.gerado_em.strftime('%d/%m/%Y %H:%M')}; "
+                "os dados completos carregam em segundo plano"
+            )
+            diag.lap('snapshot')
+            diag.count('linhas_total', resumo.linhas)
+
+        # Todos os KPIs e dados dos gráficos em uma passada, memoizados pelos filtros
+        if dataset is None:
+            stats = resumo.dashboard_stats()
+        else:
+            recent_date = (datetime.now() - timedelta(days=7)).replace(second=0, microsecond=0)
+            stats = compute_dashboard_stats(dataset, mask, dataset_key, tuple(filtros.items()), recent_date)
+
+        # KPIs principais
+        st.subheader("📈 KPIs Gerais")
+
+        col1, col2, col3, col4, col5 = st.columns(5)
+
+        with col1:
+            st.metric("Total de Tarefas", stats.total)
+        with col2:
+            st.metric("Concluídas", stats.concluidas, f"{stats.taxa_conclusao:.1f}%")
+        with col3:
+            st.metric("Em Andamento", stats.em_andamento)
+        with col4:
+            st.metric("Pendentes", stats.pendentes)
+        with col5:
+            st.metric("Devs Ativos", stats.devs_ativos)
+
+        st.markdown("---")
+
+        # Gráficos lado a lado
+        col_left, col_right = st.columns(2)
+
+        with col_left:
+            # Tarefas por Status (Donut)
+            st.subheader("📊 Distribuição por Status")
+            status_counts = stats.status_counts
+
+            def figura_status(status_counts):
+                import plotly.express as px
+                fig_status = px.pie(
+                    values=status_counts.values,
+                    names=status_counts.index,
+                    hole=0.5,
+                    color=status_counts.index,
+                    color_discrete_map=CORES_STATUS
+                )
+                fig_status.update_traces(textposition='outside', textinfo='percent+label')
+                fig_status.update_layout(showlegend=False, height=350)
+                return fig_status
+
+            plotly_chart('status', figura_status, status_counts)
+
+        with col_right:
+            # Tarefas por Área
+            st.subheader("🏷️ Distribuição por Área")
+            area_counts = stats.area_counts
+
+            def figura_area(area_counts):
+                import plotly.express as px
+                fig_area = px.bar(
+                    x=area_counts.index,
+                    y=area_counts.values,
+                    color=area_counts.index,
+                    color_discrete_sequence=px.colors.qualitative.Set2
+                )
+                fig_area.update_layout(
+                    xaxis_title="Área",
+                    yaxis_title="Quantidade",
+                    showlegend=False,
+                    height=350
+                )
+                return fig_area
+
+            plotly_chart('area', figura_area, area_counts)
+
+        st.markdown("---")
+
+        # Performance por Dev
+        st.subheader("👥 Performance por Desenvolvedor")
+
+        dev_stats = stats.dev_stats
+
+        # Gráfico de barras empilhadas horizontal
+        def figura_dev(dev_stats):
+            import plotly.graph_objects as go
+            fig_dev = go.Figure()
+
+            fig_dev.add_trace(go.Bar(
+                name='Concluídas',
+                y=dev_stats.index,
+                x=dev_stats['Concluidas'],
+                orientation='h',
+                marker_color='#2ecc71',
+                text=dev_stats['Concluidas'],
+                textposition='inside'
+            ))
+
+            fig_dev.add_trace(go.Bar(
+                name='Pendentes/Em andamento',
+                y=dev_stats.index,
+                x=dev_stats['Pendentes'],
+                orientation='h',
+                marker_color='#e74c3c',
+                text=dev_stats['Pendentes'],
+                textposition='inside'
+            ))
+
+            fig_dev.update_layout(
+                barmode='stack',
+                height=400,
+                xaxis_title="Quantidade de Tarefas",
+                yaxis_title="",
+                legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+            )
+            return fig_dev
+
+        plotly_chart('dev', figura_dev, dev_stats[['Concluidas', 'Pendentes']])
+
+        # Tabela resumo por dev
+        col_table1, col_table2 = st.columns(2)
+
+        with col_table1:
+            st.subheader("📋 Resumo por Desenvolvedor")
+            dev_summary = dev_stats.reset_index()
+            dev_summary.columns = ['Desenvolvedor', 'Total', 'Concluídas', 'Pendentes', 'Taxa (%)']
+            dev_summary = dev_summary.sort_values('Total', ascending=False)
+            dataframe(dev_summary, 'dev_summary')
+
+        with col_table2:
+            st.subheader("🔥 Atividade Recente (Últimos 7 dias)")
+            # Não vem do snapshot (dependeria da hora em que foi gravado)
+            if stats.recent_summary is None:
+                st.info("A atividade recente aparece quando os dados completos terminarem de carregar.")
+            else:
+                dataframe(stats.recent_summary, 'recent_summary')
+
+        st.markdown("---")
+
+        # Timeline de criação
+        st.subheader("📅 Timeline de Criação de Tarefas")
+
+        granularidade = st.radio(
+            "Agrupar por",
+            list(GRANULARIDADES),
+            index=1,
+            horizontal=True
+        )
+
+        # Recorte e soma sobre o cubo pré-agregado (não toca nas linhas originais)
+        if dataset is None:
+            timeline_counts = resumo.timelines[granularidade]
+        else:
+            timeline_counts = compute_timeline(dataset, dataset_key, granularidade, tuple(filtros.items()))
+
+        def figura_timeline(timeline_counts, granularidade):
+            import plotly.express as px
+            fig_timeline = px.bar(
+                timeline_counts,
+                x='Periodo',
+                y='Quantidade',
+                color='Status',
+                color_discrete_map=CORES_STATUS
+            )
+            fig_timeline.update_layout(
+                xaxis_title=granularidade,
+                yaxis_title="Quantidade",
+                height=400,
+                xaxis_tickangle=-45
+            )
+            return fig_timeline
+
+        plotly_chart('timeline', figura_timeline, timeline_counts, granularidade)
+
+        st.markdown("---")
+
+        # Métricas de fluxo pelo histórico de status (só com arquivos em data/changelog)
+        flow_key = data.flow_files_key() if dataset is not None else None
+        flow_log = load_flow_log(*flow_key) if flow_key is not None else None
+        if flow_log is not None:
+            st.subheader("⏱️ Fluxo")
+
+            agora = datetime.now().replace(minute=0, second=0, microsecond=0)
+            fluxo = compute_flow_stats(dataset, flow_log, mask, dataset_key, flow_key, tuple(filtros.items()), agora)
+            diag.lap('fluxo')
+            diag.count('issues_com_historico', fluxo.issues)
+
+            def dias(valor):
+                return f"{valor:.1f} d" if valor is not None else "—"
+
+            col_flow1, col_flow2, col_flow3, col_flow4 = st.columns(4)
+            with col_flow1:
+                st.metric("Cycle Time (p50)", dias(fluxo.cycle_time[50]))
+            with col_flow2:
+                st.metric("Cycle Time (p85)", dias(fluxo.cycle_time[85]))
+            with col_flow3:
+                st.metric("Lead Time (p50)", dias(fluxo.lead_time[50]))
+            with col_flow4:
+                st.metric("Em Andamento (WIP)", fluxo.em_andamento)
+
+            col_flow_chart1, col_flow_chart2 = st.columns(2)
+
+            with col_flow_chart1:
+                def figura_throughput(throughput):
+                    import plotly.graph_objects as go
+                    fig_throughput = go.Figure()
+                    fig_throughput.add_bar(
+                        x=throughput['Semana'], y=throughput['Concluidas'],
+                        name='Concluídas', marker_color=CORES_STATUS['Concluído']
+                    )
+                    fig_throughput.add_scatter(
+                        x=throughput['Semana'], y=throughput['Media_Movel'],
+                        name='Média móvel', mode='lines', line=dict(color='#667eea')
+                    )
+                    fig_throughput.update_layout(
+                        title="Throughput Semanal",
+                        xaxis_title="Semana",
+                        yaxis_title="Concluídas",
+                        height=400
+                    )
+                    return fig_throughput
+
+                plotly_chart('throughput', figura_throughput, fluxo.throughput)
+
+            with col_flow_chart2:
+                def figura_cfd(cumulative_flow):
+                    import plotly.express as px
+                    fig_cfd = px.area(
+                        cumulative_flow.reset_index().melt(id_vars='Data', var_name='Status', value_name='Issues'),
+                        x='Data',
+                        y='Issues',
+                        color='Status',
+                        color_discrete_map=CORES_STATUS
+                    )
+                    fig_cfd.update_layout(
+                        title="Fluxo Cumulativo",
+                        height=400
+                    )
+                    return fig_cfd
+
+                plotly_chart('cfd', figura_cfd, fluxo.cumulative_flow)
+
+            if not fluxo.wip.empty:
+                st.markdown("**🕒 Idade do trabalho em andamento**")
+                dataframe(fluxo.wip.head(50), 'wip_aging')
+
+            st.markdown("---")
+
+        # Detalhes das tarefas
+        st.subheader("📝 Detalhes das Tarefas")
+
+        if dataset is None:
+            st.info("⏳ A tabela de detalhes aparece assim que os dados completos terminarem de carregar.")
+        else:
+            # Seletor de colunas
+            cols_to_show = st.multiselect(
+                "Selecione as colunas para exibir:",
+                options=['Chave', 'Tipo', 'Resumo', 'Responsavel', 'Status', 'Area', 'Criado', 'Atualizado']
+                        + [col for col in df.columns if col.startswith('Tag_')],
+                default=['Chave', 'Tipo', 'Resumo', 'Responsavel', 'Status', 'Criado']
+            )
+
+            # Busca, ordenação e paginação
+            col_busca, col_ordem, col_direcao, col_tamanho = st.columns([3, 1, 1, 1])
+            with col_busca:
+                busca = st.text_input("Buscar em Resumo/Chave", placeholder="ex: endpoint swipe")
+            with col_ordem:
+                ordenar_por = st.selectbox("Ordenar por", SORTABLE_COLUMNS)
+            with col_direcao:
+                ordem = st.selectbox("Ordem", ["Decrescente", "Crescente"])
+            with col_tamanho:
+                tamanho_pagina = st.selectbox("Linhas por página", [25, 50, 100, 250], index=1)
+
+            posicoes = compute_details_order(
+                dataset, mask, dataset_key, tuple(filtros.items()),
+                busca.strip(), ordenar_por, ordem == "Crescente"
+            )
+            total_paginas = max(1, -(-len(posicoes) // tamanho_pagina))
+
+            if cols_to_show:
+                pagina_tabela = st.number_input("Página", min_value=1, max_value=total_paginas, value=1)
+
+                # Só a página visível é enviada para o navegador
+                dataframe(dataset.details.page(posicoes, pagina_tabela, tamanho_pagina, cols_to_show), 'detalhes')
+                inicio = (pagina_tabela - 1) * tamanho_pagina
+                st.caption(
+                    f"Mostrando {min(inicio + 1, len(posicoes))}–{min(inicio + tamanho_pagina, len(posicoes))} "
+                    f"de {len(posicoes)} tarefas · página {pagina_tabela} de {total_paginas}"
+                )
+
+        # Exportar dados filtrados
+        st.sidebar.markdown("---")
+        st.sidebar.subheader("📥 Exportar Dados")
+
+        # O recorte só é materializado quando o arquivo é gerado
+        def recorte_exportado():
+            completo = dataset or load_dataset(*dataset_key)
+            return completo.df[completo.mask(filtros)]
+
+        export_sidebar(
+            recorte_exportado,
+            nome_arquivo="jira_filtrado", label="Baixar Dados Filtrados", key="export_jira"
+        )
+
+    else:
+        st.error("⚠️ Nenhum arquivo CSV encontrado na pasta `data/`")
+
+        st.markdown("""
+        ### Como adicionar dados:
+
+        1. Crie uma pasta `data/` no mesmo diretório do `app.py`
+        2. Exporte do Jira usando a query JQL:
+        ```
+        project = TwoBetter AND issuetype in (Task, Subtask) ORDER BY created DESC
+        ```
+        3. Clique em **Export → CSV (Current fields)**
+        4. Coloque o arquivo `.csv` na pasta `data/`
+        5. O dashboard carrega o arquivo automaticamente em alguns segundos
+
+        O dashboard sempre carrega o arquivo CSV mais recente da pasta.
+        """)
+
+    return dataset
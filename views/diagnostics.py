@@ -0,0 +1,53 @@
+"""Painel de diagnóstico da sidebar (importado só quando o painel é aberto)."""
+import time
+
+import pandas as pd
+import streamlit as st
+
+from twobetter import schema
+
+
+# Tempos do rerun atual, acertos de cache e histórico
+def diagnostics_panel(run):
+    historico = st.session_state.setdefault('diag_historico', [])
+    acertos = st.session_state.setdefault('diag_cache_hits', {})
+    faltas = st.session_state.setdefault('diag_cache_misses', {})
+
+    st.sidebar.caption(f"Rerun atual até aqui: {(time.perf_counter() - run.started) * 1000:.0f} ms")
+    if historico:
+        st.sidebar.caption(
+            f"Últimos {len(historico)} reruns: mediana {pd.Series(historico).median():.0f} ms · "
+            f"máx {max(historico):.0f} ms"
+        )
+
+    etapas = pd.DataFrame(run.spans)
+    if not etapas.empty:
+        etapas['Etapa'] = ['  ' * d + n for d, n in zip(etapas['depth'], etapas['name'])]
+        st.sidebar.dataframe(etapas[['Etapa', 'ms']], use_container_width=True, hide_index=True)
+
+    funcoes = sorted(set(acertos) | set(faltas) | set(run.cache_hits) | set(run.cache_misses))
+    if funcoes:
+        cache_stats = pd.DataFrame({
+            'Cache': funcoes,
+            'Acertos': [acertos.get(f, 0) + run.cache_hits[f] for f in funcoes],
+            'Faltas': [faltas.get(f, 0) + run.cache_misses[f] for f in funcoes],
+        })
+        cache_stats['Taxa (%)'] = (cache_stats['Acertos'] / (cache_stats['Acertos'] + cache_stats['Faltas']) * 100).round(0)
+        st.sidebar.dataframe(cache_stats, use_container_width=True, hide_index=True)
+
+    for nome, valor in run.counts.items():
+        st.sidebar.caption(f"{nome}: {valor:,}")
+
+
+# Painel completo: tempos, caches, observador e, no Dashboard, memória dos dados
+def render(run, data_watcher, dataset=None):
+    diagnostics_panel(run)
+    catalogo = data_watcher.catalog
+    st.sidebar.caption(f"Observador: {data_watcher.backend} · catálogo v{catalogo.version}")
+    if data_watcher.last_error is not None:
+        st.sidebar.caption(f"Último erro ao recarregar: {data_watcher.last_error}")
+    if dataset is not None:
+        st.sidebar.caption(f"Agregações: {dataset.engine}")
+        memoria = schema.memory_usage(dataset.df) / 2**20
+        with st.sidebar.expander(f"Dados em memória: {memoria.sum():.2f} MB"):
+            st.dataframe(memoria.round(2).rename('MB'), use_container_width=True)
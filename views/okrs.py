@@ -0,0 +1,334 @@
+"""Página OKRs: indicadores, gráficos e detalhes das metas do trimestre.
+
+Importada só quando a página é escolhida; não carrega nada da página
+Dashboard (o Jira só entra no progresso das metas, pelo dataset compartilhado).
+"""
+import streamlit as st
+
+from twobetter import data
+from twobetter import instrument
+from twobetter import linkage
+from twobetter import okr_loader
+from twobetter.okr import SEM_FOCO, compute_okr_stats, filter_okr, goal_cards, okr_options
+from views.common import dataframe, export_sidebar, load_okr_quarters, load_snapshot, plotly_chart
+
+# Cores fixas por status nos gráficos
+CORES_STATUS_OKR = {
+    'Em andamento': '#f39c12',
+    'Não Iniciado': '#3498db',
+    'Concluído': '#2ecc71'
+}
+
+# Função para montar os cartões da seção "Detalhes das Metas" (um bloco por foco)
+# Memoizada pelas planilhas, trimestre e filtros: repetir uma combinação não reformata nada
+@instrument.cached(st.cache_data(max_entries=64), 'build_goal_cards')
+def build_goal_cards(_df, okr_key, trimestre, filtros):
+    return goal_cards(_df)
+
+# Função para calcular o progresso das metas pelas tarefas vinculadas
+# O dataset guarda as tarefas de cada regra; aqui só se conta o status
+@instrument.cached(st.cache_data(max_entries=64), 'compute_okr_progress')
+def compute_okr_progress(_dataset, _df_okr, dataset_key, okr_key, trimestre, filtros, regras_fingerprint, _regras):
+    return _dataset.okr_progress(_df_okr, _regras)
+
+
+def render(catalogo, data_watcher):
+    """Desenha a página de OKRs do trimestre escolhido."""
+    diag = instrument.current_run()
+
+    # Trimestres de todas as planilhas da pasta okr (já lidos pelo observador).
+    # Na sessão fria, antes do observador, vêm do snapshot da visão padrão
+    aquecidos = [data_watcher.okr(entry) for entry in catalogo.okr_files]
+    chave_snapshot = data.snapshot_key(catalogo)
+    resumo = load_snapshot(chave_snapshot) if chave_snapshot is not None else None
+    if resumo is not None and any(t is None for t in aquecidos):
+        trimestres = resumo.okr
+    else:
+        trimestres = okr_loader.merge_quarters(
+            aquecido or load_okr_quarters(entry.path, entry.fingerprint)
+            for entry, aquecido in zip(catalogo.okr_files, aquecidos)
+        )
+
+    if trimestres:
+        # Seletor de trimestre (padrão: o mais recente); trocar não relê a planilha
+        trimestre = st.sidebar.selectbox("Trimestre", list(trimestres), key="okr_trimestre")
+        df_okr = trimestres[trimestre]
+        okr_key = tuple((entry.path.name, entry.fingerprint) for entry in catalogo.okr_files)
+    else:
+        trimestre, df_okr = None, None
+
+    st.title(f"🎯 OKRs - {trimestre}" if trimestre else "🎯 OKRs")
+    st.markdown("**Objectives and Key Results - TwoBetter**")
+    st.markdown("---")
+
+    if df_okr is not None:
+        # Filtros na sidebar
+        st.sidebar.header("🔍 Filtros OKR")
+
+        # Filtro por Foco
+        focos = ['Todos'] + okr_options(df_okr, 'Foco')
+        selected_foco = st.sidebar.selectbox("Área de Foco", focos)
+
+        # Filtro por Status
+        status_okr = ['Todos'] + okr_options(df_okr, 'Status')
+        selected_status_okr = st.sidebar.selectbox("Status", status_okr, key="status_okr")
+
+        # Filtro por Prioridade
+        prioridades = ['Todas'] + okr_options(df_okr, 'Prioridade')
+        selected_prioridade = st.sidebar.selectbox("Prioridade", prioridades)
+
+        # Filtro por Responsável
+        responsaveis_okr = ['Todos'] + okr_options(df_okr, 'Responsavel')
+        selected_resp_okr = st.sidebar.selectbox("Responsável", responsaveis_okr, key="resp_okr")
+
+        # Aplicar filtros
+        filtros_okr = {
+            'Foco': selected_foco,
+            'Status': selected_status_okr,
+            'Prioridade': selected_prioridade,
+            'Responsavel': selected_resp_okr
+        }
+        df_okr_filtered = filter_okr(df_okr, **filtros_okr)
+        okr_stats = compute_okr_stats(df_okr_filtered)
+        diag.lap('filtros_e_indicadores')
+        diag.count('metas_total', len(df_okr))
+        diag.count('metas_filtradas', len(df_okr_filtered))
+
+        # KPIs principais
+        st.subheader("📈 Visão Geral das Metas")
+
+        col1, col2, col3, col4, col5 = st.columns(5)
+
+        with col1:
+            st.metric("Total de Metas", okr_stats.total)
+        with col2:
+            st.metric("Em Andamento", okr_stats.em_andamento)
+        with col3:
+            st.metric("Não Iniciadas", okr_stats.nao_iniciadas)
+        with col4:
+            st.metric("Peso Total", f"{okr_stats.peso_total:.0f}%")
+        with col5:
+            st.metric("Prioridade Alta", okr_stats.prioridade_alta)
+
+        st.markdown("---")
+
+        # Gráficos
+        col_left, col_right = st.columns(2)
+
+        with col_left:
+            # Distribuição por Status
+            st.subheader("📊 Distribuição por Status")
+            status_counts = okr_stats.status_counts
+
+            def figura_status_okr(status_counts):
+                import plotly.express as px
+                fig_status_okr = px.pie(
+                    values=status_counts.values,
+                    names=status_counts.index,
+                    hole=0.5,
+                    color=status_counts.index,
+                    color_discrete_map=CORES_STATUS_OKR
+                )
+                fig_status_okr.update_traces(textposition='outside', textinfo='percent+label')
+                fig_status_okr.update_layout(showlegend=False, height=350)
+                return fig_status_okr
+
+            plotly_chart('status_okr', figura_status_okr, status_counts)
+
+        with col_right:
+            # Distribuição por Foco/Área
+            st.subheader("🏷️ Metas por Área de Foco")
+            foco_counts = okr_stats.foco_counts
+
+            def figura_foco(foco_counts):
+                import plotly.express as px
+                fig_foco = px.bar(
+                    x=foco_counts.values,
+                    y=foco_counts.index,
+                    orientation='h',
+                    color=foco_counts.index,
+                    color_discrete_sequence=px.colors.qualitative.Set2
+                )
+                fig_foco.update_layout(
+                    xaxis_title="Quantidade de Metas",
+                    yaxis_title="",
+                    showlegend=False,
+                    height=350
+                )
+                return fig_foco
+
+            plotly_chart('foco', figura_foco, foco_counts)
+
+        st.markdown("---")
+
+        # Peso por Área de Foco
+        st.subheader("⚖️ Peso das Metas por Área")
+
+        peso_por_foco = okr_stats.peso_por_foco
+
+        def figura_peso(peso_por_foco):
+            import plotly.graph_objects as go
+            fig_peso = go.Figure()
+            fig_peso.add_trace(go.Bar(
+                x=peso_por_foco.values,
+                y=peso_por_foco.index,
+                orientation='h',
+                marker_color='#667eea',
+                text=[f'{v:.0f}%' for v in peso_por_foco.values],
+                textposition='outside'
+            ))
+            fig_peso.update_layout(
+                xaxis_title="Peso Total (%)",
+                yaxis_title="",
+                height=300
+            )
+            return fig_peso
+
+        plotly_chart('peso', figura_peso, peso_por_foco)
+
+        st.markdown("---")
+
+        # Metas por Responsável
+        st.subheader("👥 Metas por Responsável")
+
+        col_resp1, col_resp2 = st.columns(2)
+
+        with col_resp1:
+            resp_counts = okr_stats.resp_counts
+
+            def figura_resp(resp_counts):
+                import plotly.express as px
+                fig_resp = px.bar(
+                    x=resp_counts.values,
+                    y=resp_counts.index,
+                    orientation='h',
+                    color=resp_counts.index,
+                    color_discrete_sequence=px.colors.qualitative.Pastel
+                )
+                fig_resp.update_layout(
+                    xaxis_title="Quantidade de Metas",
+                    yaxis_title="",
+                    showlegend=False,
+                    height=400
+                )
+                return fig_resp
+
+            plotly_chart('resp', figura_resp, resp_counts)
+
+        with col_resp2:
+            # Peso por responsável
+            dataframe(okr_stats.resp_summary, 'resp_summary')
+
+        st.markdown("---")
+
+        # Timeline de Prazos
+        st.subheader("📅 Timeline de Prazos")
+
+        df_timeline_okr = okr_stats.prazos
+
+        if not df_timeline_okr.empty:
+            def figura_timeline_okr(df_timeline_okr):
+                import plotly.express as px
+                fig_timeline_okr = px.scatter(
+                    df_timeline_okr,
+                    x='Prazo',
+                    y='Entrega',
+                    color='Status',
+                    size_max=15,
+                    color_discrete_map=CORES_STATUS_OKR
+                )
+                fig_timeline_okr.update_traces(marker=dict(size=12))
+                fig_timeline_okr.update_layout(
+                    xaxis_title="Prazo",
+                    yaxis_title="",
+                    height=500
+                )
+                return fig_timeline_okr
+
+            plotly_chart('timeline_okr', figura_timeline_okr, df_timeline_okr)
+
+        st.markdown("---")
+
+        # Progresso das metas calculado pelas tarefas do Jira vinculadas
+        # (regras em config/okr_links.json)
+        jira_key = catalogo.jira_key(incremental=st.session_state.get('jira_incremental', False))
+        if jira_key is not None:
+            st.subheader("🔗 Progresso pelo Jira")
+
+            regras_vinculo = linkage.load_link_rules()
+            dataset_jira = data_watcher.dataset(jira_key)
+            # Sem filtros e com o Jira ainda carregando, o snapshot já tem o progresso.
+            # Fora isso, a página não carrega o Jira: espera o observador aquecê-lo
+            # (o rerun vem pelo watch_updates quando ele publica)
+            visao_padrao = all(valor in ('Todos', 'Todas') for valor in filtros_okr.values())
+            if dataset_jira is not None:
+                progresso = compute_okr_progress(
+                    dataset_jira, df_okr_filtered, jira_key, okr_key, trimestre,
+                    tuple(filtros_okr.items()), regras_vinculo.fingerprint, regras_vinculo
+                )
+            elif (visao_padrao and resumo is not None
+                    and jira_key == catalogo.jira_key() and trimestre in resumo.okr_progress):
+                progresso = resumo.okr_progress[trimestre]
+            else:
+                progresso = None
+                st.info("⏳ Carregando as tarefas do Jira em segundo plano; o progresso aparece assim que terminar.")
+
+            if progresso is not None:
+                progresso_geral, cobertura = linkage.weighted_progress(progresso)
+
+                col_prog1, col_prog2, col_prog3 = st.columns(3)
+                with col_prog1:
+                    st.metric("Progresso Ponderado",
+                              f"{progresso_geral * 100:.1f}%" if progresso_geral is not None else "—")
+                with col_prog2:
+                    st.metric("Peso Coberto pelo Jira", f"{cobertura * 100:.0f}%")
+                with col_prog3:
+                    st.metric("Tarefas Vinculadas", int(progresso['Tarefas'].sum()))
+
+                dataframe(linkage.progress_table(progresso), 'progresso_jira')
+                diag.count('tarefas_vinculadas', progresso['Tarefas'].sum())
+
+            st.markdown("---")
+
+        # Detalhes das Metas por Foco
+        st.subheader("📋 Detalhes das Metas")
+
+        # Um bloco de markdown por foco, em cache pelo estado dos filtros. Só o
+        # primeiro foco abre por padrão; os demais só são enviados ao abrir
+        cartoes = build_goal_cards(df_okr_filtered, okr_key, trimestre, tuple(filtros_okr.items()))
+        abertos = 0
+        for posicao, (foco, bloco) in enumerate(cartoes.items()):
+            if foco == SEM_FOCO:
+                n_metas = int(df_okr_filtered['Foco'].isna().sum())
+            else:
+                n_metas = okr_stats.foco_counts.get(foco, 0)
+            expander = st.expander(
+                f"📌 {foco} ({n_metas} metas)",
+                expanded=posicao == 0, key=f"okr_foco_{trimestre}_{foco}", on_change="rerun"
+            )
+            if expander.open:
+                expander.markdown(bloco)
+                abertos += 1
+        diag.count('focos_renderizados', abertos)
+
+        diag.lap('detalhes_metas')
+
+        # Exportar dados
+        st.sidebar.markdown("---")
+        st.sidebar.subheader("📥 Exportar OKRs")
+
+        export_sidebar(
+            lambda: df_okr_filtered,
+            nome_arquivo=f"okrs_{trimestre.lower().replace(' ', '_')}", label="Baixar OKRs", key="export_okr"
+        )
+
+    else:
+        st.error("⚠️ Arquivo de OKRs não encontrado!")
+        st.markdown("""
+        ### Como adicionar dados de OKR:
+
+        1. Crie uma pasta `okr/` no mesmo diretório do `app.py`
+        2. Coloque o arquivo Excel com os OKRs na pasta
+        3. O arquivo deve ter uma aba de metas por trimestre ('Proposta de Metas Q1', 'Proposta de Metas Q2'...)
+        4. O dashboard carrega o arquivo automaticamente em alguns segundos
+        """)